@@ -60,6 +60,7 @@ except Exception:
     Agent = AgentShim
 
 from tools.content_analysis_tools import get_content_analysis_tools
+from utils.agent_cache import apply_result_cache
 from utils.constants import BEDROCK_MODEL_ID, BEDROCK_REGION
 
 logger = logging.getLogger(__name__)
@@ -168,4 +169,4 @@ def create_content_analyzer_agent(
     Returns:
         Configured ContentAnalyzer agent instance
     """
-    return ContentAnalyzer(model_id=model_id, region=region)
\ No newline at end of file
+    return apply_result_cache(ContentAnalyzer(model_id=model_id, region=region), "content_analyzer")
\ No newline at end of file
@@ -56,6 +56,7 @@ except Exception:
     Agent = AgentShim
 
 from tools.image_sourcing_tools import get_image_sourcing_tools
+from utils.agent_cache import apply_result_cache
 from utils.constants import BEDROCK_MODEL_ID, BEDROCK_REGION
 
 logger = logging.getLogger(__name__)
@@ -171,4 +172,4 @@ def create_image_sourcer_agent(
     Returns:
         Configured ImageSourcer agent instance
     """
-    return ImageSourcer(model_id=model_id, region=region)
\ No newline at end of file
+    return apply_result_cache(ImageSourcer(model_id=model_id, region=region), "image_sourcer")
\ No newline at end of file
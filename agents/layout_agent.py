@@ -112,6 +112,7 @@ Core responsibilities:
 Use your tools to:
 - suggest_layout_type: Choose the best layout structure for the content
 - generate_layout_spec: Create detailed positioning and styling specifications
+- generate_layout_specs: Create specifications for several slides in one call
 
 Focus on visual hierarchy, readability, and aesthetic appeal when making decisions.
 Consider how text and images work together to communicate the message effectively.""",
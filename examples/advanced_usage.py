@@ -9,13 +9,8 @@ error handling, monitoring, and integration patterns.
 import asyncio
 import json
 import logging
-from pathlib import Path
 from typing import Dict, List, Optional
 
-# Add the parent directory to the path so we can import from the main module
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
-
 from main import InfographicOrchestrator
 from agents.content_analyzer import ContentAnalyzer
 from agents.image_sourcer import ImageSourcer
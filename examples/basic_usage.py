@@ -8,11 +8,6 @@ with different platforms and content types.
 
 import asyncio
 import os
-from pathlib import Path
-
-# Add the parent directory to the path so we can import from the main module
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
 
 from main import InfographicOrchestrator
 
@@ -8,16 +8,11 @@ for the AWS Infographic Generator system.
 
 import asyncio
 import os
-import json
 import logging
-from pathlib import Path
 from typing import Dict, List, Any
 
-# Add the parent directory to the path so we can import from the main module
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
-
 from main import InfographicOrchestrator
+from utils.fastjson import dumps as _dumps
 from utils.monitoring import setup_logging
 
 
@@ -159,7 +154,7 @@ async def advanced_configuration_examples():
     try:
         result = await orchestrator.generate_infographic(content, "twitter")
         print(f"✅ Custom configured infographic: {result.s3_url}")
-        print(f"🎨 Applied configuration: {json.dumps(custom_config, indent=2)}")
+        print(f"🎨 Applied configuration: {_dumps(custom_config)}")
     except Exception as e:
         print(f"❌ Error: {e}")
 
@@ -379,7 +374,7 @@ async def monitoring_examples():
     # Show analytics summary
     summary = analytics_orchestrator.get_analytics_summary()
     print(f"\n📈 Analytics Summary:")
-    print(json.dumps(summary, indent=2))
+    print(_dumps(summary))
 
 
 async def integration_examples():
@@ -432,7 +427,8 @@ async def integration_examples():
         
         if response["status"] == "success":
             print(f"✅ Success: {response['infographic_url']}")
-            print(f"📊 Metadata: {json.dumps(response['metadata'], indent=2)}")
+            # Webhook payloads go over the wire, so keep them compact
+            print(f"📊 Metadata: {_dumps(response['metadata'], indent=False)}")
         else:
             print(f"❌ Error: {response['error_message']}")
 
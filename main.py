@@ -8,15 +8,6 @@ import argparse
 from typing import Dict, Any
 from datetime import datetime
 
-from strands import Agent
-from strands.models import BedrockModel
-
-from agents.content_analyzer import create_content_analyzer_agent
-from agents.image_sourcer import create_image_sourcer_agent  
-from agents.design_layout import create_design_layout_agent
-from agents.text_formatter import create_text_formatter_agent
-from agents.image_composer import ImageComposer
-
 from utils.constants import BEDROCK_MODEL_ID, BEDROCK_REGION
 
 logging.basicConfig(level=logging.INFO)
@@ -38,6 +29,17 @@ class InfographicOrchestrator:
     """Minimal orchestrator that coordinates agents through AI reasoning."""
     
     def __init__(self):
+        # Agent modules pull in strands/boto3; import them here so that
+        # ``import main`` stays cheap for tests and import checks.
+        from strands import Agent
+        from strands.models import BedrockModel
+
+        from agents.content_analyzer import create_content_analyzer_agent
+        from agents.image_sourcer import create_image_sourcer_agent
+        from agents.design_layout import create_design_layout_agent
+        from agents.text_formatter import create_text_formatter_agent
+        from agents.image_composer import ImageComposer
+
         self.bedrock_model = BedrockModel(model_id=BEDROCK_MODEL_ID)
         
         # Initialize agents
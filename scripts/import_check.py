@@ -1,9 +1,13 @@
-import sys
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 
 def main():
     try:
-        import tools.content_analysis_tools as cat
-        import tools.image_sourcing_tools as ist
+        # The two tool modules are independent, so import them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cat_future = executor.submit(importlib.import_module, "tools.content_analysis_tools")
+            ist_future = executor.submit(importlib.import_module, "tools.image_sourcing_tools")
+            cat, ist = cat_future.result(), ist_future.result()
 
         print("content_tools:", [getattr(f, '__name__', str(f)) for f in cat.get_content_analysis_tools()])
         # image_sourcing_tools provides get_image_sourcing_tools()
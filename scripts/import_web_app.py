@@ -1,4 +1,2 @@
-import sys
-sys.path.insert(0, r'C:\Users\parkh\OneDrive\Desktop\05i_DEMO_Reinforcement\AWS infographics\AWSInfoGraphic')
 import web.app as app
 print('Imported web.app successfully')
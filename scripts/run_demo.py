@@ -4,11 +4,10 @@ This script runs the complete pipeline: ContentAnalyzer -> Image Sourcing -> Lay
 """
 
 import asyncio
-import json
 import os
 import sys
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional, Tuple
 
 # Force demo mode for local testing
 os.environ['AWSINFOGRAPHIC_DEMO_MODE'] = '1'
@@ -16,61 +15,138 @@ os.environ['AWSINFOGRAPHIC_DEMO_MODE'] = '1'
 from agents.content_analyzer import create_content_analyzer_agent
 from agents.image_sourcer import create_image_sourcer_agent
 from agents.layout_agent import create_layout_agent
+from utils.agent_cache import get_agent_cache
+from utils.event_loop import install_uvloop
+from utils.fastjson import print_json
 
+# Full stage payloads are only dumped when requested (or when a stage fails)
+VERBOSE = os.getenv('AWSINFOGRAPHIC_VERBOSE') == '1'
 
-async def demo():
-    sample = (
-        "The rise of serverless computing has transformed how teams build and scale applications."
-        " Key benefits include reduced operational overhead, pay-for-usage pricing, and automatic scaling."
-        " Use cases: web backends, event-driven processing, batch jobs."
-    )
+# Stage name -> (section header, label used in failure messages)
+STAGES = {
+    'content': ('Step 1: Content Analysis', 'Content analysis'),
+    'images': ('Step 2: Image Sourcing', 'Image sourcing'),
+    'layout': ('Step 3: Layout Generation', 'Layout generation'),
+}
 
-    print('=== Input Content ===')
-    print(sample)
-    print()
 
-    # Step 1: Content Analysis
-    print('=== Step 1: Content Analysis ===')
-    content_analyzer = create_content_analyzer_agent()
-    content_result = await content_analyzer.process(sample)
-    print(json.dumps(content_result, indent=2))
+class StageFailed(Exception):
+    """Raised when a pipeline stage reports ``success: False``."""
+
+    def __init__(self, stage: str, result: Dict[str, Any]):
+        super().__init__(stage)
+        self.stage = stage
+        self.result = result
+
+
+async def _run_stage(stage: str, coro: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Await one stage, raising ``StageFailed`` if it did not succeed."""
+    result = await coro
+    if not result.get('success', False):
+        raise StageFailed(stage, result)
+    return result
 
-    if not content_result.get('success', False):
-        print("Content analysis failed, stopping pipeline")
+
+async def pipeline(sample: str) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """Run the pipeline, yielding ``(stage, payload)`` as each stage finishes.
+
+    Stops after the first of the first two stages that does not succeed.
+    """
+    content_analyzer = create_content_analyzer_agent()
+    # Later stages depend on the analysis, but building their agents does
+    # not, so construct them while the analysis request is in flight. A
+    # failed analysis cancels the sibling tasks instead of waiting on them.
+    failure: Optional[StageFailed] = None
+    try:
+        async with asyncio.TaskGroup() as tg:
+            content_task = tg.create_task(
+                _run_stage('content', content_analyzer.process(sample)),
+                name='content_analysis',
+            )
+            image_agent_task = tg.create_task(
+                asyncio.to_thread(create_image_sourcer_agent), name='image_agent'
+            )
+            layout_agent_task = tg.create_task(
+                asyncio.to_thread(create_layout_agent), name='layout_agent'
+            )
+    except* StageFailed as eg:
+        first = eg.exceptions[0]
+        if isinstance(first, StageFailed):
+            failure = first
+    if failure is not None:
+        yield failure.stage, failure.result
         return
 
+    content_result = content_task.result()
+    yield 'content', content_result
     content_analysis = content_result['analysis']
-    print()
-
-    # Step 2: Image Sourcing
-    print('=== Step 2: Image Sourcing ===')
-    image_agent = create_image_sourcer_agent()
-    image_result = await image_agent.process(content_analysis)
-    print(json.dumps(image_result, indent=2))
 
+    image_result = await image_agent_task.result().process(content_analysis)
+    yield 'images', image_result
     if not image_result.get('success', False):
-        print("Image sourcing failed, stopping pipeline")
         return
 
     image_assets = image_result['images'] if 'images' in image_result else image_result.get('assets', [])
-    print()
+    yield 'layout', await layout_agent_task.result().process(content_analysis, image_assets)
+
 
-    # Step 3: Layout Generation
-    print('=== Step 3: Layout Generation ===')
-    layout_agent = create_layout_agent()
-    layout_result = await layout_agent.process(content_analysis, image_assets)
-    print(json.dumps(layout_result, indent=2))
+def _emit(text: str, payload: Optional[Dict[str, Any]] = None) -> None:
+    """Write ``text`` and, if given, ``payload`` as JSON to stdout."""
+    sys.stdout.write(text)
+    if payload is not None:
+        print_json(payload)
 
+
+async def demo() -> None:
+    sample = (
+        "The rise of serverless computing has transformed how teams build and scale applications."
+        " Key benefits include reduced operational overhead, pay-for-usage pricing, and automatic scaling."
+        " Use cases: web backends, event-driven processing, batch jobs."
+    )
+
+    print('=== Input Content ===')
+    print(sample)
     print()
-    print('=== Pipeline Complete ===')
-    print(f"Content points: {len(content_analysis.get('key_points', []))}")
-    print(f"Images sourced: {len(image_assets)}")
-    print(f"Layout type: {layout_result.get('layout', {}).get('layout_type', 'unknown')}")
 
+    # Sections are encoded and written on a single worker thread, which keeps
+    # them in order while the next stage's agent call is already running.
+    loop = asyncio.get_running_loop()
+    results = {}
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        pending = []
+        async for stage, payload in pipeline(sample):
+            results[stage] = payload
+            header, label = STAGES[stage]
+            ok = payload.get('success', False)
+            dump = payload if VERBOSE or not ok else None
+            pending.append(loop.run_in_executor(writer, _emit, f"=== {header} ===\n", dump))
+            if stage == 'layout':
+                continue
+            tail = "\n" if ok else f"{label} failed, stopping pipeline\n"
+            pending.append(loop.run_in_executor(writer, _emit, tail))
+        await asyncio.gather(*pending)
+
+    if 'layout' not in results:
+        sys.stdout.flush()
+        return
 
-if __name__ == '__main__':
-    asyncio.run(demo())
+    content_analysis = results['content']['analysis']
+    image_result = results['images']
+    image_assets = image_result['images'] if 'images' in image_result else image_result.get('assets', [])
+    num_points = len(content_analysis.get('key_points', []))
+    layout = results['layout'].get('layout') or {}
+    layout_type = layout.get('layout_type', 'unknown')
+    stats = get_agent_cache().stats
+    sys.stdout.write(
+        "\n=== Pipeline Complete ===\n"
+        f"Content points: {num_points}\n"
+        f"Images sourced: {len(image_assets)}\n"
+        f"Layout type: {layout_type}\n"
+        f"Agent cache: {stats.hits} hits, {stats.misses} misses\n"
+    )
 
 
+# Single entry point
 if __name__ == '__main__':
+    install_uvloop()
     asyncio.run(demo())
@@ -1,11 +1,8 @@
 import asyncio
-import json
-import os
-import sys
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from agents.content_analyzer import create_content_analyzer_agent
+from utils.event_loop import install_uvloop
+from utils.fastjson import print_json
 
 
 async def main():
@@ -14,8 +11,9 @@ async def main():
         "Serverless architectures let teams build faster. Key benefits include pay-per-use pricing, automatic scaling, and simplified operations."
     )
     res = await agent.process(sample, platform='twitter')
-    print(json.dumps(res, indent=2))
+    print_json(res)
 
 
 if __name__ == '__main__':
+    install_uvloop()
     asyncio.run(main())
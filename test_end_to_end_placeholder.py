@@ -6,28 +6,60 @@ This test demonstrates the system can run without AWS credentials by using mock
 
 import asyncio
 import logging
-from unittest.mock import AsyncMock, patch
+import logging.handlers
+import sys
+from unittest.mock import patch
+
+import pytest
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def test_end_to_end_with_placeholders():
+# Report lines are buffered in memory and written out in one go at the
+# summary (or at the end of each pytest test) instead of one write per line.
+_report_target = logging.StreamHandler(sys.stdout)
+_report_target.setFormatter(logging.Formatter("%(message)s"))
+_report_handler = logging.handlers.MemoryHandler(
+    capacity=1024, flushLevel=logging.ERROR, target=_report_target
+)
+report = logging.getLogger(f"{__name__}.report")
+report.addHandler(_report_handler)
+report.setLevel(logging.INFO)
+report.propagate = False
+
+@pytest.fixture(autouse=True)
+def _flush_report():
+    yield
+    _report_handler.flush()
+
+# Canned agent replies, built once at import rather than per test
+ORCHESTRATOR_RESPONSE = "Placeholder response from agent - system connectivity verified"
+AGENT_RESPONSE = "Agent processed successfully - connectivity verified"
+
+# Plain coroutines avoid AsyncMock's per-call bookkeeping
+async def _fake_orchestrator_invoke(self, *args, **kwargs):
+    return ORCHESTRATOR_RESPONSE
+
+async def _fake_agent_invoke(self, *args, **kwargs):
+    return AGENT_RESPONSE
+
+@pytest.fixture(scope="session")
+def orchestrator():
+    """Orchestrator shared by every test in the session."""
+    from main import InfographicOrchestrator
+    return InfographicOrchestrator()
+
+@pytest.mark.asyncio
+async def test_end_to_end_with_placeholders(orchestrator):
     """Test end-to-end flow with mocked AWS responses."""
-    print("🚀 Testing End-to-End Flow with Placeholder Responses")
-    print("=" * 60)
+    report.info("🚀 Testing End-to-End Flow with Placeholder Responses")
+    report.info("=" * 60)
     
     try:
         # Mock the agent invoke_async method to return placeholder responses
-        mock_response = "Placeholder response from agent - system connectivity verified"
-        
-        with patch('strands.Agent.invoke_async', new_callable=AsyncMock) as mock_invoke:
-            mock_invoke.return_value = mock_response
-            
-            # Import and test main orchestrator
-            from main import InfographicOrchestrator
+        with patch('strands.Agent.invoke_async', new=_fake_orchestrator_invoke):
             
-            orchestrator = InfographicOrchestrator()
-            print("✅ Orchestrator initialized with mocked responses")
+            report.info("✅ Orchestrator initialized with mocked responses")
             
             # Test generation
             result = await orchestrator.generate_infographic(
@@ -36,95 +68,92 @@ async def test_end_to_end_with_placeholders():
             )
             
             if result.get("success"):
-                print("✅ End-to-end generation completed successfully")
-                print(f"   Result: {result.get('result', '')[:50]}...")
-                print(f"   Platform: {result.get('platform')}")
-                print(f"   Processing time: {result.get('processing_time', 0):.2f}s")
+                report.info("✅ End-to-end generation completed successfully")
+                report.info(f"   Result: {result.get('result', '')[:50]}...")
+                report.info(f"   Platform: {result.get('platform')}")
+                report.info(f"   Processing time: {result.get('processing_time', 0):.2f}s")
                 return True
             else:
-                print(f"❌ Generation failed: {result.get('error')}")
+                report.info(f"❌ Generation failed: {result.get('error')}")
                 return False
                 
     except Exception as e:
-        print(f"❌ End-to-end test failed: {str(e)}")
+        report.info(f"❌ End-to-end test failed: {str(e)}")
         return False
 
+@pytest.mark.asyncio
 async def test_individual_agents_with_placeholders():
     """Test individual agents with placeholder responses."""
-    print("\n🤖 Testing Individual Agents with Placeholder Responses")
-    print("=" * 60)
+    report.info("\n🤖 Testing Individual Agents with Placeholder Responses")
+    report.info("=" * 60)
     
     try:
-        mock_response = "Agent processed successfully - connectivity verified"
+        from agents.content_analyzer import create_content_analyzer_agent
+        from agents.image_sourcer import create_image_sourcer_agent
+        from agents.design_layout import create_design_layout_agent
+        from agents.text_formatter import create_text_formatter_agent
+        from agents.image_composer import ImageComposer
         
-        with patch('strands.Agent.invoke_async', new_callable=AsyncMock) as mock_invoke:
-            mock_invoke.return_value = mock_response
-            
-            # Test each agent individually
-            from agents.content_analyzer import create_content_analyzer_agent
-            from agents.image_sourcer import create_image_sourcer_agent
-            from agents.design_layout import create_design_layout_agent
-            from agents.text_formatter import create_text_formatter_agent
-            from agents.image_composer import ImageComposer
-            
-            # ContentAnalyzer
-            content_analyzer = create_content_analyzer_agent()
-            result = await content_analyzer.process("Test content", "general")
-            print(f"✅ ContentAnalyzer: {result.get('success', False)}")
-            
-            # ImageSourcer
-            image_sourcer = create_image_sourcer_agent()
-            result = await image_sourcer.process({"main_topic": "test"}, "general")
-            print(f"✅ ImageSourcer: {result.get('success', False)}")
-            
-            # DesignLayout
-            design_layout = create_design_layout_agent()
-            result = await design_layout.process({}, {}, "general")
-            print(f"✅ DesignLayout: {result.get('success', False)}")
-            
-            # TextFormatter
-            text_formatter = create_text_formatter_agent()
-            result = await text_formatter.process({}, "general")
-            print(f"✅ TextFormatter: {result.get('success', False)}")
-            
-            # ImageComposer
-            image_composer = ImageComposer()
-            result = await image_composer.process("test_url", {}, {}, "general")
-            print(f"✅ ImageComposer: {result.get('success', False)}")
-            
-            return True
+        content_analyzer = create_content_analyzer_agent()
+        image_sourcer = create_image_sourcer_agent()
+        design_layout = create_design_layout_agent()
+        text_formatter = create_text_formatter_agent()
+        image_composer = ImageComposer()
+        
+        # Only the agent calls need the patch in place
+        with patch('strands.Agent.invoke_async', new=_fake_agent_invoke):
+            # The agents are independent here, so process them concurrently
+            agent_names = ["ContentAnalyzer", "ImageSourcer", "DesignLayout", "TextFormatter", "ImageComposer"]
+            results = await asyncio.gather(
+                content_analyzer.process("Test content", "general"),
+                image_sourcer.process({"main_topic": "test"}, "general"),
+                design_layout.process({}, {}, "general"),
+                text_formatter.process({}, "general"),
+                image_composer.process("test_url", {}, {}, "general"),
+                return_exceptions=True,
+            )
+        
+        for name, result in zip(agent_names, results):
+            if isinstance(result, BaseException):
+                raise result
+            report.info(f"✅ {name}: {result.get('success', False)}")
+        
+        return True
             
     except Exception as e:
-        print(f"❌ Individual agent test failed: {str(e)}")
+        report.info(f"❌ Individual agent test failed: {str(e)}")
         return False
 
 async def main():
     """Run all placeholder tests."""
-    print("🎭 Puppet System End-to-End Validation with Placeholders")
-    print("=" * 70)
+    report.info("🎭 Puppet System End-to-End Validation with Placeholders")
+    report.info("=" * 70)
     
     # Test 1: End-to-end orchestration
-    test1_result = await test_end_to_end_with_placeholders()
+    from main import InfographicOrchestrator
+    test1_result = await test_end_to_end_with_placeholders(InfographicOrchestrator())
     
     # Test 2: Individual agents
     test2_result = await test_individual_agents_with_placeholders()
     
     # Summary
-    print("\n" + "=" * 70)
-    print("📊 Placeholder Test Results Summary:")
-    print("=" * 70)
+    report.info("\n" + "=" * 70)
+    report.info("📊 Placeholder Test Results Summary:")
+    report.info("=" * 70)
     
     if test1_result and test2_result:
-        print("🎉 ALL TESTS PASSED!")
-        print("✅ Puppet system is fully connected and ready for development")
-        print("✅ All agents can process requests end-to-end")
-        print("✅ System architecture is properly implemented")
-        print("\n🚀 Ready for incremental implementation of business logic!")
-        return True
+        report.info("🎉 ALL TESTS PASSED!")
+        report.info("✅ Puppet system is fully connected and ready for development")
+        report.info("✅ All agents can process requests end-to-end")
+        report.info("✅ System architecture is properly implemented")
+        report.info("\n🚀 Ready for incremental implementation of business logic!")
     else:
-        print("⚠️  Some tests failed - system needs attention")
-        return False
+        report.info("⚠️  Some tests failed - system needs attention")
+    _report_handler.flush()
+    return test1_result and test2_result
 
 if __name__ == "__main__":
+    from utils.event_loop import install_uvloop
+    install_uvloop()
     success = asyncio.run(main())
     exit(0 if success else 1)
\ No newline at end of file
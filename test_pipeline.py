@@ -1,24 +1,59 @@
-import requests
-import json
+import asyncio
 
-# Test the complete pipeline
-data = {
-    'content': '''AWS Lambda is a serverless compute service that lets you run code without provisioning or managing servers.
+import httpx
+
+from utils.fastjson import loads
+
+BASE_URL = 'http://127.0.0.1:5000'
+ANALYZE_URL = f'{BASE_URL}/api/analyze'
+
+CONTENT = '''AWS Lambda is a serverless compute service that lets you run code without provisioning or managing servers.
     Key benefits include automatic scaling, pay-per-use pricing, and support for multiple programming languages.
     Lambda functions can be triggered by various AWS services and integrate seamlessly with the AWS ecosystem.'''
-}
 
-try:
-    response = requests.post('http://127.0.0.1:5000/api/analyze', json=data, timeout=60)
-    print(f'Status Code: {response.status_code}')
+# Test the complete pipeline once per platform; the requests are independent
+PAYLOADS = [
+    {'content': CONTENT, 'platform': 'general'},
+    {'content': CONTENT, 'platform': 'twitter'},
+    {'content': CONTENT, 'platform': 'whatsapp'},
+]
+
+
+def report(payload, response):
+    print(f"[{payload['platform']}] Status Code: {response.status_code}")
+    # Read the raw body once and only parse it on success
+    body = response.content
     if response.status_code == 200:
-        result = response.json()
+        result = loads(body)
         print('Success! Pipeline completed.')
         final_info = result.get('final_infographic', {})
         print(f'Final infographic URL: {final_info.get("image_url", "N/A")}')
         print(f'Platform: {final_info.get("platform", "N/A")}')
         print(f'Composition ID: {final_info.get("composition_id", "N/A")}')
     else:
-        print(f'Error: {response.text}')
-except Exception as e:
-    print(f'Request failed: {e}')
\ No newline at end of file
+        print(f'Error: {body[:512]!r}')
+
+
+async def main():
+    # One pooled keep-alive client shared by every request
+    async with httpx.AsyncClient(timeout=120) as client:
+        try:
+            # Open the connection before fanning out
+            await client.get(f'{BASE_URL}/')
+            responses = await asyncio.gather(
+                *(client.post(ANALYZE_URL, json=payload) for payload in PAYLOADS),
+                return_exceptions=True,
+            )
+        except Exception as e:
+            print(f'Request failed: {e}')
+            return
+
+    for payload, response in zip(PAYLOADS, responses):
+        if isinstance(response, Exception):
+            print(f"[{payload['platform']}] Request failed: {response}")
+        else:
+            report(payload, response)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -10,268 +10,360 @@ This script validates all requirements for task 9:
 """
 
 import asyncio
+import atexit
+import functools
+import importlib
 import logging
-from unittest.mock import AsyncMock, patch
+import os
+import sys
+from unittest.mock import AsyncMock
+
+import strands
+
+from main import InfographicOrchestrator
+from tools.content_analysis_tools import get_content_analysis_tools
+from tools.image_composition_tools import get_image_composition_tools
+from tools.image_sourcing_tools import get_image_sourcing_tools
+from tools.layout_design_tools import get_layout_design_tools
+from tools.text_formatting_tools import get_text_formatting_tools
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Shared stand-in for agent model calls; reset_mock() it before asserting on calls
+_MOCK_INVOKE = AsyncMock(return_value="Placeholder response - system connectivity verified")
+
+@functools.cache
+def _install_mock_invoke():
+    """Swap in the mocked ``invoke_async`` once per process, restored at exit.
+    
+    Installed on first validation run rather than at import so that pytest
+    collecting this module does not mock agent calls for other tests.
+    """
+    original = strands.Agent.invoke_async
+    strands.Agent.invoke_async = _MOCK_INVOKE
+    atexit.register(setattr, strands.Agent, 'invoke_async', original)
+
+def _lazy_import(path):
+    """Return a proxy for the callable at ``path`` that imports it on first call."""
+    module_name, _, attr = path.rpartition('.')
+    
+    @functools.cache
+    def resolve():
+        return getattr(importlib.import_module(module_name), attr)
+    
+    def proxy(*args, **kwargs):
+        return resolve()(*args, **kwargs)
+    
+    return proxy
+
+# VALIDATE_FAST=1 makes a smoke run that only checks the tool modules; the
+# checks that need the real agents or orchestrator are reported as skipped
+FAST = os.getenv("VALIDATE_FAST") == "1"
+
+# Agent key -> factory, imported only when the agents are actually built
+AGENT_FACTORIES = {
+    'content_analyzer': _lazy_import('agents.content_analyzer.create_content_analyzer_agent'),
+    'image_sourcer': _lazy_import('agents.image_sourcer.create_image_sourcer_agent'),
+    'design_layout': _lazy_import('agents.design_layout.create_design_layout_agent'),
+    'text_formatter': _lazy_import('agents.text_formatter.create_text_formatter_agent'),
+    'image_composer': _lazy_import('agents.image_composer.create_image_composer_agent')
+}
+
+# Tool module name -> tool list getter, resolved once at import
+TOOL_GETTERS = (
+    ('content_analysis_tools', get_content_analysis_tools),
+    ('image_sourcing_tools', get_image_sourcing_tools),
+    ('layout_design_tools', get_layout_design_tools),
+    ('text_formatting_tools', get_text_formatting_tools),
+    ('image_composition_tools', get_image_composition_tools)
+)
+
+# Status markers; plain ASCII when output is captured rather than a terminal
+_TTY = sys.stdout.isatty()
+
+def _symbol(emoji, plain):
+    """Return ``emoji`` on a terminal and ``plain`` otherwise."""
+    return emoji if _TTY else plain
+
+_TICK = _symbol("✅", "[OK]")
+_CROSS = _symbol("❌", "[FAIL]")
+_SKIP = _symbol("⏭️", "[SKIP]")
+_WARN = _symbol("⚠️ ", "[WARN]")
+_TASK = _symbol("📋", "*")
+_START = _symbol("🚀", ">>")
+_REPORT = _symbol("📊", ">>")
+_DONE = _symbol("🎉", "[DONE]")
+
+# Summary status per check outcome; None means skipped in fast mode
+_STATUS = {True: f"{_TICK} PASS", False: f"{_CROSS} FAIL", None: f"{_SKIP} SKIPPED"}
+
+# Summary labels, in the order the checks run
+REQUIREMENT_NAMES = (
+    "Agent initialization with tools",
+    "Basic orchestration flow",
+    "Agent-tool connectivity",
+    "End-to-end with placeholders"
+)
+
 class Task9Validator:
     """Validates all requirements for Task 9: Test puppet system connectivity."""
     
     def __init__(self):
         self.results = {}
+        self._agents = None
+        self._orchestrator = None
+    
+    @property
+    def agents(self):
+        """The five agents, built on first use and shared by every test."""
+        if self._agents is None:
+            self._agents = {
+                name: factory()
+                for name, factory in AGENT_FACTORIES.items()
+            }
+        return self._agents
+    
+    @property
+    def orchestrator(self):
+        """The main orchestrator, built on first use and shared by every test."""
+        if self._orchestrator is None:
+            self._orchestrator = InfographicOrchestrator()
+        return self._orchestrator
+    
+    def _warmup(self):
+        """Construct the shared agents and orchestrator ahead of the checks."""
+        if FAST:
+            return
+        try:
+            self.agents
+            self.orchestrator
+        except Exception as e:
+            # Left for the checks to report as a failed requirement
+            logger.warning(f"Agent warmup failed: {str(e)}")
+    
+    def _skip(self, key, log):
+        """Record a check that needs the real agents as skipped; returns None."""
+        log.append(f"{_SKIP} REQUIREMENT SKIPPED: needs the real agents (VALIDATE_FAST=1)")
+        self.results[key] = None
+        sys.stdout.write("\n".join(log) + "\n")
     
     def test_agent_initialization_with_tools(self):
         """Requirement: Verify all agents can be initialized with their tools."""
-        print("\n📋 Task 9.1: Verifying agent initialization with tools")
-        print("-" * 50)
+        log = [f"\n{_TASK} Task 9.1: Verifying agent initialization with tools", "-" * 50]
+        if FAST:
+            return self._skip('agent_initialization', log)
         
         try:
             # Test all 5 agents can be initialized
-            from agents.content_analyzer import create_content_analyzer_agent
-            from agents.image_sourcer import create_image_sourcer_agent
-            from agents.design_layout import create_design_layout_agent
-            from agents.text_formatter import create_text_formatter_agent
-            from agents.image_composer import ImageComposer
-            
-            agents = {}
-            
-            # ContentAnalyzer
-            agents['content_analyzer'] = create_content_analyzer_agent()
-            print("✅ ContentAnalyzer initialized with tools")
-            
-            # ImageSourcer
-            agents['image_sourcer'] = create_image_sourcer_agent()
-            print("✅ ImageSourcer initialized with tools")
-            
-            # DesignLayout
-            agents['design_layout'] = create_design_layout_agent()
-            print("✅ DesignLayout initialized with tools")
-            
-            # TextFormatter
-            agents['text_formatter'] = create_text_formatter_agent()
-            print("✅ TextFormatter initialized with tools")
-            
-            # ImageComposer
-            agents['image_composer'] = ImageComposer()
-            print("✅ ImageComposer initialized with tools")
+            agents = self.agents
+            log.append(f"{_TICK} ContentAnalyzer initialized with tools")
+            log.append(f"{_TICK} ImageSourcer initialized with tools")
+            log.append(f"{_TICK} DesignLayout initialized with tools")
+            log.append(f"{_TICK} TextFormatter initialized with tools")
+            log.append(f"{_TICK} ImageComposer initialized with tools")
             
             # Verify each agent has tools
             for name, agent in agents.items():
-                if hasattr(agent, 'agent') and hasattr(agent.agent, 'tools'):
+                try:
                     tool_count = len(agent.agent.tools)
-                    print(f"   {name}: {tool_count} tools connected")
+                except AttributeError:
+                    log.append(f"   {name}: Tools connection verified")
                 else:
-                    print(f"   {name}: Tools connection verified")
+                    log.append(f"   {name}: {tool_count} tools connected")
             
             self.results['agent_initialization'] = True
-            print("✅ REQUIREMENT MET: All agents initialized with tools")
+            log.append(f"{_TICK} REQUIREMENT MET: All agents initialized with tools")
             return True
             
         except Exception as e:
-            print(f"❌ REQUIREMENT FAILED: {str(e)}")
+            log.append(f"{_CROSS} REQUIREMENT FAILED: {str(e)}")
             self.results['agent_initialization'] = False
             return False
+        finally:
+            sys.stdout.write("\n".join(log) + "\n")
     
     async def test_basic_orchestration_flow(self):
         """Requirement: Test basic orchestration flow without full implementations."""
-        print("\n📋 Task 9.2: Testing basic orchestration flow")
-        print("-" * 50)
+        log = [f"\n{_TASK} Task 9.2: Testing basic orchestration flow", "-" * 50]
+        if FAST:
+            return self._skip('orchestration_flow', log)
         
         try:
             # Test main orchestrator initialization
-            from main import InfographicOrchestrator
-            
-            orchestrator = InfographicOrchestrator()
-            print("✅ Main orchestrator initialized")
+            orchestrator = self.orchestrator
+            log.append(f"{_TICK} Main orchestrator initialized")
             
-            # Test orchestration with mock to avoid AWS dependency
-            mock_response = "Orchestration flow completed successfully"
+            # Agent calls are mocked by run_all_validations to avoid AWS dependency
+            result = await orchestrator.generate_infographic(
+                "Test content for orchestration flow", 
+                "general"
+            )
             
-            with patch('strands.Agent.invoke_async', new_callable=AsyncMock) as mock_invoke:
-                mock_invoke.return_value = mock_response
+            # A successful orchestrator result always carries these keys
+            ok = result.get("success", False)
+            if ok:
+                log.append(f"{_TICK} Basic orchestration flow completed")
+                log.append(f"   Platform: {result['platform']}")
+                log.append(f"   Processing time: {result['processing_time']:.3f}s")
+                self.results['orchestration_flow'] = True
+                log.append(f"{_TICK} REQUIREMENT MET: Basic orchestration flow works")
+                return True
+            else:
+                log.append(f"{_CROSS} Orchestration failed: {result.get('error')}")
+                self.results['orchestration_flow'] = False
+                return False
                 
-                result = await orchestrator.generate_infographic(
-                    "Test content for orchestration flow", 
-                    "general"
-                )
-                
-                if result.get("success"):
-                    print("✅ Basic orchestration flow completed")
-                    print(f"   Platform: {result.get('platform')}")
-                    print(f"   Processing time: {result.get('processing_time', 0):.3f}s")
-                    self.results['orchestration_flow'] = True
-                    print("✅ REQUIREMENT MET: Basic orchestration flow works")
-                    return True
-                else:
-                    print(f"❌ Orchestration failed: {result.get('error')}")
-                    self.results['orchestration_flow'] = False
-                    return False
-                    
         except Exception as e:
-            print(f"❌ REQUIREMENT FAILED: {str(e)}")
+            log.append(f"{_CROSS} REQUIREMENT FAILED: {str(e)}")
             self.results['orchestration_flow'] = False
             return False
+        finally:
+            sys.stdout.write("\n".join(log) + "\n")
     
     def test_agent_tool_connectivity(self):
         """Requirement: Ensure proper agent-tool connectivity."""
-        print("\n📋 Task 9.3: Testing agent-tool connectivity")
-        print("-" * 50)
+        log = [f"\n{_TASK} Task 9.3: Testing agent-tool connectivity", "-" * 50]
         
         try:
-            # Test that all tool modules can be imported and return tools
-            tool_modules = [
-                ('content_analysis_tools', 'get_content_analysis_tools'),
-                ('image_sourcing_tools', 'get_image_sourcing_tools'),
-                ('layout_design_tools', 'get_layout_design_tools'),
-                ('text_formatting_tools', 'get_text_formatting_tools'),
-                ('image_composition_tools', 'get_image_composition_tools')
-            ]
-            
+            # Test that all tool modules return tools
             total_tools = 0
-            for module_name, function_name in tool_modules:
-                module = __import__(f'tools.{module_name}', fromlist=[function_name])
-                get_tools_func = getattr(module, function_name)
+            for module_name, get_tools_func in TOOL_GETTERS:
                 tools = get_tools_func()
                 tool_count = len(tools)
                 total_tools += tool_count
-                print(f"✅ {module_name}: {tool_count} tools available")
+                log.append(f"{_TICK} {module_name}: {tool_count} tools available")
             
-            print(f"✅ Total tools available: {total_tools}")
+            log.append(f"{_TICK} Total tools available: {total_tools}")
+            if FAST:
+                # The finally clause below writes the log
+                log.append(f"{_SKIP} REQUIREMENT SKIPPED: agent connectivity needs the real agents (VALIDATE_FAST=1)")
+                self.results['tool_connectivity'] = None
+                return None
             
             # Verify agents can access their tools
-            from agents.content_analyzer import create_content_analyzer_agent
-            agent = create_content_analyzer_agent()
+            agent = self.agents['content_analyzer']
             
             if hasattr(agent, 'agent') and hasattr(agent.agent, 'tools'):
-                print("✅ Agent-tool connectivity verified")
+                log.append(f"{_TICK} Agent-tool connectivity verified")
             
             self.results['tool_connectivity'] = True
-            print("✅ REQUIREMENT MET: Proper agent-tool connectivity")
+            log.append(f"{_TICK} REQUIREMENT MET: Proper agent-tool connectivity")
             return True
             
         except Exception as e:
-            print(f"❌ REQUIREMENT FAILED: {str(e)}")
+            log.append(f"{_CROSS} REQUIREMENT FAILED: {str(e)}")
             self.results['tool_connectivity'] = False
             return False
+        finally:
+            sys.stdout.write("\n".join(log) + "\n")
     
     async def test_end_to_end_with_placeholders(self):
         """Requirement: Validate system can run end-to-end with placeholder responses."""
-        print("\n📋 Task 9.4: Testing end-to-end with placeholder responses")
-        print("-" * 50)
+        log = [f"\n{_TASK} Task 9.4: Testing end-to-end with placeholder responses", "-" * 50]
+        if FAST:
+            return self._skip('end_to_end_placeholders', log)
         
         try:
-            # Mock all agent responses to simulate full system flow
-            mock_response = "Placeholder response - system connectivity verified"
+            # Agent responses are mocked by run_all_validations to simulate full system flow
             
-            with patch('strands.Agent.invoke_async', new_callable=AsyncMock) as mock_invoke:
-                mock_invoke.return_value = mock_response
-                
-                # Test individual agents
-                from agents.content_analyzer import create_content_analyzer_agent
-                from agents.image_sourcer import create_image_sourcer_agent
-                from agents.design_layout import create_design_layout_agent
-                from agents.text_formatter import create_text_formatter_agent
-                from agents.image_composer import ImageComposer
-                
-                agents = {
-                    'ContentAnalyzer': create_content_analyzer_agent(),
-                    'ImageSourcer': create_image_sourcer_agent(),
-                    'DesignLayout': create_design_layout_agent(),
-                    'TextFormatter': create_text_formatter_agent(),
-                    'ImageComposer': ImageComposer()
-                }
-                
-                # Test each agent can process with placeholders
-                test_data = {
-                    'ContentAnalyzer': ("Test content", "general"),
-                    'ImageSourcer': ({"main_topic": "test"}, "general"),
-                    'DesignLayout': ({}, {}, "general"),
-                    'TextFormatter': ({}, "general"),
-                    'ImageComposer': ("test_url", {}, {}, "general")
-                }
-                
-                all_passed = True
-                for agent_name, agent in agents.items():
-                    try:
-                        args = test_data[agent_name]
-                        result = await agent.process(*args)
-                        success = result.get('success', False)
-                        print(f"✅ {agent_name}: {'PASS' if success else 'FAIL'}")
-                        if not success:
-                            all_passed = False
-                    except Exception as e:
-                        print(f"❌ {agent_name}: ERROR - {str(e)}")
-                        all_passed = False
-                
-                # Test full orchestration
-                from main import InfographicOrchestrator
-                orchestrator = InfographicOrchestrator()
-                
-                result = await orchestrator.generate_infographic(
-                    "End-to-end test with placeholders",
-                    "general"
-                )
+            # Test each agent can process with placeholders: (name, agent, args)
+            agents = self.agents
+            plan = [
+                ('ContentAnalyzer', agents['content_analyzer'], ("Test content", "general")),
+                ('ImageSourcer', agents['image_sourcer'], ({"main_topic": "test"}, "general")),
+                ('DesignLayout', agents['design_layout'], ({}, {}, "general")),
+                ('TextFormatter', agents['text_formatter'], ({}, "general")),
+                ('ImageComposer', agents['image_composer'], ("test_url", {}, {}, "general"))
+            ]
+            
+            # The agents are independent, so process them concurrently
+            results = await asyncio.gather(
+                *(agent.process(*args) for _, agent, args in plan),
+                return_exceptions=True
+            )
+            
+            all_passed = True
+            for (agent_name, _, _), result in zip(plan, results):
+                if isinstance(result, Exception):
+                    log.append(f"{_CROSS} {agent_name}: ERROR - {str(result)}")
+                    all_passed = False
+                    continue
+                success = result.get('success', False)
+                log.append(f"{_TICK} {agent_name}: {'PASS' if success else 'FAIL'}")
+                if not success:
+                    all_passed = False
+            
+            # Test full orchestration
+            result = await self.orchestrator.generate_infographic(
+                "End-to-end test with placeholders",
+                "general"
+            )
+            
+            if result.get("success") and all_passed:
+                log.append(f"{_TICK} End-to-end flow with placeholders completed")
+                self.results['end_to_end_placeholders'] = True
+                log.append(f"{_TICK} REQUIREMENT MET: System runs end-to-end with placeholders")
+                return True
+            else:
+                log.append(f"{_CROSS} End-to-end flow failed")
+                self.results['end_to_end_placeholders'] = False
+                return False
                 
-                if result.get("success") and all_passed:
-                    print("✅ End-to-end flow with placeholders completed")
-                    self.results['end_to_end_placeholders'] = True
-                    print("✅ REQUIREMENT MET: System runs end-to-end with placeholders")
-                    return True
-                else:
-                    print("❌ End-to-end flow failed")
-                    self.results['end_to_end_placeholders'] = False
-                    return False
-                    
         except Exception as e:
-            print(f"❌ REQUIREMENT FAILED: {str(e)}")
+            log.append(f"{_CROSS} REQUIREMENT FAILED: {str(e)}")
             self.results['end_to_end_placeholders'] = False
             return False
+        finally:
+            sys.stdout.write("\n".join(log) + "\n")
     
     async def run_all_validations(self):
         """Run all Task 9 validations."""
-        print("🚀 TASK 9 VALIDATION: Test Puppet System Connectivity")
+        print(f"{_START} TASK 9 VALIDATION: Test Puppet System Connectivity")
         print("=" * 70)
         print("Requirements: 3.3, 3.4, 4.4")
         print("=" * 70)
         
-        # Run all tests
-        test1 = self.test_agent_initialization_with_tools()
-        test2 = await self.test_basic_orchestration_flow()
-        test3 = self.test_agent_tool_connectivity()
-        test4 = await self.test_end_to_end_with_placeholders()
-        
-        # Summary
-        print("\n" + "=" * 70)
-        print("📊 TASK 9 VALIDATION RESULTS")
-        print("=" * 70)
-        
-        requirements = [
-            ("Agent initialization with tools", test1),
-            ("Basic orchestration flow", test2),
-            ("Agent-tool connectivity", test3),
-            ("End-to-end with placeholders", test4)
-        ]
+        # Run all tests against the mocked agent calls to avoid AWS dependency
+        _install_mock_invoke()
         
-        passed = 0
-        for req_name, result in requirements:
-            status = "✅ PASS" if result else "❌ FAIL"
-            print(f"{req_name}: {status}")
-            if result:
-                passed += 1
+        # Build the shared agents once up front so the concurrent checks
+        # below don't race to construct them from two threads
+        await asyncio.to_thread(self._warmup)
         
-        print(f"\nTask 9 Results: {passed}/4 requirements met")
+        # The checks share no results, so run the sync ones in worker
+        # threads alongside the async ones. Each check reports its own
+        # failures; anything that escapes one cancels the rest.
+        async with asyncio.TaskGroup() as tg:
+            t1 = tg.create_task(asyncio.to_thread(self.test_agent_initialization_with_tools), name='agent_initialization')
+            t2 = tg.create_task(self.test_basic_orchestration_flow(), name='orchestration_flow')
+            t3 = tg.create_task(asyncio.to_thread(self.test_agent_tool_connectivity), name='tool_connectivity')
+            t4 = tg.create_task(self.test_end_to_end_with_placeholders(), name='end_to_end_placeholders')
         
-        if passed == 4:
-            print("\n🎉 TASK 9 COMPLETED SUCCESSFULLY!")
-            print("✅ All puppet system connectivity requirements validated")
-            print("✅ System is ready for incremental development")
-            print("✅ Requirements 3.3, 3.4, 4.4 satisfied")
-            return True
+        # Summary, written in one go
+        outcomes = (t1.result(), t2.result(), t3.result(), t4.result())
+        passed = sum(1 for result in outcomes if result)
+        skipped = sum(1 for result in outcomes if result is None)
+        if skipped and passed + skipped == len(outcomes):
+            verdict = f"\n{_SKIP} TASK 9 SMOKE RUN PASSED - {skipped} requirement(s) skipped (VALIDATE_FAST=1)"
+        elif passed == len(outcomes):
+            verdict = (
+                f"\n{_DONE} TASK 9 COMPLETED SUCCESSFULLY!\n"
+                f"{_TICK} All puppet system connectivity requirements validated\n"
+                f"{_TICK} System is ready for incremental development\n"
+                f"{_TICK} Requirements 3.3, 3.4, 4.4 satisfied"
+            )
         else:
-            print("\n⚠️  TASK 9 INCOMPLETE - Some requirements not met")
-            return False
+            verdict = f"\n{_WARN} TASK 9 INCOMPLETE - Some requirements not met"
+        print("\n".join((
+            "\n" + "=" * 70,
+            f"{_REPORT} TASK 9 VALIDATION RESULTS",
+            "=" * 70,
+            *(f"{name}: {_STATUS[result]}" for name, result in zip(REQUIREMENT_NAMES, outcomes)),
+            f"\nTask 9 Results: {passed}/{len(outcomes)} requirements met",
+            verdict
+        )))
+        return passed + skipped == len(outcomes)
 
 async def main():
     """Run Task 9 validation."""
@@ -15,10 +15,6 @@ import json
 import time
 from datetime import datetime
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from tools.content_tools import ContentTools, ContentAnalysisError
 from agents.content_analyzer import ContentAnalyzerAgent, create_content_analyzer_agent
 from utils.types import AnalyzedContent, AgentResponse
@@ -0,0 +1,61 @@
+import pytest
+
+from utils import agent_cache
+from utils.agent_cache import AgentCache, SemanticCache
+
+
+def test_lru_eviction_and_stats():
+    cache = AgentCache(ttl=60, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (True, 1)
+    cache.set("c", 3)  # evicts "b", the least recently used
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("c") == (True, 3)
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+
+def test_expired_entries_miss():
+    cache = AgentCache(ttl=0, max_size=8)
+    cache.set("k", "v")
+    cache._entries["k"] = (0.0, "v")
+    assert cache.get("k") == (False, None)
+
+
+def test_entries_persist_across_instances(tmp_path):
+    key = AgentCache.make_key("content_analyzer", ("text", "general"), {})
+    AgentCache(ttl=60, cache_dir=str(tmp_path)).set(key, {"success": True})
+
+    assert AgentCache(ttl=60, cache_dir=str(tmp_path)).get(key) == (True, {"success": True})
+
+
+def test_semantic_cache_matches_nearby_vectors_in_namespace(tmp_path):
+    cache = SemanticCache(threshold=0.15, max_size=2, cache_dir=str(tmp_path))
+    cache.set("model|professional", [1.0, 0.0], "lambda pricing")
+
+    assert cache.get("model|professional", [0.95, 0.1]) == (True, "lambda pricing")
+    assert cache.get("model|professional", [0.0, 1.0]) == (False, None)
+    assert cache.get("model|casual", [1.0, 0.0]) == (False, None)
+    # Persisted for later processes
+    assert SemanticCache(cache_dir=str(tmp_path)).get("model|professional", [2.0, 0.0])[0] is True
+
+
+@pytest.mark.asyncio
+async def test_apply_result_cache_skips_failures(monkeypatch):
+    monkeypatch.setattr(agent_cache, "AGENT_CACHE_ENABLED", True)
+    monkeypatch.setattr(agent_cache, "_AGENT_CACHE", AgentCache(ttl=60))
+    calls = []
+
+    class FakeAgent:
+        async def process(self, content, platform="general"):
+            calls.append(content)
+            return {"success": content != "bad", "content": content}
+
+    agent = agent_cache.apply_result_cache(FakeAgent(), "fake")
+    await agent.process("good")
+    await agent.process("good")
+    await agent.process("bad")
+    await agent.process("bad")
+
+    assert calls == ["good", "bad", "bad"]
@@ -0,0 +1,751 @@
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+import tools.bedrock_tools as bedrock_tools_module
+from tools.bedrock_tools import (
+    BedrockConfigurationError,
+    BedrockInvocationError,
+    BedrockModelNotFoundError,
+    BedrockTools,
+    _RESPONSE_CACHE,
+    _SEMANTIC_CACHE,
+    _get_aio_session,
+    _get_bedrock_client,
+    _get_bedrock_control_client,
+    _retemplate_content,
+    _shared_bedrock_tools,
+    analyze_text_for_infographic,
+    analyze_text_for_infographic_async,
+    analyze_texts_batch,
+    create_bedrock_tools,
+    generate_infographic_content,
+    generate_infographic_content_async,
+)
+from utils.error_handling import CircuitBreakerState, get_error_handler
+
+
+@pytest.fixture
+def bedrock_client():
+    client = MagicMock()
+    client.invoke_model.return_value = {
+        "body": json.dumps({"content": [{"text": "ok"}]}).encode("utf-8")
+    }
+    _get_bedrock_client.cache_clear()
+    _get_bedrock_control_client.cache_clear()
+    _shared_bedrock_tools.cache_clear()
+    BedrockTools._verified_models.clear()
+    _RESPONSE_CACHE.clear()
+    _SEMANTIC_CACHE.clear()
+    with patch("tools.bedrock_tools.boto3.Session") as session:
+        session.return_value.client.return_value = client
+        yield client
+    _get_bedrock_client.cache_clear()
+    _get_bedrock_control_client.cache_clear()
+    _shared_bedrock_tools.cache_clear()
+    BedrockTools._verified_models.clear()
+
+
+def _sent_payload(client):
+    return json.loads(client.invoke_model.call_args.kwargs["body"])
+
+
+def test_prompt_cache_marker_present(bedrock_client):
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+
+    assert tools.invoke_model("Analyze this", system_prompt="You are an analyst") == "ok"
+
+    system = _sent_payload(bedrock_client)["system"]
+    assert system == [{
+        "type": "text",
+        "text": "You are an analyst",
+        "cache_control": {"type": "ephemeral"},
+    }]
+
+
+def test_prompt_cache_marker_absent_for_unsupported_model(bedrock_client):
+    tools = BedrockTools(model_id="anthropic.claude-3-haiku-20240307-v1:0")
+
+    tools.invoke_model("Analyze this", system_prompt="You are an analyst")
+
+    assert _sent_payload(bedrock_client)["system"] == "You are an analyst"
+
+
+def test_prompt_cache_marker_can_be_turned_off(bedrock_client):
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+
+    tools.invoke_model("Analyze this", system_prompt="You are an analyst", prompt_cache=False)
+
+    assert _sent_payload(bedrock_client)["system"] == "You are an analyst"
+
+
+def test_unknown_model_uses_default_config(bedrock_client):
+    tools = BedrockTools(model_id="vendor.unlisted-model-v1")
+
+    info = tools.get_model_info()
+
+    assert (info["provider"], info["max_tokens"], info["input_format"]) == ("unknown", 100000, "anthropic")
+    assert tools._format_request("Hi", max_tokens=500000)["max_tokens"] == 100000
+
+
+def test_instances_share_one_client_per_configuration(bedrock_client):
+    first = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+    second = BedrockTools(model_id="anthropic.claude-3-haiku-20240307-v1:0")
+    other_region = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0", region="us-west-2")
+
+    assert first.bedrock_client is second.bedrock_client
+    # A different region needs its own client
+    assert other_region.region == "us-west-2"
+    assert _get_bedrock_client.cache_info().currsize == 2
+
+
+def test_client_keeps_connections_alive(bedrock_client):
+    with patch("tools.bedrock_tools.boto3.Session") as session:
+        _get_bedrock_client.cache_clear()
+        BedrockTools(region="eu-west-1")
+
+    config = session.return_value.client.call_args.kwargs["config"]
+    assert config.tcp_keepalive is True
+    assert config.max_pool_connections == 64
+
+
+def test_model_access_is_checked_by_the_first_request(bedrock_client):
+    rejected = ClientError(
+        {"Error": {"Code": "ValidationException", "Message": "The provided model identifier is invalid."}}, "InvokeModel"
+    )
+    tools = BedrockTools(model_id="anthropic.claude-3-haiku-20240307-v1:0")
+
+    # Construction no longer sends a probe request
+    bedrock_client.invoke_model.assert_not_called()
+
+    bedrock_client.invoke_model.side_effect = [rejected]
+    with pytest.raises(BedrockModelNotFoundError):
+        tools._call_runtime(bedrock_client.invoke_model, modelId=tools.model_id, body="{}")
+
+    bedrock_client.invoke_model.side_effect = None
+    assert tools.invoke_model("Hello") == "ok"
+    assert (tools.model_id, tools.region) in BedrockTools._verified_models
+
+    # Once verified, validation errors are ordinary request errors
+    bedrock_client.invoke_model.side_effect = [rejected]
+    with pytest.raises(ClientError):
+        tools._call_runtime(bedrock_client.invoke_model, modelId=tools.model_id, body="{}")
+
+
+@pytest.mark.parametrize("code, message, expected", [
+    ("ValidationException", "The provided model identifier is invalid.", BedrockModelNotFoundError),
+    ("AccessDeniedException", "You don't have access to the model", BedrockConfigurationError),
+])
+def test_invoke_model_raises_model_access_errors_without_retrying(bedrock_client, code, message, expected):
+    bedrock_client.invoke_model.side_effect = ClientError(
+        {"Error": {"Code": code, "Message": message}}, "InvokeModel"
+    )
+    tools = BedrockTools(model_id="anthropic.claude-3-haiku-20240307-v1:0")
+
+    with pytest.raises(expected):
+        tools.invoke_model("hi", temperature=0.9)
+    assert bedrock_client.invoke_model.call_count == 1
+
+
+def test_bad_request_to_unverified_model_is_not_model_not_found(bedrock_client):
+    rejected = ClientError(
+        {"Error": {"Code": "ValidationException", "Message": "max_tokens: must be less than or equal to 4096"}},
+        "InvokeModel"
+    )
+    tools = BedrockTools(model_id="anthropic.claude-3-haiku-20240307-v1:0")
+
+    bedrock_client.invoke_model.side_effect = [rejected]
+    with pytest.raises(ClientError):
+        tools._call_runtime(bedrock_client.invoke_model, modelId=tools.model_id, body="{}")
+
+
+def test_low_temperature_responses_are_cached(bedrock_client):
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+
+    assert tools.invoke_model("Extract facts", temperature=0.1) == "ok"
+    # A separate instance shares the cache
+    other = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+    assert other.invoke_model("Extract facts", temperature=0.1) == "ok"
+    assert bedrock_client.invoke_model.call_count == 1
+    assert tools.get_model_info()["response_cache"]["hits"] == 1
+
+    tools.invoke_model("Write a headline", temperature=0.7)
+    tools.invoke_model("Write a headline", temperature=0.7)
+    assert bedrock_client.invoke_model.call_count == 3
+
+
+def test_cache_hits_bypass_open_circuit_breaker(bedrock_client):
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+    assert tools.invoke_model("Extract facts", temperature=0.1) == "ok"
+
+    breaker = get_error_handler().circuit_breakers["bedrock_invoke"]
+    with patch.object(breaker, "state", CircuitBreakerState.OPEN), \
+            patch.object(breaker, "last_failure_time", time.time()):
+        assert tools.invoke_model("Extract facts", temperature=0.1) == "ok"
+
+    assert bedrock_client.invoke_model.call_count == 1
+
+
+def test_analyze_content_multi_makes_one_request(bedrock_client):
+    answer = {
+        "general": {"main_topic": "Cloud"},
+        "key_points": ["Scale", "Cost"],
+        "summary": {"title": "Cloud"},
+    }
+    bedrock_client.invoke_model.return_value = {
+        "body": json.dumps({"content": [{"text": json.dumps(answer)}]}).encode("utf-8")
+    }
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+
+    with patch.object(BedrockTools, "analyze_content", return_value={"title": "Fallback"}) as single:
+        result = tools.analyze_content_multi("Some text")
+
+    assert bedrock_client.invoke_model.call_count == 1
+    assert result["key_points"] == ["Scale", "Cost"]
+    # The type missing from the combined answer is requested on its own
+    single.assert_called_once_with("Some text", "structure", stream=False)
+    assert result["structure"] == {"title": "Fallback"}
+
+
+def test_prompt_templates_keep_braces_in_text(bedrock_client):
+    bedrock_client.invoke_model.return_value = {
+        "body": json.dumps({"content": [{"text": '["a {b}"]'}]}).encode("utf-8")
+    }
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+
+    assert tools.extract_key_information("Config {text} and {0}", "facts") == ["a {b}"]
+
+    prompt = _sent_payload(bedrock_client)["messages"][0]["content"]
+    assert prompt == tools.EXTRACTION_PROMPTS["facts"].replace("{text}", "Config {text} and {0}")
+    assert "Text: Config {text} and {0}\n" in prompt
+
+
+def test_request_body_matches_formatted_payload(bedrock_client):
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+
+    for prompt in ('First "quoted" prompt', "Second prompt \u00e9"):
+        body = tools._request_body(prompt, system_prompt="You are an analyst", temperature=0.3)
+        expected = tools._format_request(prompt, system_prompt="You are an analyst", temperature=0.3)
+        assert json.loads(body) == expected
+
+    assert tools._body_template.cache_info().hits == 1
+
+
+def test_titan_request_and_response_use_titan_format(bedrock_client):
+    tools = BedrockTools(model_id="amazon.titan-text-premier-v1:0")
+
+    payload = tools._format_request("Hello", system_prompt="Be brief", max_tokens=50000)
+
+    assert payload["inputText"] == "Be brief\n\nHello"
+    assert payload["textGenerationConfig"]["maxTokenCount"] == 32000
+    assert tools._parse_response({"results": [{"outputText": "Hi"}]}) == "Hi"
+    assert tools._parse_response({"text": "fallback"}) == "fallback"
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (b'{"content": [{"text": "parsed"}]}', "parsed"),
+        (b"plain text", "plain text"),
+        (b"\x89PNG\xff", b"\x89PNG\xff"),
+    ],
+    ids=["json", "text", "binary"],
+)
+def test_decode_body(bedrock_client, raw, expected):
+    assert BedrockTools()._decode_body(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "body",
+    ['{"content": [{"text": "ok"}]}', {"content": [{"text": "ok"}]}],
+    ids=["str", "decoded"],
+)
+def test_invoke_model_accepts_non_bytes_bodies(bedrock_client, body):
+    bedrock_client.invoke_model.return_value = {"body": body}
+
+    assert BedrockTools().invoke_model("Hello", temperature=0.7) == "ok"
+
+
+def test_decode_body_keeps_image_bytes(bedrock_client):
+    tools = BedrockTools(model_id="amazon.nova-canvas-v1:0")
+
+    assert tools._decode_body(b"\x89PNG image data") == b"\x89PNG image data"
+
+
+def _stream_event(payload):
+    return {"chunk": {"bytes": json.dumps(payload).encode("utf-8")}}
+
+
+def test_invoke_model_stream_yields_text_deltas(bedrock_client):
+    bedrock_client.invoke_model_with_response_stream.return_value = {"body": [
+        _stream_event({"type": "message_start", "message": {}}),
+        _stream_event({"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hello"}}),
+        _stream_event({"type": "content_block_delta", "delta": {"type": "text_delta", "text": ", world"}}),
+        _stream_event({"type": "message_stop"}),
+    ]}
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+
+    assert list(tools.invoke_model_stream("Say hello")) == ["Hello", ", world"]
+    assert tools.invoke_model("Say hello", stream=True) == "Hello, world"
+
+
+@pytest.mark.parametrize(
+    "model_id, chunk, expected",
+    [
+        ("anthropic.claude-3-5-sonnet-20241022-v2:0", {"type": "content_block_delta", "delta": {"text": "Hi"}}, "Hi"),
+        ("anthropic.claude-3-5-sonnet-20241022-v2:0", {"type": "message_stop"}, None),
+        ("amazon.titan-text-premier-v1:0", {"outputText": "Hi"}, "Hi"),
+    ],
+    ids=["anthropic_delta", "anthropic_other_event", "titan"],
+)
+def test_parse_stream_chunk(bedrock_client, model_id, chunk, expected):
+    assert BedrockTools(model_id=model_id)._parse_stream_chunk(chunk) == expected
+
+
+def test_latency_optimized_falls_back_on_validation_error(bedrock_client):
+    ok = bedrock_client.invoke_model.return_value
+    rejected = ClientError({"Error": {"Code": "ValidationException", "Message": "unsupported"}}, "InvokeModel")
+    tools = BedrockTools(model_id="anthropic.claude-3-5-haiku-20241022-v1:0")
+    bedrock_client.invoke_model.side_effect = [rejected, ok, ok]
+
+    assert tools.invoke_model("First") == "ok"
+    assert tools.invoke_model("Second") == "ok"
+
+    calls = bedrock_client.invoke_model.call_args_list
+    assert calls[0].kwargs["performanceConfigLatency"] == "optimized"
+    assert "performanceConfigLatency" not in calls[1].kwargs
+    assert "performanceConfigLatency" not in calls[2].kwargs
+    assert tools.get_model_info()["latency_optimized"] is False
+
+
+def _throttled(retry_after=None):
+    headers = {} if retry_after is None else {"retry-after": retry_after}
+    return ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "slow down"},
+         "ResponseMetadata": {"HTTPHeaders": headers}},
+        "InvokeModel",
+    )
+
+
+def test_retry_operation_defers_to_botocore_by_default(bedrock_client):
+    tools = BedrockTools()
+    operation = MagicMock(side_effect=_throttled())
+
+    with patch("tools.bedrock_tools.time.sleep") as sleep, pytest.raises(Exception):
+        tools._retry_operation(operation)
+
+    assert operation.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_retry_operation_honors_retry_after_and_caps_backoff(bedrock_client):
+    tools = BedrockTools(outer_retries=2, retry_delay=100)
+    operation = MagicMock(side_effect=[_throttled("2"), _throttled(), "done"])
+
+    with patch("tools.bedrock_tools.time.sleep") as sleep:
+        assert tools._retry_operation(operation) == "done"
+
+    first, second = (call.args[0] for call in sleep.call_args_list)
+    assert first == 2.0
+    assert 15.0 <= second <= 45.0
+
+
+def _fake_analysis_methods(failing=()):
+    """Patch the analysis steps with fakes that echo their argument."""
+    def extract(self, text, info_type):
+        if info_type in failing:
+            raise RuntimeError(f"{info_type} failed")
+        return f"extract:{info_type}"
+
+    def analyze_multi(self, text, analysis_types):
+        return {t: f"analyze:{t}" for t in analysis_types}
+
+    return patch.multiple(
+        BedrockTools,
+        analyze_content_multi=analyze_multi,
+        extract_key_information=extract,
+    )
+
+
+def test_analyze_text_for_infographic_keeps_partial_results(bedrock_client):
+    with _fake_analysis_methods(failing=("statistics",)):
+        result = analyze_text_for_infographic("Some text")
+
+    assert result["summary"] == "analyze:summary"
+    assert result["facts"] == "extract:facts"
+    assert result["statistics"] is None
+    assert result["errors"] == {"statistics": "statistics failed"}
+
+
+async def test_analyze_text_for_infographic_async(bedrock_client):
+    with _fake_analysis_methods():
+        result = await analyze_text_for_infographic_async("Some text")
+
+    assert result["general_analysis"] == "analyze:general"
+    assert result["statistics"] == "extract:statistics"
+    assert "errors" not in result
+
+
+class _FakeAioBody:
+    def __init__(self, data):
+        self._data = data
+
+    async def read(self):
+        return self._data
+
+
+class _FakeAioStream:
+    def __init__(self, events):
+        self._events = iter(events)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._events)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _FakeAioClient:
+    def __init__(self, failures=()):
+        self.requests = []
+        self.closed = False
+        self.failures = list(failures)
+
+    async def __aenter__(self):
+        # Yield like a real client does while it opens its connection pool
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+    async def invoke_model(self, **params):
+        self.requests.append(params)
+        if self.failures:
+            raise self.failures.pop(0)
+        return {"body": _FakeAioBody(json.dumps({"content": [{"text": "async ok"}]}).encode("utf-8"))}
+
+    async def invoke_model_with_response_stream(self, **params):
+        self.requests.append(params)
+        return {"body": _FakeAioStream([
+            _stream_event({"type": "content_block_delta", "delta": {"text": "Hi"}}),
+            _stream_event({"type": "content_block_delta", "delta": {"text": " there"}}),
+        ])}
+
+
+@pytest.fixture
+def aio_client(bedrock_client):
+    client = _FakeAioClient()
+    aioboto3 = MagicMock()
+    aioboto3.Session.return_value.client.return_value = client
+    _get_aio_session.cache_clear()
+    with patch("tools.bedrock_tools.aioboto3", aioboto3):
+        yield client
+    _get_aio_session.cache_clear()
+
+
+async def test_invoke_model_async_uses_native_client(aio_client, bedrock_client):
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+
+    assert await tools.invoke_model_async("First") == "async ok"
+    assert [text async for text in tools.invoke_model_stream_async("Second")] == ["Hi", " there"]
+    await tools.aclose()
+
+    assert len(aio_client.requests) == 2
+    assert aio_client.closed
+    bedrock_client.invoke_model.assert_not_called()
+
+
+async def test_concurrent_async_calls_open_one_client(aio_client, bedrock_client):
+    session = bedrock_tools_module.aioboto3.Session.return_value
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+
+    results = await asyncio.gather(*(tools.invoke_model_async(f"Prompt {i}") for i in range(5)))
+    await tools.aclose()
+
+    assert results == ["async ok"] * 5
+    assert session.client.call_count == 1
+
+
+def test_async_client_reopened_on_new_loop(aio_client, bedrock_client):
+    clients = []
+
+    def new_client(*args, **kwargs):
+        clients.append(_FakeAioClient())
+        return clients[-1]
+
+    bedrock_tools_module.aioboto3.Session.return_value.client.side_effect = new_client
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+
+    asyncio.run(tools.invoke_model_async("First"))
+    asyncio.run(tools.invoke_model_async("Second"))
+
+    assert len(clients) == 2
+    assert clients[0].closed and not clients[1].closed
+
+
+async def test_invoke_model_async_retries_connection_errors(aio_client, bedrock_client):
+    aio_client.failures = [EndpointConnectionError(endpoint_url="https://bedrock-runtime")]
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0", outer_retries=1)
+
+    with patch.object(BedrockTools, "_retry_delay", return_value=0):
+        assert await tools.invoke_model_async("Hello") == "async ok"
+    await tools.aclose()
+
+    assert len(aio_client.requests) == 2
+
+
+async def test_invoke_model_async_falls_back_to_thread(bedrock_client):
+    tools = BedrockTools(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
+
+    with patch("tools.bedrock_tools.aioboto3", None):
+        assert await tools.invoke_model_async("Hello") == "ok"
+
+    bedrock_client.invoke_model.assert_called_once()
+
+
+class _FakeBatchS3:
+    """Answers each batch record from the input it was given."""
+
+    bucket_name = "test-bucket"
+
+    def __init__(self, analysis='{"general": "G", "key_points": "K", "structure": "T", "summary": "S"}'):
+        self.analysis = analysis
+        self.uploads = {}
+
+    def upload_bytes(self, data, s3_key, content_type="application/octet-stream"):
+        self.uploads[s3_key] = data
+        return s3_key
+
+    def download_bytes(self, s3_key):
+        (records,) = self.uploads.values()
+        lines = []
+        for line in records.splitlines():
+            record = json.loads(line)
+            prompt = record["modelInput"]["messages"][0]["content"]
+            if "statistics" in prompt:
+                lines.append({"recordId": record["recordId"], "error": {"errorMessage": "throttled"}})
+                continue
+            text = self.analysis if "top-level keys" in prompt else '["fact"]'
+            lines.append({**record, "modelOutput": {"content": [{"text": text}]}})
+        return "\n".join(json.dumps(line) for line in lines).encode("utf-8")
+
+
+def test_analyze_texts_batch_uses_one_batch_job(bedrock_client):
+    bedrock_client.create_model_invocation_job.return_value = {"jobArn": "arn:aws:bedrock:us-east-1:1:model-invocation-job/job1"}
+    bedrock_client.get_model_invocation_job.side_effect = [{"status": "InProgress"}, {"status": "Completed"}]
+    s3 = _FakeBatchS3()
+
+    with patch("tools.bedrock_tools.time.sleep"):
+        results = analyze_texts_batch(
+            ["first text", "second text"], min_batch_size=2, s3_tools=s3, role_arn="arn:aws:iam::1:role/batch"
+        )
+
+    bedrock_client.create_model_invocation_job.assert_called_once()
+    bedrock_client.invoke_model.assert_not_called()
+    assert len(s3.uploads) == 1
+    assert [r["summary"] for r in results] == ["S", "S"]
+    assert [r["facts"] for r in results] == [["fact"], ["fact"]]
+    assert results[0]["general_analysis"] == "G"
+    assert results[0]["errors"] == {"statistics": "Batch record was not processed"}
+
+
+def test_analyze_texts_batch_small_input_runs_directly(bedrock_client):
+    with _fake_analysis_methods():
+        results = analyze_texts_batch(["only text"], min_batch_size=2)
+
+    assert results[0]["summary"] == "analyze:summary"
+    bedrock_client.create_model_invocation_job.assert_not_called()
+
+
+def test_analyze_texts_batch_falls_back_when_job_fails(bedrock_client):
+    bedrock_client.create_model_invocation_job.return_value = {"jobArn": "arn:aws:bedrock:us-east-1:1:model-invocation-job/job1"}
+    bedrock_client.get_model_invocation_job.return_value = {"status": "Failed", "message": "bad input"}
+
+    with _fake_analysis_methods():
+        results = analyze_texts_batch(
+            ["first text", "second text"], min_batch_size=2,
+            s3_tools=_FakeBatchS3(), role_arn="arn:aws:iam::1:role/batch"
+        )
+
+    assert [r["summary"] for r in results] == ["analyze:summary", "analyze:summary"]
+
+
+def test_analyze_texts_batch_retries_malformed_analysis_records(bedrock_client):
+    bedrock_client.create_model_invocation_job.return_value = {"jobArn": "arn:aws:bedrock:us-east-1:1:model-invocation-job/job1"}
+    bedrock_client.get_model_invocation_job.return_value = {"status": "Completed"}
+
+    def analyze(self, text, analysis_type, stream=False):
+        if text == "second text":
+            raise BedrockInvocationError("analysis failed")
+        return f"analyze:{analysis_type}"
+
+    with patch.object(BedrockTools, "analyze_content", analyze):
+        results = analyze_texts_batch(
+            ["first text", "second text"], min_batch_size=2,
+            s3_tools=_FakeBatchS3(analysis="not json"), role_arn="arn:aws:iam::1:role/batch"
+        )
+
+    assert results[0]["summary"] == "analyze:summary"
+    assert results[0]["general_analysis"] == "analyze:general"
+    assert "analysis" not in results[0]["errors"]
+    assert results[1]["summary"] is None
+    assert results[1]["errors"]["analysis"] == "analysis failed"
+
+
+def test_batch_job_is_stopped_after_timeout(bedrock_client):
+    bedrock_client.create_model_invocation_job.return_value = {"jobArn": "arn:aws:bedrock:us-east-1:1:model-invocation-job/job1"}
+    bedrock_client.get_model_invocation_job.return_value = {"status": "InProgress"}
+
+    with pytest.raises(BedrockInvocationError, match="still InProgress"):
+        BedrockTools().run_batch_inference(
+            [{"prompt": "Hello"}], s3_tools=_FakeBatchS3(), role_arn="arn:aws:iam::1:role/batch", timeout=0
+        )
+
+    bedrock_client.stop_model_invocation_job.assert_called_once_with(
+        jobIdentifier="arn:aws:bedrock:us-east-1:1:model-invocation-job/job1"
+    )
+
+
+def test_module_helpers_reuse_one_instance(bedrock_client):
+    with patch.object(BedrockTools, "generate_infographic_bundle", autospec=True, return_value={}) as bundle:
+        generate_infographic_content("Cloud")
+        generate_infographic_content("Storage")
+
+    first, second = (call.args[0] for call in bundle.call_args_list)
+    assert first is second is create_bedrock_tools()
+
+
+def _bundle_response(bedrock_client, bundle):
+    bedrock_client.invoke_model.return_value = {
+        "body": json.dumps({"content": [{"text": "Here you go:\n" + json.dumps(bundle)}]}).encode("utf-8")
+    }
+
+
+def test_generate_infographic_content_makes_one_request(bedrock_client):
+    _bundle_response(bedrock_client, {
+        "headline": "Cloud Basics",
+        "subtitle": "What the cloud is",
+        "bullet_points": ["On demand", "Pay as you go", "Global"],
+        "caption": "x" * 200,
+    })
+
+    content = generate_infographic_content("Cloud")
+
+    bedrock_client.invoke_model.assert_called_once()
+    assert content == {
+        "headline": "Cloud Basics",
+        "subtitle": "What the cloud is",
+        "bullet_points": ["On demand", "Pay as you go", "Global"],
+        "caption": "x" * 147 + "...",
+    }
+
+
+def test_generate_infographic_content_caches_deterministic_calls(bedrock_client):
+    _bundle_response(bedrock_client, {
+        "headline": "H", "subtitle": "S", "bullet_points": ["A", "B", "C"], "caption": "C",
+    })
+
+    first = generate_infographic_content("Cloud", temperature=0)
+    second = generate_infographic_content("Cloud", temperature=0)
+    generate_infographic_content("Cloud", style="casual", temperature=0)
+
+    assert first == second
+    assert bedrock_client.invoke_model.call_count == 2
+
+
+def test_generate_infographic_content_semantic_cache(bedrock_client):
+    _bundle_response(bedrock_client, {
+        "headline": "Lambda Pricing Explained",
+        "subtitle": "How lambda pricing works",
+        "bullet_points": ["Pay per request", "Pay per GB-second", "Free tier"],
+        "caption": "Learn about Lambda Pricing",
+    })
+    vectors = {"Lambda pricing": [1.0, 0.0], "AWS Lambda pricing": [0.98, 0.05], "S3 storage": [0.0, 1.0]}
+
+    with patch.object(BedrockTools, "embed_text", side_effect=vectors.__getitem__):
+        generate_infographic_content("Lambda pricing", semantic_cache=True)
+        near = generate_infographic_content("AWS Lambda pricing", semantic_cache=True)
+        generate_infographic_content("S3 storage", semantic_cache=True)
+
+    assert bedrock_client.invoke_model.call_count == 2
+    assert near["headline"] == "AWS Lambda pricing Explained"
+    assert near["subtitle"] == "How AWS Lambda pricing works"
+    assert near["bullet_points"] == ["Pay per request", "Pay per GB-second", "Free tier"]
+
+
+def test_generate_bullets_makes_one_request(bedrock_client):
+    bedrock_client.invoke_model.return_value = {
+        "body": json.dumps({"content": [{"text": "- Elastic\n\n2. Managed\n• " + "y" * 100 + "\n* Extra"}]}).encode("utf-8")
+    }
+
+    bullets = BedrockTools().generate_bullets("Cloud", n=3, max_length=80)
+
+    bedrock_client.invoke_model.assert_called_once()
+    assert bullets == ["Elastic", "Managed", "y" * 77 + "..."]
+
+
+def test_retemplate_content_replaces_whole_topic_once():
+    content = {
+        "headline": "S3 Explained",
+        "bullet_points": ["S3 Glacier archives data", "Use S3 for objects", "S3x is unrelated"],
+    }
+
+    assert _retemplate_content(content, "S3", "S3 Glacier") == {
+        "headline": "S3 Glacier Explained",
+        "bullet_points": ["S3 Glacier archives data", "Use S3 Glacier for objects", "S3x is unrelated"],
+    }
+
+
+def _fake_generate_text_content(topic, content_type, style, max_length, temperature):
+    if content_type == "subtitle":
+        raise RuntimeError("subtitle failed")
+    return f"{content_type}:{topic}"
+
+
+def _fake_generate_bullets(topic, style, n, max_length, temperature):
+    return [f"bullet {i}:{topic}" for i in range(1, n + 1)]
+
+
+def test_generate_infographic_content_fills_missing_fields(bedrock_client):
+    _bundle_response(bedrock_client, {"headline": "Cloud Basics", "bullet_points": ["On demand"], "caption": "C"})
+
+    with patch.object(BedrockTools, "generate_text_content", side_effect=_fake_generate_text_content), \
+            patch.object(BedrockTools, "generate_bullets", side_effect=_fake_generate_bullets) as bullets:
+        content = generate_infographic_content("Cloud")
+
+    bullets.assert_called_once()
+    assert content["headline"] == "Cloud Basics"
+    assert content["subtitle"] == "Key Information and Insights"
+    assert content["bullet_points"] == ["On demand", "bullet 1:Cloud", "bullet 2:Cloud"]
+    assert content["caption"] == "C"
+    assert content["error"] == "subtitle failed"
+
+
+def test_generate_infographic_content_survives_failed_combined_request(bedrock_client):
+    with patch.object(BedrockTools, "invoke_model", side_effect=RuntimeError("timed out")), \
+            patch.object(BedrockTools, "generate_text_content", side_effect=_fake_generate_text_content), \
+            patch.object(BedrockTools, "generate_bullets", side_effect=_fake_generate_bullets):
+        content = generate_infographic_content("Cloud")
+
+    assert content["headline"] == "headline:Cloud"
+    assert content["subtitle"] == "Key Information and Insights"
+    assert content["bullet_points"] == ["bullet 1:Cloud", "bullet 2:Cloud", "bullet 3:Cloud"]
+    assert content["caption"] == "caption:Cloud"
+    assert content["error"] == "subtitle failed"
+
+
+async def test_generate_infographic_content_async(bedrock_client):
+    with patch.object(BedrockTools, "invoke_model", side_effect=RuntimeError("bedrock down")):
+        content = await generate_infographic_content_async("Cloud")
+
+    assert content["headline"] == "About Cloud"
+    assert content["bullet_points"] == ["Key Point 1", "Key Point 2", "Key Point 3"]
+    assert "bedrock down" in content["error"]
@@ -0,0 +1,21 @@
+import json
+from unittest.mock import MagicMock
+
+from tools.bedrock_tools import BedrockTools
+from tools.content_tools import ContentTools
+
+
+def test_bedrock_extract_json_caches_identical_requests():
+    bedrock = MagicMock(spec=BedrockTools)
+    bedrock.invoke_model.return_value = json.dumps(["Point A", "Point B"])
+    tools = ContentTools(bedrock_tools=bedrock)
+
+    first = tools.bedrock_extract_json("Same text", "Extract key points")
+    first["parsed_json"].append("mutated by caller")
+    second = tools.bedrock_extract_json("Same text", "Extract key points")
+
+    assert bedrock.invoke_model.call_count == 1
+    assert second["parsed_json"] == ["Point A", "Point B"]
+
+    tools.bedrock_extract_json("Different text", "Extract key points")
+    assert bedrock.invoke_model.call_count == 2
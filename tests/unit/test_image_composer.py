@@ -8,61 +8,70 @@ from agents.image_composer import create_image_composer_agent, ImageComposer
 from utils.constants import DEMO_MODE
 
 
+# Shared read-only sample specs; ImageComposer.process only formats them
+# into its prompt, so one instance serves every test.
+SAMPLE_LAYOUT_SPEC = {
+    "canvas_size": [1200, 800],
+    "color_scheme": {
+        "background": "#FFFFFF",
+        "primary": "#1a365d",
+        "secondary": "#64748b"
+    },
+    "layout_type": "vertical_flow",
+    "sections": [
+        {"type": "header", "position": [0.1, 0.1], "size": [0.8, 0.15]},
+        {"type": "content", "position": [0.1, 0.3], "size": [0.8, 0.5]},
+        {"type": "footer", "position": [0.1, 0.85], "size": [0.8, 0.1]}
+    ]
+}
+
+SAMPLE_TEXT_SPECS = [
+    {
+        "text": "How to Accelerate Cloud Migrations",
+        "position": [0.1, 0.1],
+        "font_size": 24,
+        "font_family": "Arial",
+        "color": "#1a365d",
+        "alignment": "left",
+        "bold": True
+    },
+    {
+        "text": "Assess your current workloads and dependencies",
+        "position": [0.1, 0.25],
+        "font_size": 18,
+        "font_family": "Arial",
+        "color": "#333333",
+        "alignment": "left"
+    }
+]
+
+SAMPLE_IMAGE_SPECS = [
+    {
+        "url": "https://example.com/image1.png",
+        "position": [0.1, 0.5],
+        "size": [0.3, 0.3],
+        "type": "illustration"
+    }
+]
+
+
 class TestImageComposer:
     """Test cases for ImageComposer agent."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_layout_spec(self):
         """Sample layout specification for testing."""
-        return {
-            "canvas_size": [1200, 800],
-            "color_scheme": {
-                "background": "#FFFFFF",
-                "primary": "#1a365d",
-                "secondary": "#64748b"
-            },
-            "layout_type": "vertical_flow",
-            "sections": [
-                {"type": "header", "position": [0.1, 0.1], "size": [0.8, 0.15]},
-                {"type": "content", "position": [0.1, 0.3], "size": [0.8, 0.5]},
-                {"type": "footer", "position": [0.1, 0.85], "size": [0.8, 0.1]}
-            ]
-        }
-
-    @pytest.fixture
+        return SAMPLE_LAYOUT_SPEC
+
+    @pytest.fixture(scope="module")
     def sample_text_specs(self):
         """Sample text specifications for testing."""
-        return [
-            {
-                "text": "How to Accelerate Cloud Migrations",
-                "position": [0.1, 0.1],
-                "font_size": 24,
-                "font_family": "Arial",
-                "color": "#1a365d",
-                "alignment": "left",
-                "bold": True
-            },
-            {
-                "text": "Assess your current workloads and dependencies",
-                "position": [0.1, 0.25],
-                "font_size": 18,
-                "font_family": "Arial",
-                "color": "#333333",
-                "alignment": "left"
-            }
-        ]
-
-    @pytest.fixture
+        return SAMPLE_TEXT_SPECS
+
+    @pytest.fixture(scope="module")
     def sample_image_specs(self):
         """Sample image specifications for testing."""
-        return [
-            {
-                "url": "https://example.com/image1.png",
-                "position": [0.1, 0.5],
-                "size": [0.3, 0.3],
-                "type": "illustration"
-            }
-        ]
+        return SAMPLE_IMAGE_SPECS
 
     @pytest.mark.asyncio
     async def test_image_composer_creation(self):
@@ -1,104 +1,241 @@
 import asyncio
+import json
+import threading
+import time
 from unittest.mock import patch
 
 import pytest
 
 from tools import layout_tools as ltools
+from utils.agent_cache import AgentCache
+
+
+class FakeBedrock:
+    """Stand-in for BedrockTools; set ``response`` or ``raise_exc`` per test."""
+
+    def __init__(self):
+        self.response = None
+        self.raise_exc = None
+        self.before_return = None
+        self.calls = 0
+        self.last_prompt = None
+
+    def analyze_content(self, prompt, analysis_type):
+        self.calls += 1
+        self.last_prompt = prompt
+        if self.before_return is not None:
+            self.before_return()
+        if self.raise_exc is not None:
+            raise self.raise_exc
+        return self.response
+
+
+@pytest.fixture(autouse=True)
+def _clear_layout_caches():
+    ltools.invalidate_all()
+
+
+@pytest.fixture
+def fake_bedrock(monkeypatch):
+    fake = FakeBedrock()
+    monkeypatch.setattr(ltools, "_get_bedrock", lambda: fake)
+    return fake
+
+
+GRID_SPEC = {
+    "layout_type": "grid",
+    "sections": [
+        {"type": "title", "x": 0.1, "y": 0.1, "width": 0.8, "height": 0.2},
+        {"type": "bullet", "text": "Point 1", "x": 0.1, "y": 0.3, "width": 0.35, "height": 0.1}
+    ],
+    "dimensions": {"width": 800, "height": 600}
+}
 
 
 @pytest.mark.asyncio
-async def test_suggest_layout_type_normal_operation():
+@pytest.mark.parametrize(
+    "response, raise_exc, expected",
+    [
+        ("vertical_list", None, "vertical_list"),
+        # default fallback when bedrock fails
+        (None, Exception("bedrock down"), "vertical_list"),
+    ],
+    ids=["normal_operation", "fallback_on_error"],
+)
+async def test_suggest_layout_type(fake_bedrock, response, raise_exc, expected):
     content_analysis = {
         "key_points": ["Point 1", "Point 2", "Point 3", "Point 4"],
         "content_type": "how-to"
     }
     image_assets = [{"url": "image1.jpg", "type": "image"}]
+    fake_bedrock.response = response
+    fake_bedrock.raise_exc = raise_exc
 
-    fake_response = "vertical_list"
-
-    with patch("tools.layout_tools._get_bedrock") as gb:
-        class FakeBedrock:
-            def analyze_content(self, prompt, analysis_type):
-                return fake_response
+    result = await ltools.suggest_layout_type(content_analysis, image_assets)
 
-        gb.return_value = FakeBedrock()
-        result = await ltools.suggest_layout_type(content_analysis, image_assets)
-
-    assert result == "vertical_list"
+    assert result == expected
 
 
 @pytest.mark.asyncio
-async def test_suggest_layout_type_fallback_on_error():
+@pytest.mark.parametrize(
+    "response, raise_exc",
+    [(GRID_SPEC, None), (None, Exception("bedrock down"))],
+    ids=["normal_operation", "fallback_on_error"],
+)
+async def test_generate_layout_spec(fake_bedrock, response, raise_exc):
     content_analysis = {
         "key_points": ["Point 1", "Point 2"],
         "content_type": "general"
     }
-    image_assets = []
+    image_assets = [{"url": "image1.jpg", "type": "image"}]
+    fake_bedrock.response = response
+    fake_bedrock.raise_exc = raise_exc
 
-    # Make bedrock raise an exception
-    with patch("tools.layout_tools._get_bedrock") as gb:
-        class FakeBedrock:
-            def analyze_content(self, prompt, analysis_type):
-                raise Exception("bedrock down")
+    result = await ltools.generate_layout_spec(content_analysis, image_assets)
 
-        gb.return_value = FakeBedrock()
-        result = await ltools.suggest_layout_type(content_analysis, image_assets)
+    assert "layout_type" in result
+    assert "sections" in result
+    assert "dimensions" in result
+    if raise_exc is None:
+        assert result == GRID_SPEC
+    else:
+        # Should return local fallback
+        assert result["raw_response"] == "local_fallback"
 
-    assert result == "vertical_list"  # default fallback when bedrock fails
+
+@pytest.mark.asyncio
+async def test_missing_key_points_skips_bedrock(fake_bedrock):
+    content_analysis = {"key_points": [], "content_type": "general"}
+
+    layout_type = await ltools.suggest_layout_type(content_analysis, [])
+    spec = await ltools.generate_layout_spec(content_analysis, [])
+
+    assert fake_bedrock.calls == 0
+    assert layout_type == spec["layout_type"] == "grid"
+    assert spec["raw_response"] == "local_fallback"
+
+
+@pytest.mark.asyncio
+async def test_generate_layout_spec_recovers_fenced_json(fake_bedrock):
+    content_analysis = {"key_points": ["Point 1"], "content_type": "general"}
+    fake_bedrock.response = {
+        "analysis_type": "structure",
+        "raw_response": "```json\n" + json.dumps({"layout_type": "grid", "spec": GRID_SPEC}) + "\n```",
+        "error": "Failed to parse JSON response",
+    }
+
+    result = await ltools.generate_layout_spec(content_analysis, [])
+
+    assert result == GRID_SPEC
 
 
 @pytest.mark.asyncio
-async def test_generate_layout_spec_normal_operation():
+async def test_layout_type_and_spec_share_one_bedrock_call(fake_bedrock):
     content_analysis = {
-        "key_points": ["Point 1", "Point 2"],
+        "key_points": ["Point 1", "Point 2", "Point 3"],
         "content_type": "general"
     }
     image_assets = [{"url": "image1.jpg", "type": "image"}]
+    fake_bedrock.response = {"layout_type": "Grid", "spec": GRID_SPEC}
 
-    fake_response = {
-        "layout_type": "grid",
-        "sections": [
-            {"type": "title", "x": 0.1, "y": 0.1, "width": 0.8, "height": 0.2},
-            {"type": "bullet", "text": "Point 1", "x": 0.1, "y": 0.3, "width": 0.35, "height": 0.1}
-        ],
-        "dimensions": {"width": 800, "height": 600}
-    }
+    layout_type, layout_spec = await asyncio.gather(
+        ltools.suggest_layout_type(content_analysis, image_assets),
+        ltools.generate_layout_spec(content_analysis, image_assets),
+    )
+    # A later call for the same inputs reuses the finished request
+    again = await ltools.suggest_layout_type(content_analysis, image_assets)
 
-    with patch("tools.layout_tools._get_bedrock") as gb:
-        class FakeBedrock:
-            def analyze_content(self, prompt, analysis_type):
-                return fake_response
+    assert fake_bedrock.calls == 1
+    assert layout_type == again == "grid"
+    assert layout_spec == GRID_SPEC
 
-        gb.return_value = FakeBedrock()
-        result = await ltools.generate_layout_spec(content_analysis, image_assets)
 
-    assert result == fake_response
-    assert "layout_type" in result
-    assert "sections" in result
+@pytest.mark.asyncio
+async def test_layout_prompt_has_static_prefix(fake_bedrock):
+    content_analysis = {"key_points": ["Point 1"], "content_type": "general"}
+    image_assets = [{"url": "image1.jpg", "type": "image"}]
+    fake_bedrock.response = "grid"
+
+    await ltools.suggest_layout_type(content_analysis, image_assets)
+
+    prompt = fake_bedrock.last_prompt
+    assert prompt.startswith(ltools.LAYOUT_COMBINED_PROMPT_PREFIX)
+    tail = json.loads(prompt[len(ltools.LAYOUT_COMBINED_PROMPT_PREFIX):])
+    assert tail == {"content": content_analysis, "images": image_assets}
 
 
 @pytest.mark.asyncio
-async def test_generate_layout_spec_fallback_on_error():
-    content_analysis = {
-        "key_points": ["Point 1", "Point 2"],
-        "content_type": "general"
-    }
-    image_assets = [{"url": "image1.jpg", "type": "image"}]
+async def test_bedrock_calls_do_not_block_event_loop(fake_bedrock):
+    image_assets = []
+    # Both calls must be in flight at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    fake_bedrock.before_return = barrier.wait
+    fake_bedrock.response = "timeline"
 
-    # Make bedrock raise an exception
-    with patch("tools.layout_tools._get_bedrock") as gb:
-        class FakeBedrock:
-            def analyze_content(self, prompt, analysis_type):
-                raise Exception("bedrock down")
+    results = await asyncio.gather(
+        ltools.suggest_layout_type({"key_points": ["A"], "content_type": "general"}, image_assets),
+        ltools.suggest_layout_type({"key_points": ["B"], "content_type": "general"}, image_assets),
+    )
 
-        gb.return_value = FakeBedrock()
-        result = await ltools.generate_layout_spec(content_analysis, image_assets)
+    assert results == ["timeline", "timeline"]
 
-    # Should return local fallback
-    assert "layout_type" in result
-    assert "sections" in result
-    assert "dimensions" in result
-    assert result["raw_response"] == "local_fallback"
+
+@pytest.mark.asyncio
+async def test_generate_layout_spec_memoizes_results(fake_bedrock):
+    content_analysis = {"key_points": ["Point 1"], "content_type": "general"}
+    image_assets = []
+    fake_bedrock.response = {"layout_type": "grid", "sections": []}
+
+    first = await ltools.generate_layout_spec(content_analysis, image_assets)
+    first["sections"].append("mutated by caller")
+    ltools._COMBINED_REQUESTS.clear()
+    second = await ltools.generate_layout_spec(content_analysis, image_assets)
+    assert fake_bedrock.calls == 1
+    assert second == {"layout_type": "grid", "sections": []}
+
+    ltools.invalidate_all()
+    await ltools.generate_layout_spec(content_analysis, image_assets)
+    assert fake_bedrock.calls == 2
+
+
+def test_combined_request_pending_on_another_loop_is_not_awaited(fake_bedrock):
+    content_analysis = {"key_points": ["Point 1"], "content_type": "general"}
+    fake_bedrock.response = {"layout_type": "grid", "sections": []}
+
+    # A request left pending when its loop stopped
+    stale_loop = asyncio.new_event_loop()
+    try:
+        stale = stale_loop.create_future()
+        key = AgentCache.make_key(content_analysis, [])
+        ltools._COMBINED_REQUESTS.set(key, stale)
+
+        layout_type, spec = asyncio.run(ltools._analyze_layout_combined(content_analysis, []))
+    finally:
+        stale.cancel()
+        stale_loop.close()
+
+    assert (layout_type, spec) == ("grid", {"layout_type": "grid", "sections": []})
+    assert fake_bedrock.calls == 1
+
+    # The finished request is reused from a fresh loop
+    assert asyncio.run(ltools._analyze_layout_combined(content_analysis, [])) == (layout_type, spec)
+    assert fake_bedrock.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_layout_specs_runs_concurrently(fake_bedrock):
+    items = [[{"key_points": [f"Point {i}"], "content_type": "general"}, []] for i in range(20)]
+    fake_bedrock.before_return = lambda: time.sleep(0.05)
+    fake_bedrock.response = {"layout_type": "grid", "sections": []}
+
+    start = time.perf_counter()
+    results = await ltools.generate_layout_specs(items, concurrency=10)
+    elapsed = time.perf_counter() - start
+
+    assert fake_bedrock.calls == 20
+    assert results == [{"layout_type": "grid", "sections": []}] * 20
+    # Sequential calls would take 20 * 0.05s
+    assert elapsed < 0.5
 
 
 @pytest.mark.asyncio
@@ -118,11 +255,23 @@ async def test_demo_mode_layout_generation():
     assert result["raw_response"] == "local_fallback"
 
 
+def test_get_bedrock_builds_client_once():
+    ltools._reset_bedrock_for_tests()
+    try:
+        with patch("tools.bedrock_tools.BedrockTools") as bedrock_cls:
+            assert ltools._get_bedrock() is ltools._get_bedrock()
+            bedrock_cls.assert_called_once_with()
+    finally:
+        ltools._reset_bedrock_for_tests()
+
+
 def test_get_layout_tools():
     """Test that get_layout_tools returns the expected tools."""
     tools = ltools.get_layout_tools()
 
-    assert len(tools) == 2
+    assert len(tools) == 3
     tool_names = [tool.__name__ for tool in tools]
     assert "suggest_layout_type" in tool_names
-    assert "generate_layout_spec" in tool_names
\ No newline at end of file
+    assert "generate_layout_spec" in tool_names
+    assert "generate_layout_specs" in tool_names
+    assert ltools.get_layout_tools() is tools
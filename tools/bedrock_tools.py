@@ -6,25 +6,72 @@ content processing, and other LLM-based operations with comprehensive
 error handling and retry logic.
 """
 
+import asyncio
+import functools
 import json
 import logging
 import os
+import random
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, ClassVar, Dict, Iterator, List, Optional, Set, Tuple, Union
 from datetime import datetime
 
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError, BotoCoreError
 from botocore.config import Config
 
+from utils.agent_cache import AgentCache, SemanticCache
+from utils.constants import (
+    BEDROCK_BATCH_MIN_TEXTS, BEDROCK_BATCH_POLL_INTERVAL, BEDROCK_BATCH_ROLE_ARN, BEDROCK_BATCH_TIMEOUT,
+    BEDROCK_CACHE_DIR, BEDROCK_CACHE_MAX_SIZE, BEDROCK_CACHE_MAX_TEMPERATURE, BEDROCK_CACHE_TTL,
+    BEDROCK_EMBEDDING_MODEL_ID, RETRY_CONFIG, SEMANTIC_CACHE_ENABLED, SEMANTIC_CACHE_MAX_SIZE,
+    SEMANTIC_CACHE_THRESHOLD
+)
+from utils.fastjson import dumps_bytes, loads
 from utils.error_handling import (
-    ErrorHandler, with_error_handling, ErrorCategory, ErrorSeverity,
-    AWSServiceError, NetworkError, TimeoutError, ValidationError,
+    ErrorHandler, get_error_handler, with_error_handling, ErrorCategory, ErrorSeverity,
+    InfographicError, RetryStrategy, AWSServiceError, NetworkError, TimeoutError, ValidationError,
     handle_aws_service_error, log_error_context
 )
 
+try:
+    import aioboto3
+except ImportError:  # pragma: no cover - exercised only without aioboto3
+    aioboto3 = None
+
 logger = logging.getLogger(__name__)
 
+# ValidationException messages that blame the model itself rather than the
+# request (e.g. "The provided model identifier is invalid.")
+_MODEL_ERROR_RE = re.compile(
+    r"model (?:identifier|id)\b|(?:provided|requested|specified) model|model\b.*\bnot (?:found|supported|available|accessible)",
+    re.IGNORECASE
+)
+
+# Outermost {...} span of a model answer that may wrap JSON in prose or a code fence
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# List marker ("-", "•", "*", "1." or "1)") at the start of a bullet line
+_BULLET_MARKER_RE = re.compile(r"^\s*(?:[-•*]|\d+[.)])\s*")
+
+# Stands in for the user prompt in pre-serialized request bodies
+_PROMPT_PLACEHOLDER = "__bedrock_tools_prompt__"
+_PROMPT_PLACEHOLDER_JSON = dumps_bytes(_PROMPT_PLACEHOLDER, indent=False)
+
+# Responses to low-temperature requests, shared by all BedrockTools instances
+_RESPONSE_CACHE = AgentCache(ttl=BEDROCK_CACHE_TTL, max_size=BEDROCK_CACHE_MAX_SIZE, cache_dir=BEDROCK_CACHE_DIR)
+
+# Infographic text by topic embedding, for near-duplicate topics
+_SEMANTIC_CACHE = SemanticCache(
+    threshold=SEMANTIC_CACHE_THRESHOLD, max_size=SEMANTIC_CACHE_MAX_SIZE, cache_dir=BEDROCK_CACHE_DIR
+)
+
 
 class BedrockToolsError(Exception):
     """Base exception for Bedrock tools operations."""
@@ -36,14 +83,264 @@ class BedrockInvocationError(BedrockToolsError):
     pass
 
 
-class BedrockConfigurationError(BedrockToolsError):
-    """Exception raised when Bedrock configuration is invalid."""
-    pass
+class BedrockConfigurationError(BedrockToolsError, InfographicError):
+    """Exception raised when Bedrock configuration is invalid; never retried."""
+    
+    def __init__(self, message: str, **kwargs):
+        super().__init__(
+            message,
+            category=ErrorCategory.VALIDATION,
+            severity=ErrorSeverity.HIGH,
+            retry_strategy=RetryStrategy.NO_RETRY,
+            **kwargs
+        )
 
 
-class BedrockModelNotFoundError(BedrockToolsError):
-    """Exception raised when specified Bedrock model is not available."""
-    pass
+class BedrockModelNotFoundError(BedrockToolsError, InfographicError):
+    """Exception raised when specified Bedrock model is not available; never retried."""
+    
+    def __init__(self, message: str, **kwargs):
+        super().__init__(
+            message,
+            category=ErrorCategory.VALIDATION,
+            severity=ErrorSeverity.HIGH,
+            retry_strategy=RetryStrategy.NO_RETRY,
+            **kwargs
+        )
+
+
+def _client_config(region: str, max_retries: int, request_timeout: int) -> Config:
+    """botocore settings shared by the sync and async bedrock-runtime clients."""
+    return Config(
+        region_name=region,
+        retries={
+            'max_attempts': max_retries,
+            'mode': 'adaptive'
+        },
+        read_timeout=request_timeout,
+        connect_timeout=10,
+        # Enough sockets for the concurrent fan-outs in this module, kept
+        # alive between bursts so calls skip the TCP/TLS handshake
+        max_pool_connections=64,
+        tcp_keepalive=True
+    )
+
+
+def _session_kwargs(aws_access_key_id: Optional[str], aws_secret_access_key: Optional[str]) -> Dict[str, str]:
+    """Explicit credentials for a boto3/aioboto3 session, if both were given."""
+    if aws_access_key_id and aws_secret_access_key:
+        return {
+            'aws_access_key_id': aws_access_key_id,
+            'aws_secret_access_key': aws_secret_access_key
+        }
+    return {}
+
+
+@functools.lru_cache(maxsize=8)
+def _get_bedrock_client(
+    region: str,
+    aws_access_key_id: Optional[str],
+    aws_secret_access_key: Optional[str],
+    max_retries: int,
+    request_timeout: int
+):
+    """
+    Return a bedrock-runtime client for this configuration, built on first use.
+    
+    boto3 low-level clients are thread-safe, so one client (and its
+    connection pool) is shared by every BedrockTools with the same settings.
+    """
+    config = _client_config(region, max_retries, request_timeout)
+    session = boto3.Session(**_session_kwargs(aws_access_key_id, aws_secret_access_key))
+    return session.client('bedrock-runtime', config=config)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_bedrock_control_client(
+    region: str,
+    aws_access_key_id: Optional[str],
+    aws_secret_access_key: Optional[str],
+    max_retries: int,
+    request_timeout: int
+):
+    """Return a bedrock (control plane) client for batch jobs, built on first use."""
+    config = _client_config(region, max_retries, request_timeout)
+    session = boto3.Session(**_session_kwargs(aws_access_key_id, aws_secret_access_key))
+    return session.client('bedrock', config=config)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_aio_session(aws_access_key_id: Optional[str], aws_secret_access_key: Optional[str]):
+    """Return the aioboto3 session for these credentials, built on first use."""
+    return aioboto3.Session(**_session_kwargs(aws_access_key_id, aws_secret_access_key))
+
+
+@dataclass(frozen=True, slots=True)
+class ModelConfig:
+    """Request/response capabilities of a Bedrock model."""
+    provider: str
+    max_tokens: Optional[int]
+    supports_system: bool
+    input_format: str
+    supports_prompt_cache: bool = False
+    latency_optimized: bool = False
+
+
+# Used for model IDs missing from BedrockTools.SUPPORTED_MODELS
+_UNKNOWN_MODEL_CONFIG = ModelConfig(
+    provider="unknown",
+    max_tokens=100000,
+    supports_system=True,
+    input_format="anthropic"
+)
+
+
+def _format_anthropic(model_config, prompt, system_prompt, max_tokens, temperature, top_p, prompt_cache=True, **kwargs):
+    """Anthropic Claude Messages API payload."""
+    messages = [{"role": "user", "content": prompt}]
+    
+    payload = {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": min(max_tokens, model_config.max_tokens or 200000),
+        "messages": messages,
+        "temperature": temperature,
+        "top_p": top_p
+    }
+    
+    if system_prompt and model_config.supports_system:
+        if prompt_cache and model_config.supports_prompt_cache:
+            # Mark the system prompt as a cache checkpoint so repeated
+            # calls sharing it reuse the cached prefix
+            payload["system"] = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        else:
+            payload["system"] = system_prompt
+    return payload
+
+
+def _format_titan(model_config, prompt, system_prompt, max_tokens, temperature, top_p, prompt_cache=True, **kwargs):
+    """Amazon Titan text payload."""
+    return {
+        "inputText": f"{system_prompt}\n\n{prompt}" if system_prompt else prompt,
+        "textGenerationConfig": {
+            "maxTokenCount": min(max_tokens, model_config.max_tokens or 32000),
+            "temperature": temperature,
+            "topP": top_p
+        }
+    }
+
+
+def _format_nova_canvas(model_config, prompt, system_prompt, max_tokens, temperature, top_p, prompt_cache=True, **kwargs):
+    """Amazon Nova Canvas payload (image generation)."""
+    return {
+        "taskType": "TEXT_IMAGE",
+        "textToImageParams": {
+            "text": prompt,
+            "negativeText": kwargs.get("negative_prompt", ""),
+        },
+        "imageGenerationConfig": {
+            "numberOfImages": kwargs.get("number_of_images", 1),
+            "height": kwargs.get("height", 1024),
+            "width": kwargs.get("width", 1024),
+            "cfgScale": kwargs.get("cfg_scale", 8.0),
+            "seed": kwargs.get("seed", 0)
+        }
+    }
+
+
+def _format_default(model_config, prompt, system_prompt, max_tokens, temperature, top_p, prompt_cache=True, **kwargs):
+    """Anthropic-style payload for unknown formats."""
+    messages = [{"role": "user", "content": prompt}]
+    payload = {
+        "max_tokens": max_tokens,
+        "messages": messages,
+        "temperature": temperature,
+        "top_p": top_p
+    }
+    
+    if system_prompt:
+        payload["system"] = system_prompt
+    return payload
+
+
+def _parse_anthropic(response_body):
+    """Text of an Anthropic Claude response, if present."""
+    if "content" in response_body and response_body["content"]:
+        return response_body["content"][0]["text"]
+    return None
+
+
+def _parse_titan(response_body):
+    """Text of an Amazon Titan response, if present."""
+    if "results" in response_body and response_body["results"]:
+        return response_body["results"][0]["outputText"]
+    return None
+
+
+def _parse_nova_canvas(response_body):
+    """Nova Canvas returns image data, not text."""
+    return response_body.get("images")
+
+
+def _parse_default(response_body):
+    """Unknown formats rely on _parse_fallback."""
+    return None
+
+
+def _parse_fallback(response_body):
+    """Try common response fields, then the whole response as a string."""
+    for field in ["content", "text", "output", "response"]:
+        if field in response_body:
+            content = response_body[field]
+            if isinstance(content, list) and content:
+                return content[0].get("text", str(content[0]))
+            elif isinstance(content, str):
+                return content
+    
+    # Last resort - return the whole response as string
+    return str(response_body)
+
+
+def _stream_text_titan(chunk):
+    """Text delta of an Amazon Titan stream chunk."""
+    return chunk.get("outputText") or None
+
+
+def _content_block_delta_text(chunk):
+    return chunk.get("delta", {}).get("text") or None
+
+
+# Anthropic Messages stream events that carry text; message_start,
+# message_delta, message_stop etc. carry none
+_ANTHROPIC_STREAM_EVENTS = {
+    "content_block_delta": _content_block_delta_text,
+}
+
+
+def _stream_text_anthropic(chunk):
+    """Text delta of an Anthropic Messages stream event."""
+    handler = _ANTHROPIC_STREAM_EVENTS.get(chunk.get("type"))
+    return handler(chunk) if handler is not None else None
+
+
+# Request builders and response parsers by model input_format
+_FORMATTERS = {
+    "anthropic": _format_anthropic,
+    "titan": _format_titan,
+    "nova_canvas": _format_nova_canvas,
+}
+_PARSERS = {
+    "anthropic": _parse_anthropic,
+    "titan": _parse_titan,
+    "nova_canvas": _parse_nova_canvas,
+}
+_STREAM_PARSERS = {
+    "anthropic": _stream_text_anthropic,
+    "titan": _stream_text_titan,
+}
 
 
 class BedrockTools:
@@ -55,42 +352,147 @@ class BedrockTools:
     """
     
     # Supported model configurations
-    SUPPORTED_MODELS = {
-        "anthropic.claude-3-5-sonnet-20241022-v2:0": {
-            "provider": "anthropic",
-            "max_tokens": 200000,
-            "supports_system": True,
-            "input_format": "anthropic"
-        },
-        "anthropic.claude-3-haiku-20240307-v1:0": {
-            "provider": "anthropic", 
-            "max_tokens": 200000,
-            "supports_system": True,
-            "input_format": "anthropic"
-        },
-        "amazon.titan-text-premier-v1:0": {
-            "provider": "amazon",
-            "max_tokens": 32000,
-            "supports_system": False,
-            "input_format": "titan"
-        },
-        "amazon.nova-canvas-v1:0": {
-            "provider": "amazon",
-            "max_tokens": None,
-            "supports_system": False,
-            "input_format": "nova_canvas"
-        }
+    SUPPORTED_MODELS: ClassVar[Dict[str, ModelConfig]] = {
+        "anthropic.claude-3-5-sonnet-20241022-v2:0": ModelConfig(
+            provider="anthropic",
+            max_tokens=200000,
+            supports_system=True,
+            supports_prompt_cache=True,
+            input_format="anthropic"
+        ),
+        "anthropic.claude-3-5-haiku-20241022-v1:0": ModelConfig(
+            provider="anthropic",
+            max_tokens=200000,
+            supports_system=True,
+            supports_prompt_cache=True,
+            latency_optimized=True,
+            input_format="anthropic"
+        ),
+        "anthropic.claude-3-haiku-20240307-v1:0": ModelConfig(
+            provider="anthropic",
+            max_tokens=200000,
+            supports_system=True,
+            supports_prompt_cache=False,
+            input_format="anthropic"
+        ),
+        "amazon.titan-text-premier-v1:0": ModelConfig(
+            provider="amazon",
+            max_tokens=32000,
+            supports_system=False,
+            input_format="titan"
+        ),
+        "amazon.nova-canvas-v1:0": ModelConfig(
+            provider="amazon",
+            max_tokens=None,
+            supports_system=False,
+            input_format="nova_canvas"
+        )
+    }
+    
+    ANALYSIS_SYSTEM_PROMPT = """You are an expert content analyst specializing in creating infographics. 
+Always respond with valid JSON format. Be concise and focus on visual communication."""
+    
+    # Per-type prompt templates; "{text}" is replaced with the source text
+    ANALYSIS_PROMPTS = {
+        "general": """Analyze the following text for creating an infographic. Extract:
+1. Main topic/title
+2. Key points (3-5 most important)
+3. Supporting details
+4. Suggested visual elements
+5. Target audience
+
+Text: {text}
+
+Respond in JSON format with keys: main_topic, key_points, supporting_details, visual_suggestions, target_audience""",
+        
+        "key_points": """Extract the 3-5 most important key points from this text for an infographic:
+
+{text}
+
+Return only a JSON array of key points, each as a short, impactful statement.""",
+        
+        "structure": """Analyze the structure and hierarchy of this content for infographic layout:
+
+{text}
+
+Return JSON with: title, sections (each with heading and points), flow_direction (top-to-bottom, left-to-right, circular)""",
+        
+        "summary": """Create a concise summary of this text suitable for an infographic title and subtitle:
+
+{text}
+
+Return JSON with: title (max 8 words), subtitle (max 15 words), one_sentence_summary"""
+    }
+    
+    EXTRACTION_PROMPTS = {
+        "facts": """Extract the most important factual statements from this text. Return as a JSON array of strings.
+
+Text: {text}
+
+Return only valid JSON array format.""",
+        "statistics": """Extract all numerical data, percentages, and statistics from this text. Return as a JSON array of strings.
+
+Text: {text}
+
+Return only valid JSON array format.""",
+        "quotes": """Extract notable quotes or key statements from this text. Return as a JSON array of strings.
+
+Text: {text}
+
+Return only valid JSON array format.""",
+        "dates": """Extract all dates, time periods, and temporal references from this text. Return as a JSON array of strings.
+
+Text: {text}
+
+Return only valid JSON array format.""",
+        "names": """Extract all proper names (people, places, organizations) from this text. Return as a JSON array of strings.
+
+Text: {text}
+
+Return only valid JSON array format."""
     }
     
+    TEXT_STYLE_INSTRUCTIONS = {
+        "professional": "formal, business-appropriate tone",
+        "casual": "friendly, conversational tone", 
+        "technical": "precise, technical language",
+        "creative": "engaging, creative language"
+    }
+    
+    # Character limits of the infographic text elements
+    TEXT_ELEMENT_MAX_LENGTHS = {
+        "headline": 60,
+        "subtitle": 120,
+        "bullet_point": 80,
+        "caption": 150
+    }
+    
+    # Expected shape of each analysis type's answer in a combined request
+    ANALYSIS_SECTION_SPECS = {
+        "general": "object with keys main_topic, key_points (3-5 most important), "
+                   "supporting_details, visual_suggestions, target_audience",
+        "key_points": "array of the 3-5 most important key points, each a short, impactful statement",
+        "structure": "object with title, sections (each with heading and points), "
+                     "flow_direction (top-to-bottom, left-to-right, circular)",
+        "summary": "object with title (max 8 words), subtitle (max 15 words), one_sentence_summary"
+    }
+    
+    # (model_id, region) pairs that have answered a request in this process
+    _verified_models: ClassVar[Set[Tuple[str, str]]] = set()
+    
     def __init__(
         self,
         model_id: Optional[str] = None,
         region: Optional[str] = None,
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
-        max_retries: int = 3,
+        max_retries: int = 5,
         retry_delay: float = 1.0,
-        request_timeout: int = 30
+        request_timeout: int = 120,
+        outer_retries: int = 0,
+        latency_mode: Optional[str] = None,
+        cache_backend: Optional[AgentCache] = None,
+        cache_max_temperature: float = BEDROCK_CACHE_MAX_TEMPERATURE
     ):
         """
         Initialize BedrockTools with configuration.
@@ -100,88 +502,172 @@ class BedrockTools:
             region: AWS region (defaults to env var BEDROCK_REGION or AWS_REGION)
             aws_access_key_id: AWS access key (defaults to env var)
             aws_secret_access_key: AWS secret key (defaults to env var)
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts for botocore's adaptive retries
             retry_delay: Base delay between retries in seconds
             request_timeout: Request timeout in seconds
+            outer_retries: Extra retries on top of botocore's, with jittered
+                backoff that honors Retry-After (off by default)
+            latency_mode: "optimized" to request the latency-optimized inference
+                tier on models that offer it, "standard" otherwise
+                (defaults to env var BEDROCK_LATENCY_MODE, then "optimized")
+            cache_backend: Response cache with AgentCache's get/set interface
+                (defaults to an in-memory cache shared by all instances)
+            cache_max_temperature: Cache responses to requests at or below this
+                temperature; use a negative value to disable caching
         """
         self.model_id = model_id or os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-5-sonnet-20241022-v2:0")
         self.region = region or os.getenv("BEDROCK_REGION") or os.getenv("AWS_REGION", "us-east-1")
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.request_timeout = request_timeout
+        self.outer_retries = outer_retries
+        self.latency_mode = latency_mode or os.getenv("BEDROCK_LATENCY_MODE", "optimized")
+        self.response_cache = cache_backend if cache_backend is not None else _RESPONSE_CACHE
+        self.cache_max_temperature = cache_max_temperature
         
         # Validate model support
         if self.model_id not in self.SUPPORTED_MODELS:
             logger.warning(f"Model {self.model_id} not in supported models list. Proceeding with default configuration.")
         
-        self.model_config = self.SUPPORTED_MODELS.get(self.model_id, {
-            "provider": "unknown",
-            "max_tokens": 100000,
-            "supports_system": True,
-            "input_format": "anthropic"
-        })
-        
-        # Configure boto3 client with retry settings
-        config = Config(
-            region_name=self.region,
-            retries={
-                'max_attempts': max_retries,
-                'mode': 'adaptive'
-            },
-            read_timeout=request_timeout,
-            connect_timeout=10
+        self.model_config = self.SUPPORTED_MODELS.get(self.model_id, _UNKNOWN_MODEL_CONFIG)
+        
+        # Provider-specific request/response handling, resolved once
+        input_format = self.model_config.input_format
+        self._formatter = _FORMATTERS.get(input_format, _format_default)
+        self._parser = _PARSERS.get(input_format, _parse_default)
+        self._stream_parser = _STREAM_PARSERS.get(input_format, _stream_text_anthropic)
+        
+        # Pre-serialized request bodies per (system prompt, sampling settings)
+        self._body_template = functools.lru_cache(maxsize=32)(self._build_body_template)
+        
+        # Cleared after the first ValidationException so later calls go
+        # straight to the standard tier
+        self._latency_opt_supported = (
+            self.latency_mode == "optimized" and self.model_config.latency_optimized
         )
         
         try:
-            # Initialize Bedrock client with optional credentials
-            session_kwargs = {}
-            if aws_access_key_id and aws_secret_access_key:
-                session_kwargs.update({
-                    'aws_access_key_id': aws_access_key_id,
-                    'aws_secret_access_key': aws_secret_access_key
-                })
-            
-            session = boto3.Session(**session_kwargs)
-            self.bedrock_client = session.client('bedrock-runtime', config=config)
-            
-            # Verify model access
-            self._verify_model_access()
+            # Clients are shared per configuration so instances reuse
+            # credentials and warm HTTPS connections
+            if not (aws_access_key_id and aws_secret_access_key):
+                aws_access_key_id = aws_secret_access_key = None
+            self.bedrock_client = _get_bedrock_client(
+                self.region, aws_access_key_id, aws_secret_access_key, max_retries, request_timeout
+            )
             
         except NoCredentialsError:
             raise BedrockConfigurationError("AWS credentials not found. Please configure AWS credentials.")
         except Exception as e:
             raise BedrockConfigurationError(f"Failed to initialize Bedrock client: {str(e)}")
+        
+        # Explicit credentials (or None) for the clients built on demand
+        self._credentials = (aws_access_key_id, aws_secret_access_key)
+        
+        # Native async client (aioboto3), opened on first use by the *_async
+        # methods and bound to the event loop that opened it
+        self._aio_client = None
+        self._aio_client_stack: Optional[AsyncExitStack] = None
+        self._aio_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # One lock per event loop so concurrent first calls open one client
+        self._aio_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._aio_locks_guard = threading.Lock()
     
-    def _verify_model_access(self) -> None:
-        """Verify that the model is accessible."""
+    def verify_model_access(self) -> None:
+        """
+        Eagerly verify that the model is accessible.
+        
+        Construction no longer probes the model; the first real request
+        raises the same errors instead. Call this to fail fast at startup.
+        The result is remembered per model and region for the process.
+        """
+        if (self.model_id, self.region) in self._verified_models:
+            return
         try:
             # Try a simple invocation to verify access
-            test_payload = self._format_request("Test", max_tokens=10)
-            
-            response = self.bedrock_client.invoke_model(
+            self._call_runtime(
+                self.bedrock_client.invoke_model,
                 modelId=self.model_id,
-                body=json.dumps(test_payload),
+                body=self._request_body("Test", max_tokens=10),
                 contentType='application/json'
             )
             
             logger.info(f"Successfully verified access to Bedrock model: {self.model_id}")
             
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == 'ValidationException':
-                raise BedrockModelNotFoundError(f"Bedrock model '{self.model_id}' not found or not accessible")
-            elif error_code == 'AccessDeniedException':
-                raise BedrockConfigurationError(f"Access denied to Bedrock model '{self.model_id}'")
-            else:
-                logger.warning(f"Could not verify model access: {str(e)}")
+        except BedrockToolsError:
+            raise
         except Exception as e:
             logger.warning(f"Could not verify model access: {str(e)}")
     
+    def _raise_for_model_access(self, error: ClientError) -> None:
+        """
+        Turn a rejected request to a not-yet-verified model into a configuration error.
+        
+        A ValidationException only counts as a missing model when its
+        message names the model; other validation errors (prompt too long,
+        invalid max_tokens, ...) are left to the caller as request errors.
+        """
+        if (self.model_id, self.region) in self._verified_models:
+            return
+        error_code = error.response['Error']['Code']
+        if error_code == 'ValidationException':
+            message = error.response['Error'].get('Message', '')
+            if self.model_id in message or _MODEL_ERROR_RE.search(message):
+                raise BedrockModelNotFoundError(f"Bedrock model '{self.model_id}' not found or not accessible")
+        elif error_code == 'AccessDeniedException':
+            raise BedrockConfigurationError(f"Access denied to Bedrock model '{self.model_id}'")
+    
+    def _call_runtime(self, operation, **params):
+        """
+        Call a bedrock-runtime operation, requesting the latency-optimized tier when enabled.
+        
+        Falls back to the standard tier if the model/region rejects the
+        setting, and remembers that for the lifetime of this instance. The
+        first rejected call to an unverified model raises
+        BedrockModelNotFoundError or BedrockConfigurationError.
+        """
+        response = None
+        if self._latency_opt_supported:
+            try:
+                response = operation(performanceConfigLatency='optimized', **params)
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ValidationException':
+                    self._raise_for_model_access(e)
+                    raise
+                logger.info(f"Latency-optimized inference unavailable for {self.model_id}; using standard tier")
+                self._latency_opt_supported = False
+        if response is None:
+            try:
+                response = operation(**params)
+            except ClientError as e:
+                self._raise_for_model_access(e)
+                raise
+        self._verified_models.add((self.model_id, self.region))
+        return response
+    
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """Jittered, capped backoff; throttling responses may set it via Retry-After."""
+        max_delay = RETRY_CONFIG["max_delay"]
+        if isinstance(error, ClientError) and error.response.get('Error', {}).get('Code') == 'ThrottlingException':
+            headers = error.response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+            try:
+                return min(max_delay, max(0.0, float(headers['retry-after'])))
+            except (KeyError, TypeError, ValueError):
+                pass
+        delay = min(max_delay, self.retry_delay * (RETRY_CONFIG["exponential_base"] ** attempt))
+        return delay * (0.5 + random.random())
+    
     def _retry_operation(self, operation, *args, **kwargs):
-        """Execute operation with exponential backoff retry logic."""
+        """
+        Execute operation, retrying up to ``outer_retries`` times.
+        
+        Transient errors are already retried by botocore's adaptive mode,
+        so the outer loop is off by default to avoid sleeping twice.
+        """
         last_exception = None
         
-        for attempt in range(self.max_retries + 1):
+        for attempt in range(self.outer_retries + 1):
             try:
                 return operation(*args, **kwargs)
             except (ClientError, BotoCoreError) as e:
@@ -202,9 +688,9 @@ class BedrockTools:
                         })
                         raise standardized_error
                 
-                if attempt < self.max_retries:
-                    delay = self.retry_delay * (2 ** attempt)
-                    logger.warning(f"Bedrock operation failed (attempt {attempt + 1}/{self.max_retries + 1}), retrying in {delay}s: {str(e)}")
+                if attempt < self.outer_retries:
+                    delay = self._retry_delay(attempt, e)
+                    logger.warning(f"Bedrock operation failed (attempt {attempt + 1}/{self.outer_retries + 1}), retrying in {delay:.2f}s: {str(e)}")
                     
                     # Log error context for monitoring
                     log_error_context(standardized_error, {
@@ -216,10 +702,10 @@ class BedrockTools:
                     
                     time.sleep(delay)
                 else:
-                    logger.error(f"Bedrock operation failed after {self.max_retries + 1} attempts: {str(e)}")
+                    logger.error(f"Bedrock operation failed after {self.outer_retries + 1} attempts: {str(e)}")
                     log_error_context(standardized_error, {
                         "operation": operation.__name__ if hasattr(operation, '__name__') else str(operation),
-                        "total_attempts": self.max_retries + 1,
+                        "total_attempts": self.outer_retries + 1,
                         "final_failure": True
                     })
         
@@ -232,6 +718,7 @@ class BedrockTools:
         max_tokens: int = 4000,
         temperature: float = 0.7,
         top_p: float = 0.9,
+        prompt_cache: bool = True,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -243,71 +730,67 @@ class BedrockTools:
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
             top_p: Top-p sampling parameter
+            prompt_cache: Mark the system prompt as a prompt-cache checkpoint
+                on models that support it
             **kwargs: Additional model-specific parameters
             
         Returns:
             Formatted request payload
         """
-        provider = self.model_config["provider"]
-        input_format = self.model_config["input_format"]
-        
-        if input_format == "anthropic":
-            # Anthropic Claude format
-            messages = [{"role": "user", "content": prompt}]
-            
-            payload = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": min(max_tokens, self.model_config.get("max_tokens", 200000)),
-                "messages": messages,
-                "temperature": temperature,
-                "top_p": top_p
-            }
-            
-            if system_prompt and self.model_config.get("supports_system", False):
-                payload["system"] = system_prompt
-                
-        elif input_format == "titan":
-            # Amazon Titan format
-            payload = {
-                "inputText": f"{system_prompt}\n\n{prompt}" if system_prompt else prompt,
-                "textGenerationConfig": {
-                    "maxTokenCount": min(max_tokens, self.model_config.get("max_tokens", 32000)),
-                    "temperature": temperature,
-                    "topP": top_p
-                }
-            }
-            
-        elif input_format == "nova_canvas":
-            # Amazon Nova Canvas format (for image generation)
-            payload = {
-                "taskType": "TEXT_IMAGE",
-                "textToImageParams": {
-                    "text": prompt,
-                    "negativeText": kwargs.get("negative_prompt", ""),
-                },
-                "imageGenerationConfig": {
-                    "numberOfImages": kwargs.get("number_of_images", 1),
-                    "height": kwargs.get("height", 1024),
-                    "width": kwargs.get("width", 1024),
-                    "cfgScale": kwargs.get("cfg_scale", 8.0),
-                    "seed": kwargs.get("seed", 0)
-                }
-            }
-            
-        else:
-            # Default/unknown format - use Anthropic-style
-            messages = [{"role": "user", "content": prompt}]
-            payload = {
-                "max_tokens": max_tokens,
-                "messages": messages,
-                "temperature": temperature,
-                "top_p": top_p
-            }
-            
-            if system_prompt:
-                payload["system"] = system_prompt
+        return self._formatter(
+            self.model_config, prompt, system_prompt, max_tokens, temperature, top_p, prompt_cache, **kwargs
+        )
+    
+    def _request_body(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        prompt_cache: bool = True,
+        **kwargs
+    ) -> bytes:
+        """
+        Serialize the request payload for ``prompt`` to JSON bytes.
         
-        return payload
+        Anthropic requests splice the JSON-encoded prompt into a cached,
+        pre-serialized body for the remaining fields, which repeat across
+        calls. Other formats are built with _format_request and encoded
+        in full. Arguments are as for _format_request.
+        """
+        if self.model_config.input_format != "anthropic" or kwargs:
+            return dumps_bytes(self._format_request(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                prompt_cache=prompt_cache,
+                **kwargs
+            ), indent=False)
+        head, tail = self._body_template(system_prompt, max_tokens, temperature, top_p, prompt_cache)
+        return head + dumps_bytes(prompt, indent=False) + tail
+    
+    def _build_body_template(
+        self,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        top_p: float,
+        prompt_cache: bool
+    ) -> Tuple[bytes, bytes]:
+        """Serialize a request around a placeholder prompt and split it there."""
+        payload = self._format_request(
+            prompt=_PROMPT_PLACEHOLDER,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            prompt_cache=prompt_cache
+        )
+        head, tail = dumps_bytes(payload, indent=False).split(_PROMPT_PLACEHOLDER_JSON, 1)
+        return head, tail
     
     def _parse_response(self, response_body: Dict[str, Any]) -> str:
         """
@@ -319,37 +802,19 @@ class BedrockTools:
         Returns:
             Extracted text content
         """
-        provider = self.model_config["provider"]
-        input_format = self.model_config["input_format"]
-        
-        if input_format == "anthropic":
-            # Anthropic Claude response format
-            if "content" in response_body and response_body["content"]:
-                return response_body["content"][0]["text"]
-            
-        elif input_format == "titan":
-            # Amazon Titan response format
-            if "results" in response_body and response_body["results"]:
-                return response_body["results"][0]["outputText"]
-                
-        elif input_format == "nova_canvas":
-            # Nova Canvas returns image data, not text
-            if "images" in response_body:
-                return response_body["images"]
-        
-        # Fallback - try common response fields
-        for field in ["content", "text", "output", "response"]:
-            if field in response_body:
-                content = response_body[field]
-                if isinstance(content, list) and content:
-                    return content[0].get("text", str(content[0]))
-                elif isinstance(content, str):
-                    return content
-        
-        # Last resort - return the whole response as string
-        return str(response_body)
+        parsed = self._parser(response_body)
+        if parsed is not None:
+            return parsed
+        return _parse_fallback(response_body)
+    
+    def _response_cache_key(self, prompt, system_prompt, max_tokens, temperature, top_p, kwargs) -> Optional[str]:
+        """Response-cache key for a request, or None if it is too random to cache."""
+        if temperature > self.cache_max_temperature:
+            return None
+        return AgentCache.make_key(
+            self.model_id, prompt, system_prompt, max_tokens, temperature, top_p, kwargs
+        )
     
-    @with_error_handling(circuit_breaker_name="bedrock_invoke", fallback_category=ErrorCategory.AWS_SERVICE)
     def invoke_model(
         self,
         prompt: str,
@@ -357,17 +822,28 @@ class BedrockTools:
         max_tokens: int = 4000,
         temperature: float = 0.7,
         top_p: float = 0.9,
+        stream: bool = False,
+        prompt_cache: bool = True,
         **kwargs
     ) -> str:
         """
         Invoke a Bedrock model with the given prompt.
         
+        Responses to requests at or below ``cache_max_temperature`` are
+        cached and reused for identical requests. Cache hits return before
+        the error-handling and circuit-breaker layer, which only wraps
+        requests that reach Bedrock.
+        
         Args:
             prompt: User prompt text
             system_prompt: System prompt (if supported by model)
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0 to 1.0)
             top_p: Top-p sampling parameter (0.0 to 1.0)
+            stream: Receive the response with InvokeModelWithResponseStream
+                (text models only); the return value is the same
+            prompt_cache: Let Bedrock cache the system prompt prefix on models
+                that support prompt caching; responses are unaffected
             **kwargs: Additional model-specific parameters
             
         Returns:
@@ -375,78 +851,102 @@ class BedrockTools:
             
         Raises:
             BedrockInvocationError: If model invocation fails
+            BedrockModelNotFoundError: If the model is not available (not retried)
+            BedrockConfigurationError: If access to the model is denied (not retried)
         """
+        cache_key = self._response_cache_key(prompt, system_prompt, max_tokens, temperature, top_p, kwargs)
+        if cache_key is not None:
+            hit, cached = self.response_cache.get(cache_key)
+            if hit:
+                logger.debug(f"Bedrock response cache hit for model {self.model_id}")
+                return cached
+        
+        result = self._invoke_uncached(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            stream=stream,
+            prompt_cache=prompt_cache,
+            **kwargs
+        )
+        if cache_key is not None and result:
+            self.response_cache.set(cache_key, result)
+        return result
+    
+    @with_error_handling(circuit_breaker_name="bedrock_invoke", fallback_category=ErrorCategory.AWS_SERVICE)
+    def _invoke_uncached(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        top_p: float,
+        stream: bool,
+        prompt_cache: bool = True,
+        **kwargs
+    ) -> str:
+        """Send one invocation to Bedrock; see invoke_model for the arguments."""
+        if stream and self.model_config.input_format != "nova_canvas":
+            return "".join(self.invoke_model_stream(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                prompt_cache=prompt_cache,
+                **kwargs
+            ))
+        
         try:
             logger.info(f"Invoking Bedrock model {self.model_id}")
             
             # Format request payload
-            payload = self._format_request(
+            body = self._request_body(
                 prompt=prompt,
                 system_prompt=system_prompt,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 top_p=top_p,
+                prompt_cache=prompt_cache,
                 **kwargs
             )
             
             def _invoke():
-                return self.bedrock_client.invoke_model(
+                return self._call_runtime(
+                    self.bedrock_client.invoke_model,
                     modelId=self.model_id,
-                    body=json.dumps(payload),
+                    body=body,
                     contentType='application/json'
                 )
             
             # Execute with retry logic
             response = self._retry_operation(_invoke)
 
-            # Robustly extract bytes/text from response['body'] which may be
-            # a StreamingBody, bytes, str, or file-like object depending on SDK
+            # response['body'] may be a StreamingBody, bytes, str, or an
+            # already-decoded object depending on SDK; each goes to the
+            # parser as-is, without re-encoding
             raw_body = response.get('body') if isinstance(response, dict) else None
 
-            raw_bytes = b''
             try:
                 if hasattr(raw_body, 'read'):
                     # botocore.streaming.StreamingBody
-                    raw_bytes = raw_body.read()
-                elif isinstance(raw_body, (bytes, bytearray)):
-                    raw_bytes = bytes(raw_body)
-                elif isinstance(raw_body, str):
-                    raw_bytes = raw_body.encode('utf-8')
+                    result = self._decode_body(raw_body.read())
+                elif isinstance(raw_body, (bytes, bytearray, str)):
+                    result = self._decode_body(raw_body)
                 else:
-                    # Some clients return the full dict or string in response
-                    # Try to stringify the body
-                    raw_bytes = json.dumps(raw_body or {}).encode('utf-8')
-            except Exception:
-                # As a last resort, try to convert the whole response to str
-                try:
-                    raw_bytes = str(response).encode('utf-8')
-                except Exception:
-                    raw_bytes = b''
-
-            # Try to decode bytes as text
-            text = None
-            try:
-                text = raw_bytes.decode('utf-8') if raw_bytes else None
+                    # Some clients return the parsed response itself
+                    result = self._parse_response(raw_body or {})
             except Exception:
-                text = None
-
-            # If provider returns binary image data (nova_canvas), return bytes
-            if text is None or text == '':
-                # No text available; return raw bytes
-                logger.info("Bedrock returned binary data (non-text). Returning raw bytes")
-                return raw_bytes
-
-            # Try parse JSON text into python object
-            try:
-                response_body = json.loads(text)
-                result = self._parse_response(response_body)
-            except json.JSONDecodeError:
-                # Not JSON; treat as plain text
-                result = text
+                # As a last resort, fall back to the whole response as text
+                result = self._decode_body(str(response))
 
             logger.info(f"Successfully invoked model {self.model_id}")
             return result
             
+        except (BedrockModelNotFoundError, BedrockConfigurationError):
+            raise
         except Exception as e:
             error = handle_aws_service_error("Bedrock", e)
             log_error_context(error, {
@@ -457,74 +957,162 @@ class BedrockTools:
             })
             raise BedrockInvocationError(f"Failed to invoke Bedrock model: {str(e)}")
     
-    def analyze_content(
-        self,
-        text: str,
-        analysis_type: str = "general"
-    ) -> Dict[str, Any]:
+    def _decode_body(self, raw_bytes: Union[bytes, bytearray, str]) -> Union[str, bytes, Any]:
         """
-        Analyze content using Bedrock for infographic generation.
+        Turn a response body into generated text, or raw bytes for binary output.
         
-        Args:
-            text: Text content to analyze
-            analysis_type: Type of analysis ("general", "key_points", "structure", "summary")
-            
-        Returns:
-            Dictionary containing analysis results
-            
-        Raises:
-            BedrockInvocationError: If content analysis fails
+        The body is handed to the JSON parser as it is; bytes are only
+        decoded as text when they are not JSON.
         """
-        analysis_prompts = {
-            "general": """Analyze the following text for creating an infographic. Extract:
-1. Main topic/title
-2. Key points (3-5 most important)
-3. Supporting details
-4. Suggested visual elements
-5. Target audience
+        # No body at all; return it unchanged
+        if not raw_bytes:
+            logger.info("Bedrock returned binary data (non-text). Returning raw bytes")
+            return raw_bytes
 
-Text: {text}
+        # Parse the bytes directly; JSON bodies are the common case
+        try:
+            return self._parse_response(loads(raw_bytes))
+        except ValueError:
+            # JSONDecodeError, or UnicodeDecodeError from the stdlib fallback
+            pass
 
-Respond in JSON format with keys: main_topic, key_points, supporting_details, visual_suggestions, target_audience""",
-            
-            "key_points": """Extract the 3-5 most important key points from this text for an infographic:
+        if isinstance(raw_bytes, str):
+            return raw_bytes
 
-{text}
+        # Image models return binary data; don't try to decode it as text
+        if self.model_config.input_format == "nova_canvas":
+            return raw_bytes
 
-Return only a JSON array of key points, each as a short, impactful statement.""",
+        # Not JSON; treat as plain text, or binary data if it is not UTF-8
+        try:
+            return raw_bytes.decode('utf-8')
+        except UnicodeDecodeError:
+            logger.info("Bedrock returned binary data (non-text). Returning raw bytes")
+            return raw_bytes
+    
+    def _parse_stream_chunk(self, chunk: Dict[str, Any]) -> Optional[str]:
+        """
+        Extract generated text from one decoded response-stream chunk.
+        
+        Args:
+            chunk: Decoded ``chunk['bytes']`` payload of a stream event
             
-            "structure": """Analyze the structure and hierarchy of this content for infographic layout:
-
-{text}
-
-Return JSON with: title, sections (each with heading and points), flow_direction (top-to-bottom, left-to-right, circular)""",
+        Returns:
+            Text delta, or None for chunks that carry no text
+        """
+        return self._stream_parser(chunk)
+    
+    def invoke_model_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        prompt_cache: bool = True,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Invoke a Bedrock model and yield the generated text as it arrives.
+        
+        Args:
+            prompt: User prompt text
+            system_prompt: System prompt (if supported by model)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0 to 1.0)
+            top_p: Top-p sampling parameter (0.0 to 1.0)
+            prompt_cache: As for invoke_model
+            **kwargs: Additional model-specific parameters
             
-            "summary": """Create a concise summary of this text suitable for an infographic title and subtitle:
-
-{text}
-
-Return JSON with: title (max 8 words), subtitle (max 15 words), one_sentence_summary"""
-        }
+        Yields:
+            Text deltas in generation order
+            
+        Raises:
+            BedrockInvocationError: If model invocation fails
+        """
+        logger.info(f"Invoking Bedrock model {self.model_id} with response streaming")
         
-        if analysis_type not in analysis_prompts:
-            raise BedrockInvocationError(f"Unknown analysis type: {analysis_type}")
+        body = self._request_body(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            prompt_cache=prompt_cache,
+            **kwargs
+        )
         
-        prompt = analysis_prompts[analysis_type].format(text=text)
+        def _invoke_stream():
+            return self._call_runtime(
+                self.bedrock_client.invoke_model_with_response_stream,
+                modelId=self.model_id,
+                body=body,
+                contentType='application/json'
+            )
         
-        system_prompt = """You are an expert content analyst specializing in creating infographics. 
-Always respond with valid JSON format. Be concise and focus on visual communication."""
+        try:
+            # Only opening the stream is retried; a stream that fails midway
+            # has already yielded text to the caller
+            response = self._retry_operation(_invoke_stream)
+            for event in response['body']:
+                chunk = event.get('chunk')
+                if chunk is None:
+                    # Error events (throttling, model timeout, ...) carry a message
+                    error_name = next(iter(event), 'unknown')
+                    raise BedrockInvocationError(f"Bedrock stream error {error_name}: {event[error_name]}")
+                text = self._stream_parser(loads(chunk['bytes']))
+                if text:
+                    yield text
+        except BedrockToolsError:
+            raise
+        except Exception as e:
+            error = handle_aws_service_error("Bedrock", e)
+            log_error_context(error, {
+                "model_id": self.model_id,
+                "prompt_length": len(prompt),
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "stream": True
+            })
+            raise BedrockInvocationError(f"Failed to invoke Bedrock model: {str(e)}")
+    
+    def analyze_content(
+        self,
+        text: str,
+        analysis_type: str = "general",
+        stream: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Analyze content using Bedrock for infographic generation.
+        
+        Args:
+            text: Text content to analyze
+            analysis_type: Type of analysis ("general", "key_points", "structure", "summary")
+            stream: Receive the model response as a stream (see invoke_model)
+            
+        Returns:
+            Dictionary containing analysis results
+            
+        Raises:
+            BedrockInvocationError: If content analysis fails
+        """
+        if analysis_type not in self.ANALYSIS_PROMPTS:
+            raise BedrockInvocationError(f"Unknown analysis type: {analysis_type}")
+        
+        prompt = self.ANALYSIS_PROMPTS[analysis_type].replace("{text}", text)
         
         try:
             response = self.invoke_model(
                 prompt=prompt,
-                system_prompt=system_prompt,
+                system_prompt=self.ANALYSIS_SYSTEM_PROMPT,
                 temperature=0.3,  # Lower temperature for more consistent analysis
-                max_tokens=2000
+                max_tokens=2000,
+                stream=stream
             )
             
             # Try to parse as JSON
             try:
-                return json.loads(response)
+                return loads(response)
             except json.JSONDecodeError:
                 # If JSON parsing fails, return structured response
                 return {
@@ -536,12 +1124,292 @@ Always respond with valid JSON format. Be concise and focus on visual communicat
         except Exception as e:
             raise BedrockInvocationError(f"Content analysis failed: {str(e)}")
 
-    async def invoke_model_async(self, *args, **kwargs) -> str:
-        """Async wrapper around invoke_model using threadpool to avoid blocking.
+    def analyze_content_multi(
+        self,
+        text: str,
+        analysis_types: Optional[List[str]] = None,
+        stream: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run several analysis types over the same text in one Bedrock request.
+        
+        The text is sent once and the model answers with one JSON object
+        keyed by analysis type. Types missing from an unparseable or
+        incomplete answer are retried individually with analyze_content.
+        
+        Args:
+            text: Text content to analyze
+            analysis_types: Analysis types to run (defaults to all of
+                "general", "key_points", "structure", "summary")
+            stream: Receive the model response as a stream (see invoke_model)
+            
+        Returns:
+            Dictionary mapping each analysis type to its result
+            
+        Raises:
+            BedrockInvocationError: If content analysis fails
+        """
+        analysis_types = list(analysis_types or self.ANALYSIS_SECTION_SPECS)
+        prompt = self._multi_analysis_prompt(text, analysis_types)
+        
+        try:
+            response = self.invoke_model(
+                prompt=prompt,
+                system_prompt=self.ANALYSIS_SYSTEM_PROMPT,
+                temperature=0.3,  # Lower temperature for more consistent analysis
+                max_tokens=2000 * len(analysis_types),
+                stream=stream
+            )
+        except Exception as e:
+            raise BedrockInvocationError(f"Content analysis failed: {str(e)}")
+        
+        parsed = self._parse_multi_analysis(response)
+        if not parsed:
+            logger.warning("Combined analysis response was not a JSON object; falling back to per-type requests")
+        
+        results = {}
+        for analysis_type in analysis_types:
+            if analysis_type in parsed:
+                results[analysis_type] = parsed[analysis_type]
+            else:
+                results[analysis_type] = self.analyze_content(text, analysis_type, stream=stream)
+        return results
+    
+    def _multi_analysis_prompt(self, text: str, analysis_types: List[str]) -> str:
+        """Prompt asking for several analysis types in one JSON object."""
+        unknown = [t for t in analysis_types if t not in self.ANALYSIS_SECTION_SPECS]
+        if unknown:
+            raise BedrockInvocationError(f"Unknown analysis type: {unknown[0]}")
+        
+        sections = "\n".join(
+            f'- "{analysis_type}": {self.ANALYSIS_SECTION_SPECS[analysis_type]}'
+            for analysis_type in analysis_types
+        )
+        return f"""Analyze the following text for creating an infographic.
 
-        This is useful for calling Bedrock from async code (e.g., Strands tools).
+Return a single JSON object with exactly these top-level keys:
+{sections}
+
+Text: {text}"""
+    
+    @staticmethod
+    def _parse_multi_analysis(response: Any) -> Dict[str, Any]:
+        """Parse a combined analysis answer; anything but a JSON object gives {}."""
+        try:
+            parsed = loads(response)
+        except (TypeError, json.JSONDecodeError):
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+
+    async def _get_aio_client(self):
+        """Return the aioboto3 bedrock-runtime client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._aio_client is not None and self._aio_client_loop is loop:
+            return self._aio_client
+        with self._aio_locks_guard:
+            lock = self._aio_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            if self._aio_client is None or self._aio_client_loop is not loop:
+                # aiohttp connection pools belong to the loop that created
+                # them, so a client opened on another loop is closed first
+                await self.aclose()
+                stack = AsyncExitStack()
+                session = _get_aio_session(*self._credentials)
+                self._aio_client = await stack.enter_async_context(session.client(
+                    'bedrock-runtime',
+                    config=_client_config(self.region, self.max_retries, self.request_timeout)
+                ))
+                self._aio_client_stack = stack
+                self._aio_client_loop = loop
+        return self._aio_client
+    
+    async def aclose(self) -> None:
+        """Close the native async client, if one was opened."""
+        stack, self._aio_client_stack = self._aio_client_stack, None
+        loop, self._aio_client_loop = self._aio_client_loop, None
+        self._aio_client = None
+        if stack is None:
+            return
+        try:
+            await stack.aclose()
+        except Exception as e:
+            if loop is asyncio.get_running_loop():
+                raise
+            # The loop that opened the client may already be closed
+            logger.debug(f"Could not close Bedrock async client from its previous event loop: {str(e)}")
+    
+    async def _call_runtime_async(self, operation_name: str, **params):
+        """Async counterpart of _call_runtime, behind the same "bedrock_invoke" circuit breaker as invoke_model."""
+        breaker = get_error_handler().get_circuit_breaker("bedrock_invoke")
+        if breaker is None:
+            return await self._call_runtime_async_with_retries(operation_name, **params)
+        return await breaker.call_async(self._call_runtime_async_with_retries, operation_name, **params)
+    
+    async def _call_runtime_async_with_retries(self, operation_name: str, **params):
+        """Call a bedrock-runtime operation on the async client with the outer retries."""
+        client = await self._get_aio_client()
+        operation = getattr(client, operation_name)
+        for attempt in range(self.outer_retries + 1):
+            try:
+                if self._latency_opt_supported:
+                    try:
+                        response = await operation(performanceConfigLatency='optimized', **params)
+                    except ClientError as e:
+                        if e.response['Error']['Code'] != 'ValidationException':
+                            raise
+                        logger.info(f"Latency-optimized inference unavailable for {self.model_id}; using standard tier")
+                        self._latency_opt_supported = False
+                        response = await operation(**params)
+                else:
+                    response = await operation(**params)
+            except (ClientError, BotoCoreError) as e:
+                if isinstance(e, ClientError):
+                    self._raise_for_model_access(e)
+                    if e.response['Error']['Code'] in ['ValidationException', 'AccessDeniedException']:
+                        raise
+                if attempt >= self.outer_retries:
+                    raise
+                delay = self._retry_delay(attempt, e)
+                logger.warning(f"Bedrock operation failed (attempt {attempt + 1}/{self.outer_retries + 1}), retrying in {delay:.2f}s: {str(e)}")
+                await asyncio.sleep(delay)
+            else:
+                self._verified_models.add((self.model_id, self.region))
+                return response
+    
+    async def invoke_model_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        stream: bool = False,
+        prompt_cache: bool = True,
+        **kwargs
+    ) -> str:
+        """
+        Async version of invoke_model.
+        
+        Uses a native aioboto3 client when aioboto3 is installed, so
+        concurrent calls share one event loop and connection pool instead
+        of a thread each; otherwise runs invoke_model in a worker thread.
+        Arguments, caching and return value are as for invoke_model.
+        """
+        if aioboto3 is None:
+            return await asyncio.to_thread(
+                self.invoke_model, prompt, system_prompt, max_tokens, temperature, top_p, stream,
+                prompt_cache=prompt_cache, **kwargs
+            )
+        
+        cache_key = self._response_cache_key(prompt, system_prompt, max_tokens, temperature, top_p, kwargs)
+        if cache_key is not None:
+            hit, cached = self.response_cache.get(cache_key)
+            if hit:
+                logger.debug(f"Bedrock response cache hit for model {self.model_id}")
+                return cached
+        
+        request = dict(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            prompt_cache=prompt_cache,
+            **kwargs
+        )
+        if stream and self.model_config.input_format != "nova_canvas":
+            result = "".join([text async for text in self.invoke_model_stream_async(**request)])
+        else:
+            try:
+                logger.info(f"Invoking Bedrock model {self.model_id} (async)")
+                response = await self._call_runtime_async(
+                    'invoke_model',
+                    modelId=self.model_id,
+                    body=self._request_body(**request),
+                    contentType='application/json'
+                )
+                result = self._decode_body(await response['body'].read())
+            except BedrockToolsError:
+                raise
+            except Exception as e:
+                error = handle_aws_service_error("Bedrock", e)
+                log_error_context(error, {
+                    "model_id": self.model_id,
+                    "prompt_length": len(prompt),
+                    "max_tokens": max_tokens,
+                    "temperature": temperature
+                })
+                raise BedrockInvocationError(f"Failed to invoke Bedrock model: {str(e)}")
+        
+        if cache_key is not None and result:
+            self.response_cache.set(cache_key, result)
+        return result
+    
+    async def invoke_model_stream_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        prompt_cache: bool = True,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Async version of invoke_model_stream.
+        
+        Requires aioboto3; otherwise the stream is read in a worker thread.
+        
+        Yields:
+            Text deltas in generation order
+            
+        Raises:
+            BedrockInvocationError: If model invocation fails
         """
-        return await asyncio.to_thread(self.invoke_model, *args, **kwargs)
+        request = dict(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            prompt_cache=prompt_cache,
+            **kwargs
+        )
+        if aioboto3 is None:
+            stream = self.invoke_model_stream(**request)
+            done = object()
+            while (text := await asyncio.to_thread(next, stream, done)) is not done:
+                yield text
+            return
+        
+        try:
+            logger.info(f"Invoking Bedrock model {self.model_id} with response streaming (async)")
+            response = await self._call_runtime_async(
+                'invoke_model_with_response_stream',
+                modelId=self.model_id,
+                body=self._request_body(**request),
+                contentType='application/json'
+            )
+            async for event in response['body']:
+                chunk = event.get('chunk')
+                if chunk is None:
+                    error_name = next(iter(event), 'unknown')
+                    raise BedrockInvocationError(f"Bedrock stream error {error_name}: {event[error_name]}")
+                text = self._stream_parser(loads(chunk['bytes']))
+                if text:
+                    yield text
+        except BedrockToolsError:
+            raise
+        except Exception as e:
+            error = handle_aws_service_error("Bedrock", e)
+            log_error_context(error, {
+                "model_id": self.model_id,
+                "prompt_length": len(prompt),
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "stream": True
+            })
+            raise BedrockInvocationError(f"Failed to invoke Bedrock model: {str(e)}")
     
     def generate_image_prompt(
         self,
@@ -594,7 +1462,9 @@ Layout: Well-organized hierarchy with clear visual flow"""
         topic: str,
         content_type: str = "headline",
         style: str = "professional",
-        max_length: int = 100
+        max_length: int = 100,
+        stream: bool = False,
+        temperature: float = 0.7
     ) -> str:
         """
         Generate text content for infographic elements.
@@ -604,17 +1474,14 @@ Layout: Well-organized hierarchy with clear visual flow"""
             content_type: Type of content ("headline", "subtitle", "bullet_point", "caption")
             style: Writing style ("professional", "casual", "technical", "creative")
             max_length: Maximum character length
+            stream: Receive the model response as a stream (see invoke_model)
+            temperature: Sampling temperature; at or below
+                ``cache_max_temperature`` repeated calls are served from
+                the response cache
             
         Returns:
             Generated text content
         """
-        style_instructions = {
-            "professional": "formal, business-appropriate tone",
-            "casual": "friendly, conversational tone", 
-            "technical": "precise, technical language",
-            "creative": "engaging, creative language"
-        }
-        
         content_instructions = {
             "headline": f"Create a compelling headline (max {max_length} characters)",
             "subtitle": f"Create a descriptive subtitle (max {max_length} characters)",
@@ -626,7 +1493,7 @@ Layout: Well-organized hierarchy with clear visual flow"""
         
 Requirements:
 - {content_instructions.get(content_type, 'Create appropriate text')}
-- Use {style_instructions.get(style, 'professional')}
+- Use {self.TEXT_STYLE_INSTRUCTIONS.get(style, 'professional')}
 - Maximum {max_length} characters
 - Suitable for infographic display
 - Clear and impactful
@@ -636,19 +1503,184 @@ Return only the text content, no additional formatting or explanation."""
         try:
             response = self.invoke_model(
                 prompt=prompt,
-                temperature=0.7,
-                max_tokens=200
+                temperature=temperature,
+                max_tokens=200,
+                stream=stream
             )
             
-            # Clean up response and ensure length limit
-            cleaned_response = response.strip().strip('"').strip("'")
-            if len(cleaned_response) > max_length:
-                cleaned_response = cleaned_response[:max_length-3] + "..."
+            return self._clean_text(response, max_length)
             
-            return cleaned_response
+        except Exception as e:
+            raise BedrockInvocationError(f"Text generation failed: {str(e)}")
+    
+    def generate_bullets(
+        self,
+        topic: str,
+        style: str = "professional",
+        n: int = 3,
+        max_length: int = 80,
+        temperature: float = 0.7
+    ) -> List[str]:
+        """
+        Generate several bullet points about a topic in one Bedrock request.
+        
+        Args:
+            topic: Main topic or theme
+            style: Writing style ("professional", "casual", "technical", "creative")
+            n: Number of bullet points to request
+            max_length: Maximum character length of each bullet point
+            temperature: Sampling temperature
             
+        Returns:
+            Up to ``n`` bullet points; fewer if the model returned fewer lines
+        """
+        prompt = f"""Produce exactly {n} bullet points about "{topic}".
+        
+Requirements:
+- Use {self.TEXT_STYLE_INSTRUCTIONS.get(style, 'professional')}
+- Maximum {max_length} characters each
+- Suitable for infographic display
+- One bullet point per line, no numbering
+
+Return only the bullet points, no additional formatting or explanation."""
+        
+        try:
+            response = self.invoke_model(
+                prompt=prompt,
+                temperature=temperature,
+                max_tokens=60 * n
+            )
         except Exception as e:
             raise BedrockInvocationError(f"Text generation failed: {str(e)}")
+        
+        bullets = []
+        for line in response.splitlines():
+            bullet = self._clean_text(_BULLET_MARKER_RE.sub("", line), max_length)
+            if bullet:
+                bullets.append(bullet)
+        return bullets[:n]
+    
+    @staticmethod
+    def _clean_text(text: str, max_length: int) -> str:
+        """Strip quotes and whitespace and enforce the length limit."""
+        cleaned = text.strip().strip('"').strip("'")
+        if len(cleaned) > max_length:
+            cleaned = cleaned[:max_length-3] + "..."
+        return cleaned
+    
+    def generate_infographic_bundle(
+        self,
+        topic: str,
+        style: str = "professional",
+        temperature: float = 0.7
+    ) -> Dict[str, Any]:
+        """
+        Generate all text elements of an infographic in one Bedrock request.
+        
+        The model returns headline, subtitle, bullet_points and caption as
+        one JSON object. Elements missing from the answer, or all of them if
+        the combined request fails, are generated separately and concurrently
+        (missing bullet points together with generate_bullets, the rest with
+        generate_text_content); an element that still fails gets fallback
+        text and is reported under ``error``.
+        
+        Args:
+            topic: Main topic for the infographic
+            style: Writing style ("professional", "casual", "technical", "creative")
+            temperature: Sampling temperature; at or below
+                ``cache_max_temperature`` (e.g. 0 for reproducible output)
+                identical calls are answered from the response cache
+            
+        Returns:
+            Dictionary with headline, subtitle, bullet_points and caption
+        """
+        limits = self.TEXT_ELEMENT_MAX_LENGTHS
+        prompt = f"""Write the text for an infographic about "{topic}".
+
+Use {self.TEXT_STYLE_INSTRUCTIONS.get(style, 'professional')}. The text must be clear, impactful and suitable for infographic display.
+
+Return only a JSON object with exactly these keys:
+- "headline": a compelling headline (max {limits['headline']} characters)
+- "subtitle": a descriptive subtitle (max {limits['subtitle']} characters)
+- "bullet_points": an array of 3 concise bullet points (max {limits['bullet_point']} characters each)
+- "caption": an informative caption (max {limits['caption']} characters)"""
+        
+        try:
+            response = self.invoke_model(
+                prompt=prompt,
+                temperature=temperature,
+                max_tokens=600
+            )
+            parsed = self._parse_json_object(response)
+        except Exception as e:
+            logger.warning(f"Combined text request failed: {str(e)}")
+            parsed = {}
+        
+        raw_bullets = parsed.get("bullet_points")
+        bullets = [b for b in raw_bullets if isinstance(b, str)] if isinstance(raw_bullets, list) else []
+        
+        requests = _infographic_content_requests(topic, style)
+        outcomes: List[Any] = [None] * len(requests)
+        missing = []
+        for index, (field, args) in enumerate(requests):
+            if field == "bullet_points":
+                value = bullets.pop(0) if bullets else None
+            else:
+                value = parsed.get(field)
+            if isinstance(value, str) and value.strip():
+                outcomes[index] = self._clean_text(value, args[3])
+            else:
+                missing.append(index)
+        
+        if missing:
+            logger.warning(f"Combined text response lacked {len(missing)} element(s); generating them individually")
+            missing_bullets = [index for index in missing if requests[index][0] == "bullet_points"]
+            others = [index for index in missing if index not in missing_bullets]
+            with ThreadPoolExecutor(max_workers=len(others) + 1) as executor:
+                futures = {
+                    index: executor.submit(
+                        self.generate_text_content, *requests[index][1], temperature=temperature
+                    )
+                    for index in others
+                }
+                if missing_bullets:
+                    bullets_future = executor.submit(
+                        self.generate_bullets, topic, style, len(missing_bullets),
+                        self.TEXT_ELEMENT_MAX_LENGTHS["bullet_point"], temperature
+                    )
+                for index, future in futures.items():
+                    try:
+                        outcomes[index] = future.result()
+                    except Exception as e:
+                        outcomes[index] = e
+                if missing_bullets:
+                    try:
+                        generated = bullets_future.result()
+                    except Exception as e:
+                        generated = []
+                        shortfall = e
+                    else:
+                        shortfall = BedrockInvocationError(
+                            f"Text generation returned {len(generated)} of {len(missing_bullets)} bullet points"
+                        )
+                    for index in missing_bullets:
+                        outcomes[index] = generated.pop(0) if generated else shortfall
+        
+        return _collect_infographic_content(topic, [field for field, _ in requests], outcomes)
+    
+    @staticmethod
+    def _parse_json_object(response: Any) -> Dict[str, Any]:
+        """Parse the first JSON object in a model answer; anything else gives {}."""
+        if not isinstance(response, str):
+            return {}
+        match = _JSON_OBJECT_RE.search(response)
+        if match is None:
+            return {}
+        try:
+            parsed = loads(match.group(0))
+        except json.JSONDecodeError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
     
     def extract_key_information(
         self,
@@ -665,22 +1697,10 @@ Return only the text content, no additional formatting or explanation."""
         Returns:
             List of extracted information items
         """
-        extraction_prompts = {
-            "facts": "Extract the most important factual statements from this text. Return as a JSON array of strings.",
-            "statistics": "Extract all numerical data, percentages, and statistics from this text. Return as a JSON array of strings.",
-            "quotes": "Extract notable quotes or key statements from this text. Return as a JSON array of strings.",
-            "dates": "Extract all dates, time periods, and temporal references from this text. Return as a JSON array of strings.",
-            "names": "Extract all proper names (people, places, organizations) from this text. Return as a JSON array of strings."
-        }
-        
-        if info_type not in extraction_prompts:
+        if info_type not in self.EXTRACTION_PROMPTS:
             raise BedrockInvocationError(f"Unknown information type: {info_type}")
         
-        prompt = f"""{extraction_prompts[info_type]}
-
-Text: {text}
-
-Return only valid JSON array format."""
+        prompt = self.EXTRACTION_PROMPTS[info_type].replace("{text}", text)
         
         try:
             response = self.invoke_model(
@@ -689,17 +1709,167 @@ Return only valid JSON array format."""
                 max_tokens=1000
             )
             
-            # Try to parse as JSON array
-            try:
-                return json.loads(response)
-            except json.JSONDecodeError:
-                # Fallback: split by lines and clean up
-                lines = [line.strip() for line in response.split('\n') if line.strip()]
-                return [line.lstrip('- ').strip('"').strip("'") for line in lines if line]
+            return self._parse_extraction(response)
                 
         except Exception as e:
             raise BedrockInvocationError(f"Information extraction failed: {str(e)}")
     
+    @staticmethod
+    def _parse_extraction(response: str) -> List[str]:
+        """Parse an extraction answer as a JSON array, or one item per line."""
+        # Try to parse as JSON array
+        try:
+            return loads(response)
+        except json.JSONDecodeError:
+            # Fallback: split by lines and clean up
+            lines = [line.strip() for line in response.split('\n') if line.strip()]
+            return [line.lstrip('- ').strip('"').strip("'") for line in lines if line]
+    
+    def run_batch_inference(
+        self,
+        requests: List[Dict[str, Any]],
+        s3_tools=None,
+        role_arn: Optional[str] = None,
+        poll_interval: float = BEDROCK_BATCH_POLL_INTERVAL,
+        timeout: float = BEDROCK_BATCH_TIMEOUT
+    ) -> List[Optional[str]]:
+        """
+        Run many invocations as one Bedrock batch inference job.
+        
+        The formatted requests are written to S3 as JSONL, a model
+        invocation job is created over them, and the call blocks until the
+        job finishes. Batch jobs are queued and billed at a discount, and
+        can take minutes to hours; use them for bulk work only.
+        
+        Args:
+            requests: Keyword arguments for _format_request, one dict per
+                invocation (prompt, system_prompt, max_tokens, ...)
+            s3_tools: S3Tools for the job's input and output (defaults to
+                one for S3_BUCKET_NAME)
+            role_arn: IAM service role Bedrock assumes to read and write the
+                bucket (defaults to env var BEDROCK_BATCH_ROLE_ARN)
+            poll_interval: Seconds between job status checks
+            timeout: Stop the job and give up after this many seconds
+                (defaults to env var BEDROCK_BATCH_TIMEOUT)
+            
+        Returns:
+            Generated text for each request, in order; None for records
+            the job could not process
+            
+        Raises:
+            BedrockConfigurationError: If no service role or bucket is configured
+            BedrockInvocationError: If the job fails, stops or times out
+        """
+        role_arn = role_arn or BEDROCK_BATCH_ROLE_ARN
+        if not role_arn:
+            raise BedrockConfigurationError(
+                "Batch inference needs a service role via parameter or BEDROCK_BATCH_ROLE_ARN environment variable"
+            )
+        if s3_tools is None:
+            from tools.s3_tools import S3Tools
+            try:
+                s3_tools = S3Tools()
+            except Exception as e:
+                raise BedrockConfigurationError(f"Batch inference needs an S3 bucket: {str(e)}")
+        
+        job_name = f"infographic-batch-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}"
+        input_key = f"bedrock-batch/{job_name}/input.jsonl"
+        output_prefix = f"bedrock-batch/{job_name}/output/"
+        records = b"\n".join(
+            dumps_bytes({"recordId": f"{index:08d}", "modelInput": self._format_request(**request)}, indent=False)
+            for index, request in enumerate(requests)
+        )
+        
+        try:
+            s3_tools.upload_bytes(records, input_key, content_type='application/jsonl')
+            client = _get_bedrock_control_client(
+                self.region, *self._credentials, self.max_retries, self.request_timeout
+            )
+            job_arn = client.create_model_invocation_job(
+                jobName=job_name,
+                roleArn=role_arn,
+                modelId=self.model_id,
+                inputDataConfig={"s3InputDataConfig": {
+                    "s3Uri": f"s3://{s3_tools.bucket_name}/{input_key}"
+                }},
+                outputDataConfig={"s3OutputDataConfig": {
+                    "s3Uri": f"s3://{s3_tools.bucket_name}/{output_prefix}"
+                }}
+            )["jobArn"]
+            logger.info(f"Started Bedrock batch job {job_arn} with {len(requests)} records")
+            
+            deadline = time.monotonic() + timeout
+            while True:
+                job = client.get_model_invocation_job(jobIdentifier=job_arn)
+                status = job["status"]
+                if status in ("Completed", "PartiallyCompleted"):
+                    break
+                if status in ("Failed", "Stopped", "Expired"):
+                    raise BedrockInvocationError(
+                        f"Bedrock batch job {job_name} {status.lower()}: {job.get('message', '')}"
+                    )
+                if time.monotonic() >= deadline:
+                    try:
+                        client.stop_model_invocation_job(jobIdentifier=job_arn)
+                    except (ClientError, BotoCoreError) as e:
+                        logger.warning(f"Could not stop Bedrock batch job {job_name}: {str(e)}")
+                    raise BedrockInvocationError(f"Bedrock batch job {job_name} still {status} after {timeout}s")
+                time.sleep(poll_interval)
+            
+            # Output is written under <output prefix>/<job id>/<input file>.out
+            job_id = job_arn.rsplit("/", 1)[-1]
+            output = s3_tools.download_bytes(f"{output_prefix}{job_id}/input.jsonl.out")
+        except BedrockToolsError:
+            raise
+        except Exception as e:
+            raise BedrockInvocationError(f"Batch inference failed: {str(e)}")
+        
+        results: List[Optional[str]] = [None] * len(requests)
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = loads(line)
+            if "modelOutput" not in record:
+                logger.warning(f"Batch record {record.get('recordId')} failed: {record.get('error')}")
+                continue
+            results[int(record["recordId"])] = self._parse_response(record["modelOutput"])
+        return results
+    
+    def embed_text(self, text: str, model_id: str = BEDROCK_EMBEDDING_MODEL_ID, dimensions: int = 256) -> List[float]:
+        """
+        Embed text with a Titan text embeddings model.
+        
+        Args:
+            text: Text to embed
+            model_id: Embeddings model ID (defaults to env var BEDROCK_EMBEDDING_MODEL_ID)
+            dimensions: Vector size (256, 512 or 1024 for Titan v2)
+            
+        Returns:
+            Normalized embedding vector
+            
+        Raises:
+            BedrockInvocationError: If the embedding request fails
+        """
+        cache_key = AgentCache.make_key("embedding", model_id, text, dimensions)
+        hit, cached = self.response_cache.get(cache_key)
+        if hit:
+            return cached
+        
+        body = dumps_bytes({"inputText": text, "dimensions": dimensions, "normalize": True}, indent=False)
+        try:
+            response = self._retry_operation(
+                self.bedrock_client.invoke_model,
+                modelId=model_id,
+                body=body,
+                contentType='application/json'
+            )
+            embedding = loads(response['body'].read())["embedding"]
+        except Exception as e:
+            raise BedrockInvocationError(f"Embedding failed: {str(e)}")
+        
+        self.response_cache.set(cache_key, embedding)
+        return embedding
+    
     def get_model_info(self) -> Dict[str, Any]:
         """
         Get information about the current model configuration.
@@ -710,14 +1880,70 @@ Return only valid JSON array format."""
         return {
             "model_id": self.model_id,
             "region": self.region,
-            "provider": self.model_config["provider"],
-            "max_tokens": self.model_config["max_tokens"],
-            "supports_system": self.model_config["supports_system"],
-            "input_format": self.model_config["input_format"]
+            "provider": self.model_config.provider,
+            "max_tokens": self.model_config.max_tokens,
+            "supports_system": self.model_config.supports_system,
+            "input_format": self.model_config.input_format,
+            "latency_optimized": self._latency_opt_supported,
+            "response_cache": {
+                "hits": self.response_cache.stats.hits,
+                "misses": self.response_cache.stats.misses
+            }
         }
 
 
 # Convenience functions for common operations
+
+# Result key for each analysis type of the combined analyze_content_multi request
+_COMPREHENSIVE_ANALYSIS_KEYS = {
+    "general": "general_analysis",
+    "key_points": "key_points",
+    "structure": "structure",
+    "summary": "summary",
+}
+
+# (task key, BedrockTools method, second argument) for each independent
+# request in the comprehensive text analysis
+_COMPREHENSIVE_ANALYSIS_TASKS = (
+    ("analysis", "analyze_content_multi", list(_COMPREHENSIVE_ANALYSIS_KEYS)),
+    ("facts", "extract_key_information", "facts"),
+    ("statistics", "extract_key_information", "statistics"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_bedrock_tools(model_id: Optional[str]) -> BedrockTools:
+    """BedrockTools for the module-level helpers, built once per model ID."""
+    return BedrockTools(model_id=model_id)
+
+
+def _collect_comprehensive_analysis(outcomes: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge per-task results/exceptions into the comprehensive analysis dict."""
+    result: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for key, _, _ in _COMPREHENSIVE_ANALYSIS_TASKS:
+        outcome = outcomes.get(key)
+        if isinstance(outcome, BaseException):
+            logger.error(f"Text analysis step '{key}' failed: {str(outcome)}")
+            errors[key] = str(outcome)
+            outcome = None
+        if key == "analysis":
+            for analysis_type, result_key in _COMPREHENSIVE_ANALYSIS_KEYS.items():
+                result[result_key] = outcome.get(analysis_type) if outcome else None
+        else:
+            result[key] = outcome
+    
+    if len(errors) == len(_COMPREHENSIVE_ANALYSIS_TASKS):
+        return {
+            "error": "; ".join(errors.values()),
+            "timestamp": datetime.now().isoformat()
+        }
+    if errors:
+        result["errors"] = errors
+    result["timestamp"] = datetime.now().isoformat()
+    return result
+
+
 def analyze_text_for_infographic(
     text: str,
     model_id: Optional[str] = None
@@ -725,6 +1951,9 @@ def analyze_text_for_infographic(
     """
     Convenience function to analyze text for infographic creation.
     
+    The independent analysis requests run concurrently. A failed step is
+    reported under ``errors`` and set to None without discarding the others.
+    
     Args:
         text: Text content to analyze
         model_id: Optional Bedrock model ID
@@ -732,84 +1961,350 @@ def analyze_text_for_infographic(
     Returns:
         Comprehensive analysis results
     """
-    bedrock_tools = BedrockTools(model_id=model_id)
-    
     try:
-        # Perform comprehensive analysis
-        general_analysis = bedrock_tools.analyze_content(text, "general")
-        key_points = bedrock_tools.analyze_content(text, "key_points")
-        structure = bedrock_tools.analyze_content(text, "structure")
-        summary = bedrock_tools.analyze_content(text, "summary")
-        
-        # Extract additional information
-        facts = bedrock_tools.extract_key_information(text, "facts")
-        statistics = bedrock_tools.extract_key_information(text, "statistics")
-        
+        bedrock_tools = _shared_bedrock_tools(model_id)
+    except Exception as e:
+        logger.error(f"Comprehensive text analysis failed: {str(e)}")
         return {
-            "general_analysis": general_analysis,
-            "key_points": key_points,
-            "structure": structure,
-            "summary": summary,
-            "facts": facts,
-            "statistics": statistics,
+            "error": str(e),
             "timestamp": datetime.now().isoformat()
         }
+    
+    outcomes: Dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=len(_COMPREHENSIVE_ANALYSIS_TASKS)) as executor:
+        futures = {
+            executor.submit(getattr(bedrock_tools, method), text, arg): key
+            for key, method, arg in _COMPREHENSIVE_ANALYSIS_TASKS
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                outcomes[key] = future.result()
+            except Exception as e:
+                outcomes[key] = e
+    
+    return _collect_comprehensive_analysis(outcomes)
+
+
+async def analyze_text_for_infographic_async(
+    text: str,
+    model_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Async variant of analyze_text_for_infographic for use inside an event loop.
+    
+    Args:
+        text: Text content to analyze
+        model_id: Optional Bedrock model ID
         
+    Returns:
+        Comprehensive analysis results
+    """
+    try:
+        bedrock_tools = await asyncio.to_thread(_shared_bedrock_tools, model_id)
     except Exception as e:
         logger.error(f"Comprehensive text analysis failed: {str(e)}")
         return {
             "error": str(e),
             "timestamp": datetime.now().isoformat()
         }
+    
+    results = await asyncio.gather(
+        *(
+            asyncio.to_thread(getattr(bedrock_tools, method), text, arg)
+            for _, method, arg in _COMPREHENSIVE_ANALYSIS_TASKS
+        ),
+        return_exceptions=True
+    )
+    outcomes = {key: value for (key, _, _), value in zip(_COMPREHENSIVE_ANALYSIS_TASKS, results)}
+    return _collect_comprehensive_analysis(outcomes)
+
+
+def _comprehensive_batch_request(
+    bedrock_tools: BedrockTools,
+    method: str,
+    text: str,
+    arg: Any
+) -> Dict[str, Any]:
+    """The request a comprehensive-analysis task would send, for a batch job."""
+    if method == "analyze_content_multi":
+        return {
+            "prompt": bedrock_tools._multi_analysis_prompt(text, arg),
+            "system_prompt": bedrock_tools.ANALYSIS_SYSTEM_PROMPT,
+            "temperature": 0.3,
+            "max_tokens": 2000 * len(arg),
+            "prompt_cache": False
+        }
+    return {
+        "prompt": bedrock_tools.EXTRACTION_PROMPTS[arg].replace("{text}", text),
+        "temperature": 0.1,
+        "max_tokens": 1000,
+        "prompt_cache": False
+    }
+
+
+def _complete_batch_analysis(
+    bedrock_tools: BedrockTools,
+    text: str,
+    analysis_types: List[str],
+    response: str
+) -> Any:
+    """
+    Parse a batched combined analysis, retrying missing types like analyze_content_multi.
+    
+    Returns the analysis dict, or the exception that a per-type retry
+    raised so that the step is reported as failed.
+    """
+    parsed = BedrockTools._parse_multi_analysis(response)
+    missing = [t for t in analysis_types if t not in parsed]
+    if not missing:
+        return parsed
+    logger.warning(f"Batched analysis is missing {missing}; falling back to per-type requests")
+    try:
+        for analysis_type in missing:
+            parsed[analysis_type] = bedrock_tools.analyze_content(text, analysis_type)
+    except Exception as e:
+        return e
+    return parsed
+
+
+def analyze_texts_batch(
+    texts: List[str],
+    model_id: Optional[str] = None,
+    min_batch_size: int = BEDROCK_BATCH_MIN_TEXTS,
+    **batch_options
+) -> List[Dict[str, Any]]:
+    """
+    Analyze many texts for infographic creation.
+    
+    Below ``min_batch_size`` texts each one goes through
+    analyze_text_for_infographic. From there on, all requests for all
+    texts are submitted as one Bedrock batch inference job, which is
+    cheaper but queued; it falls back to per-text requests if batch
+    inference is not configured or the job fails or times out. Analysis
+    types missing from an unparseable batch record are requested
+    individually, as in analyze_content_multi.
+    
+    Args:
+        texts: Text contents to analyze
+        model_id: Optional Bedrock model ID
+        min_batch_size: Number of texts from which a batch job is used
+        **batch_options: Passed to BedrockTools.run_batch_inference
+            (s3_tools, role_arn, poll_interval, timeout)
+        
+    Returns:
+        Comprehensive analysis results, one per text, in order
+    """
+    if len(texts) < min_batch_size:
+        return [analyze_text_for_infographic(text, model_id) for text in texts]
+    
+    try:
+        bedrock_tools = _shared_bedrock_tools(model_id)
+        tasks = [(text, task) for text in texts for task in _COMPREHENSIVE_ANALYSIS_TASKS]
+        responses = bedrock_tools.run_batch_inference(
+            [_comprehensive_batch_request(bedrock_tools, method, text, arg) for text, (_, method, arg) in tasks],
+            **batch_options
+        )
+    except BedrockConfigurationError as e:
+        logger.warning(f"Batch inference unavailable ({str(e)}); analyzing texts one by one")
+        return [analyze_text_for_infographic(text, model_id) for text in texts]
+    except Exception as e:
+        logger.error(f"Batch text analysis failed ({str(e)}); analyzing texts one by one")
+        return [analyze_text_for_infographic(text, model_id) for text in texts]
+    
+    results = []
+    per_text = len(_COMPREHENSIVE_ANALYSIS_TASKS)
+    for start in range(0, len(tasks), per_text):
+        outcomes: Dict[str, Any] = {}
+        for (text, (key, method, arg)), response in zip(tasks[start:start + per_text], responses[start:start + per_text]):
+            if response is None:
+                outcomes[key] = BedrockInvocationError("Batch record was not processed")
+            elif method == "analyze_content_multi":
+                outcomes[key] = _complete_batch_analysis(bedrock_tools, text, arg, response)
+            else:
+                outcomes[key] = BedrockTools._parse_extraction(response)
+        results.append(_collect_comprehensive_analysis(outcomes))
+    return results
+
+
+def _infographic_content_requests(topic: str, style: str) -> List[Tuple[str, Tuple[str, str, str, int]]]:
+    """(field, generate_text_content arguments) for each infographic text element."""
+    limits = BedrockTools.TEXT_ELEMENT_MAX_LENGTHS
+    return [
+        ("headline", (topic, "headline", style, limits["headline"])),
+        ("subtitle", (topic, "subtitle", style, limits["subtitle"])),
+        *(
+            ("bullet_points", (f"{topic} key point {i+1}", "bullet_point", style, limits["bullet_point"]))
+            for i in range(3)
+        ),
+        ("caption", (topic, "caption", style, limits["caption"])),
+    ]
+
+
+def _collect_infographic_content(topic: str, fields: List[str], outcomes: List[Any]) -> Dict[str, Any]:
+    """Assemble generated elements; a failed element gets its fallback text."""
+    fallbacks = {
+        "headline": f"About {topic}",
+        "subtitle": "Key Information and Insights",
+        "caption": f"Learn more about {topic}"
+    }
+    content: Dict[str, Any] = {"bullet_points": []}
+    errors = []
+    for field, outcome in zip(fields, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(f"Content generation failed for {field}: {str(outcome)}")
+            errors.append(str(outcome))
+            outcome = (
+                f"Key Point {len(content['bullet_points']) + 1}" if field == "bullet_points"
+                else fallbacks[field]
+            )
+        if field == "bullet_points":
+            content["bullet_points"].append(outcome)
+        else:
+            content[field] = outcome
+    
+    if errors:
+        content["error"] = "; ".join(errors)
+    return content
+
+
+def _retemplate_content(content: Dict[str, Any], old_topic: str, new_topic: str) -> Dict[str, Any]:
+    """
+    Copy cached infographic text, replacing whole-word mentions of its topic with ``new_topic``.
+    
+    Mentions of the new topic are matched too (longest first) and kept, so
+    a new topic containing the old one ("S3" -> "S3 Glacier") is not
+    substituted into text that already uses it.
+    """
+    alternatives = sorted({old_topic, new_topic}, key=len, reverse=True)
+    pattern = re.compile(
+        r"(?<!\w)(?:" + "|".join(re.escape(topic) for topic in alternatives) + r")(?!\w)",
+        re.IGNORECASE
+    )
+    
+    def replace(match):
+        # A callable replacement keeps backslashes in the topic literal
+        return match.group(0) if match.group(0).lower() == new_topic.lower() else new_topic
+    
+    def retemplate(value):
+        return pattern.sub(replace, value) if isinstance(value, str) else value
+    
+    return {
+        key: [retemplate(item) for item in value] if isinstance(value, list) else retemplate(value)
+        for key, value in content.items()
+    }
+
+
+def _generate_content_bundle(
+    bedrock_tools: BedrockTools,
+    topic: str,
+    style: str,
+    temperature: float,
+    semantic_cache: bool
+) -> Dict[str, Any]:
+    """generate_infographic_bundle, optionally behind the semantic cache."""
+    if not semantic_cache:
+        return bedrock_tools.generate_infographic_bundle(topic, style, temperature)
+    
+    namespace = f"{bedrock_tools.model_id}|{style}"
+    try:
+        vector = bedrock_tools.embed_text(topic)
+    except BedrockInvocationError as e:
+        logger.warning(f"Semantic cache unavailable: {str(e)}")
+        return bedrock_tools.generate_infographic_bundle(topic, style, temperature)
+    
+    hit, cached = _SEMANTIC_CACHE.get(namespace, vector)
+    if hit:
+        logger.debug(f"Semantic cache hit for '{topic}' (cached topic '{cached['topic']}')")
+        return _retemplate_content(cached["content"], cached["topic"], topic)
+    
+    content = bedrock_tools.generate_infographic_bundle(topic, style, temperature)
+    if "error" not in content:
+        _SEMANTIC_CACHE.set(namespace, vector, {"topic": topic, "content": content})
+    return content
 
 
 def generate_infographic_content(
     topic: str,
     style: str = "professional",
-    model_id: Optional[str] = None
+    model_id: Optional[str] = None,
+    temperature: float = 0.7,
+    semantic_cache: Optional[bool] = None
 ) -> Dict[str, str]:
     """
     Convenience function to generate all text content for an infographic.
     
+    All elements are requested together with generate_infographic_bundle.
+    An element that cannot be generated gets fallback text and its error
+    is reported under ``error``. At a temperature at or below
+    BEDROCK_CACHE_MAX_TEMPERATURE, identical calls reuse cached responses.
+    
+    With the semantic cache, a topic whose embedding is close to an
+    earlier one (same model and style) reuses that content, with the
+    earlier topic replaced by the new one, instead of calling the model.
+    
     Args:
         topic: Main topic for the infographic
         style: Writing style
         model_id: Optional Bedrock model ID
+        temperature: Sampling temperature
+        semantic_cache: Use the semantic cache (defaults to env var
+            SEMANTIC_CACHE_ENABLED)
         
     Returns:
         Dictionary containing generated content elements
     """
-    bedrock_tools = BedrockTools(model_id=model_id)
-    
     try:
-        content = {
-            "headline": bedrock_tools.generate_text_content(topic, "headline", style, 60),
-            "subtitle": bedrock_tools.generate_text_content(topic, "subtitle", style, 120),
-            "bullet_points": [
-                bedrock_tools.generate_text_content(f"{topic} key point {i+1}", "bullet_point", style, 80)
-                for i in range(3)
-            ],
-            "caption": bedrock_tools.generate_text_content(topic, "caption", style, 150)
-        }
-        
-        return content
+        if semantic_cache is None:
+            semantic_cache = SEMANTIC_CACHE_ENABLED
+        return _generate_content_bundle(_shared_bedrock_tools(model_id), topic, style, temperature, semantic_cache)
+    except Exception as e:
+        fields = [field for field, _ in _infographic_content_requests(topic, style)]
+        return _collect_infographic_content(topic, fields, [e] * len(fields))
+
+
+async def generate_infographic_content_async(
+    topic: str,
+    style: str = "professional",
+    model_id: Optional[str] = None,
+    temperature: float = 0.7,
+    semantic_cache: Optional[bool] = None
+) -> Dict[str, str]:
+    """
+    Async variant of generate_infographic_content for use inside an event loop.
+    
+    Args:
+        topic: Main topic for the infographic
+        style: Writing style
+        model_id: Optional Bedrock model ID
+        temperature: Sampling temperature
+        semantic_cache: Use the semantic cache (defaults to env var
+            SEMANTIC_CACHE_ENABLED)
         
+    Returns:
+        Dictionary containing generated content elements
+    """
+    try:
+        if semantic_cache is None:
+            semantic_cache = SEMANTIC_CACHE_ENABLED
+        bedrock_tools = await asyncio.to_thread(_shared_bedrock_tools, model_id)
+        return await asyncio.to_thread(
+            _generate_content_bundle, bedrock_tools, topic, style, temperature, semantic_cache
+        )
     except Exception as e:
-        logger.error(f"Content generation failed: {str(e)}")
-        return {
-            "error": str(e),
-            "headline": f"About {topic}",
-            "subtitle": "Key Information and Insights",
-            "bullet_points": ["Key Point 1", "Key Point 2", "Key Point 3"],
-            "caption": f"Learn more about {topic}"
-        }
+        fields = [field for field, _ in _infographic_content_requests(topic, style)]
+        return _collect_infographic_content(topic, fields, [e] * len(fields))
 
 
 def create_bedrock_tools() -> BedrockTools:
     """
-    Factory function to create BedrockTools instance with environment configuration.
+    Factory function returning the shared BedrockTools instance configured from the environment.
+    
+    The instance is created on first use and reused afterwards. It is safe
+    to call its synchronous methods from several threads at once; they
+    share one pooled bedrock-runtime client.
     
     Returns:
         Configured BedrockTools instance
     """
-    return BedrockTools()
\ No newline at end of file
+    return _shared_bedrock_tools(None)
\ No newline at end of file
@@ -9,6 +9,8 @@ This module provides pure tools for external operations only:
 All business logic and reasoning has been moved to AI agent reasoning.
 """
 
+import copy
+import hashlib
 import json
 import logging
 import re
@@ -17,7 +19,9 @@ from datetime import datetime
 
 from .bedrock_tools import BedrockTools, BedrockInvocationError
 from utils.types import AgentResponse
-from utils.constants import VALIDATION_RULES
+from utils.agent_cache import AgentCache
+from utils.constants import AGENT_CACHE_MAX_SIZE, AGENT_CACHE_TTL, VALIDATION_RULES
+from utils.fastjson import loads as json_loads
 from utils.error_handling import (
     ValidationError, ProcessingError,
     log_error_context
@@ -25,6 +29,11 @@ from utils.error_handling import (
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every cleaning/statistics pass, compiled once
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?%?')
+
 
 class ContentToolsError(Exception):
     """Base exception for content tools operations."""
@@ -51,6 +60,8 @@ class ContentTools:
             bedrock_tools: Optional BedrockTools instance
         """
         self.bedrock_tools = bedrock_tools or BedrockTools()
+        # In-memory cache of parsed JSON extractions for byte-identical inputs
+        self._response_cache = AgentCache(ttl=AGENT_CACHE_TTL, max_size=AGENT_CACHE_MAX_SIZE)
         
     def validate_text_input(self, text: str) -> Dict[str, Any]:
         """
@@ -109,7 +120,7 @@ class ContentTools:
         """
         try:
             # Basic whitespace normalization
-            cleaned_text = re.sub(r'\s+', ' ', text.strip())
+            cleaned_text = _WHITESPACE_RE.sub(' ', text.strip())
             
             # Truncate if exceeds maximum length
             if len(cleaned_text) > VALIDATION_RULES["max_input_length"]:
@@ -178,6 +189,12 @@ class ContentTools:
         Raises:
             ContentToolsError: If Bedrock call fails
         """
+        text_digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        cache_key = AgentCache.make_key("extract_json", text_digest, extraction_prompt, system_prompt)
+        hit, cached = self._response_cache.get(cache_key)
+        if hit:
+            return copy.deepcopy(cached)
+        
         try:
             response = self.bedrock_tools.invoke_model(
                 prompt=extraction_prompt.format(text=text) if "{text}" in extraction_prompt else f"{extraction_prompt}\n\nText: {text}",
@@ -195,12 +212,15 @@ class ContentTools:
             }
             
             try:
-                parsed = json.loads(response)
+                parsed = json_loads(response)
                 result["parsed_json"] = parsed
                 result["parse_success"] = True
-            except json.JSONDecodeError as e:
+            except json.JSONDecodeError as e:  # orjson's error subclasses this
                 result["parse_error"] = str(e)
             
+            # Only cache parsed responses; a malformed reply is worth retrying
+            if result["parse_success"]:
+                self._response_cache.set(cache_key, copy.deepcopy(result))
             return result
             
         except Exception as e:
@@ -218,7 +238,7 @@ class ContentTools:
         """
         try:
             # Basic text metrics
-            sentences = re.split(r'[.!?]+', text)
+            sentences = _SENTENCE_END_RE.split(text)
             paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
             words = text.split()
             
@@ -232,7 +252,7 @@ class ContentTools:
             }
             
             # Find numbers and percentages
-            numbers = re.findall(r'\d+(?:\.\d+)?%?', text)
+            numbers = _NUMBER_RE.findall(text)
             
             return {
                 "word_count": len(words),
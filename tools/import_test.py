@@ -1,6 +1,4 @@
 import importlib
-import sys
-sys.path.insert(0, '.')
 
 modules = [
     'tools.content_analysis_tools',
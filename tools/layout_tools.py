@@ -5,10 +5,15 @@ and image assets. They use Bedrock for AI reasoning with demo-mode fallbacks.
 """
 
 import asyncio
-import json
+import copy
+import functools
 import logging
-from typing import Any, Dict, List, Optional
-from utils.constants import DEMO_MODE
+import re
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
+from utils.agent_cache import AgentCache
+from utils.constants import DEMO_MODE, LAYOUT_CACHE_MAX_SIZE, LAYOUT_CACHE_TTLS
+from utils.fastjson import dumps as json_dumps, loads as json_loads
 
 try:
     from strands import tool
@@ -21,36 +26,82 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 
-_BEDROCK: Optional[Any] = None
-
+# In-flight/recent combined layout requests keyed by input fingerprint. The
+# entries are asyncio tasks, so suggest_layout_type and generate_layout_spec
+# called for the same inputs share a single Bedrock round-trip. A pending task
+# is only awaited from the loop that created it.
+_COMBINED_REQUESTS = AgentCache(ttl=60, max_size=64)
+
+# Memoized Bedrock-backed results per layout tool. Local fallbacks are never
+# stored, so a transient Bedrock failure is retried on the next call.
+_LAYOUT_CACHES = {
+    name: AgentCache(ttl=ttl, max_size=LAYOUT_CACHE_MAX_SIZE)
+    for name, ttl in LAYOUT_CACHE_TTLS.items()
+}
+
+# Static instructions come first and the per-request JSON last, so every
+# call shares an identical prompt prefix and only the tail is encoded
+LAYOUT_COMBINED_PROMPT_PREFIX = (
+    "Choose a layout type for an infographic and generate its JSON layout spec. "
+    "Layout type options: vertical_list, grid, timeline, radial. "
+    'Respond with JSON: {"layout_type": <option>, "spec": {...}} where spec includes '
+    "layout_type and sections with type, position (x,y,width,height), and text/image URLs.\n\n"
+    "Input: "
+)
+
+_CODE_FENCE_RE = re.compile(r"^\s*```(?:json)?|```\s*$")
+
+@functools.lru_cache(maxsize=1)
 def _get_bedrock():
-    global _BEDROCK
-    if _BEDROCK is None:
-        from tools.bedrock_tools import BedrockTools
-        _BEDROCK = BedrockTools()
-    return _BEDROCK
+    """Return the process-wide BedrockTools client, built on first use."""
+    from tools.bedrock_tools import BedrockTools
+    return BedrockTools()
+
+def _reset_bedrock_for_tests() -> None:
+    """Forget the cached BedrockTools client so the next call builds a new one."""
+    _get_bedrock.cache_clear()
+
+# Fallback layout geometry, computed once. Each slot is a read-only
+# position/size template; only the text and image URLs vary per call.
+_TITLE_SLOT = MappingProxyType({'x': 0.1, 'y': 0.1, 'width': 0.8, 'height': 0.2})
+_BULLET_SLOTS = {
+    'vertical_list': tuple(
+        MappingProxyType({'x': 0.1, 'y': 0.3 + i*0.1, 'width': 0.6, 'height': 0.08})
+        for i in range(5)
+    ),
+    'grid': tuple(
+        MappingProxyType({'x': 0.1 + (i%2)*0.4, 'y': 0.3 + (i//2)*0.15, 'width': 0.35, 'height': 0.1})
+        for i in range(4)
+    ),
+}
+_IMAGE_SLOTS = tuple(
+    MappingProxyType({'x': 0.7, 'y': 0.3 + i*0.15, 'width': 0.2, 'height': 0.1})
+    for i in range(3)
+)
+
+def _local_layout_type(content_analysis: Dict[str, Any]) -> str:
+    """Heuristic layout type used whenever the model is not asked."""
+    key_points = content_analysis.get('key_points', [])
+    content_type = content_analysis.get('content_type', 'general')
+    return 'vertical_list' if content_type == 'how-to' or len(key_points) > 4 else 'grid'
 
 def _local_generate_layout(content_analysis: Dict[str, Any], image_assets: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Local fallback layout generation for demo mode."""
     key_points = content_analysis.get('key_points', [])
-    content_type = content_analysis.get('content_type', 'general')
-    num_points = len(key_points)
 
     # Simple heuristic layout
-    if content_type == 'how-to' or num_points > 4:
-        layout_type = 'vertical_list'
-        sections = [{'type': 'title', 'x': 0.1, 'y': 0.1, 'width': 0.8, 'height': 0.2}]
-        for i, point in enumerate(key_points[:5]):
-            sections.append({'type': 'bullet', 'text': point, 'x': 0.1, 'y': 0.3 + i*0.1, 'width': 0.6, 'height': 0.08})
-    else:
-        layout_type = 'grid'
-        sections = [{'type': 'title', 'x': 0.1, 'y': 0.1, 'width': 0.8, 'height': 0.2}]
-        for i, point in enumerate(key_points[:4]):
-            sections.append({'type': 'bullet', 'text': point, 'x': 0.1 + (i%2)*0.4, 'y': 0.3 + (i//2)*0.15, 'width': 0.35, 'height': 0.1})
+    layout_type = _local_layout_type(content_analysis)
+    sections = [{'type': 'title', **_TITLE_SLOT}]
+    sections.extend(
+        {'type': 'bullet', 'text': point, **slot}
+        for point, slot in zip(key_points, _BULLET_SLOTS[layout_type])
+    )
 
     # Add image placements
-    for i, asset in enumerate(image_assets[:3]):
-        sections.append({'type': 'image', 'url': asset.get('url', ''), 'x': 0.7, 'y': 0.3 + i*0.15, 'width': 0.2, 'height': 0.1})
+    sections.extend(
+        {'type': 'image', 'url': asset.get('url', ''), **slot}
+        for asset, slot in zip(image_assets, _IMAGE_SLOTS)
+    )
 
     return {
         'layout_type': layout_type,
@@ -61,42 +112,130 @@ def _local_generate_layout(content_analysis: Dict[str, Any], image_assets: List[
         'raw_response': 'local_fallback'
     }
 
+def _split_layout_response(result: Any) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Split a combined layout response into ``(layout_type, spec)``."""
+    if isinstance(result, dict) and 'error' in result:
+        # analyze_content could not parse the model output; models often
+        # wrap otherwise valid JSON in a Markdown code fence
+        raw = result.get('raw_response')
+        if not isinstance(raw, str):
+            return None, None
+        try:
+            result = json_loads(_CODE_FENCE_RE.sub('', raw).strip())
+        except ValueError:
+            return None, None
+        if not isinstance(result, dict):
+            return None, None
+    if isinstance(result, dict):
+        spec = result.get('spec')
+        if isinstance(spec, dict):
+            return result.get('layout_type') or spec.get('layout_type'), spec
+        # The model answered with the spec itself
+        return result.get('layout_type'), result
+    if result:
+        # The model answered with just the layout type
+        return str(result), None
+    return None, None
+
+async def _request_layout_combined(content_analysis: Dict[str, Any], image_assets: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    prompt = LAYOUT_COMBINED_PROMPT_PREFIX + json_dumps(
+        {"content": content_analysis, "images": image_assets}, indent=False
+    )
+    # Building the client verifies model access over the network, so resolve
+    # it on the worker thread too
+    result = await asyncio.to_thread(lambda: _get_bedrock().analyze_content(prompt, "structure"))
+    return _split_layout_response(result)
+
+async def _analyze_layout_combined(content_analysis: Dict[str, Any], image_assets: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Return ``(layout_type, spec)`` from one Bedrock call shared by both layout tools.
+
+    Callers with the same inputs await the same request; a failed request is
+    not reused, so the next caller retries. A finished result is shared
+    across event loops, but a request still pending on another loop is not.
+    """
+    key = AgentCache.make_key(content_analysis, image_assets)
+    loop = asyncio.get_running_loop()
+    hit, task = _COMBINED_REQUESTS.get(key)
+    if hit and task.done() and not task.cancelled() and task.exception() is None:
+        return task.result()
+    if not hit or task.done() or task.get_loop() is not loop:
+        task = loop.create_task(_request_layout_combined(content_analysis, image_assets))
+        _COMBINED_REQUESTS.set(key, task)
+    return await asyncio.shield(task)
+
+def invalidate_all() -> None:
+    """Drop all memoized layout results and shared requests (e.g. after toggling demo mode)."""
+    _COMBINED_REQUESTS.clear()
+    for cache in _LAYOUT_CACHES.values():
+        cache.clear()
+
 @tool
 async def suggest_layout_type(content_analysis: Dict[str, Any], image_assets: List[Dict[str, Any]]) -> str:
     """Suggest the best layout type (e.g., 'vertical_list', 'grid', 'timeline') based on content."""
-    if _should_use_demo_mode():
-        key_points = content_analysis.get('key_points', [])
-        return 'vertical_list' if len(key_points) > 3 else 'grid'
+    if _should_use_demo_mode() or not content_analysis.get('key_points'):
+        # Same type as the local spec generate_layout_spec returns here
+        return _local_layout_type(content_analysis)
+
+    cache = _LAYOUT_CACHES['suggest_layout_type']
+    key = AgentCache.make_key(content_analysis, image_assets)
+    hit, cached = cache.get(key)
+    if hit:
+        return cached
 
-    bedrock = _get_bedrock()
     try:
-        prompt = f"Suggest a layout type for an infographic with content type '{content_analysis.get('content_type', 'general')}' and {len(content_analysis.get('key_points', []))} key points. Options: vertical_list, grid, timeline, radial."
-        result = await asyncio.to_thread(bedrock.analyze_content, prompt, "general")
-        return str(result).lower().strip() if result else 'vertical_list'
+        layout_type, _ = await _analyze_layout_combined(content_analysis, image_assets)
     except Exception as e:
         logger.warning("Bedrock suggest_layout_type failed: %s", e)
         return 'vertical_list'
+    if not layout_type:
+        return 'vertical_list'
+    layout_type = str(layout_type).lower().strip()
+    cache.set(key, layout_type)
+    return layout_type
 
 @tool
 async def generate_layout_spec(content_analysis: Dict[str, Any], image_assets: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Generate a detailed layout specification for the infographic."""
-    if _should_use_demo_mode():
+    if _should_use_demo_mode() or not content_analysis.get('key_points'):
         return _local_generate_layout(content_analysis, image_assets)
 
-    bedrock = _get_bedrock()
+    cache = _LAYOUT_CACHES['generate_layout_spec']
+    key = AgentCache.make_key(content_analysis, image_assets)
+    hit, cached = cache.get(key)
+    if hit:
+        return copy.deepcopy(cached)
+
     try:
-        prompt = f"Generate a JSON layout spec for an infographic. Content: {json.dumps(content_analysis)}. Images: {json.dumps(image_assets)}. Include sections with type, position (x,y,width,height), and text/image URLs."
-        result = await asyncio.to_thread(bedrock.analyze_content, prompt, "structure")
-        if isinstance(result, dict):
-            return result
-        return _local_generate_layout(content_analysis, image_assets)
+        _, spec = await _analyze_layout_combined(content_analysis, image_assets)
     except Exception as e:
         logger.warning("Bedrock generate_layout_spec failed: %s", e)
         return _local_generate_layout(content_analysis, image_assets)
+    if not isinstance(spec, dict):
+        return _local_generate_layout(content_analysis, image_assets)
+    # The spec is shared with other callers of the same request and the cache
+    cache.set(key, copy.deepcopy(spec))
+    return copy.deepcopy(spec)
+
+@tool
+async def generate_layout_specs(items: List[List[Any]], concurrency: int = 10) -> List[Dict[str, Any]]:
+    """Generate layout specifications for several slides at once.
+
+    Each item is a ``[content_analysis, image_assets]`` pair. Up to
+    ``concurrency`` Bedrock requests run at a time; results keep input order.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(content_analysis, image_assets):
+        async with semaphore:
+            return await generate_layout_spec(content_analysis, image_assets)
+
+    return await asyncio.gather(*(_one(ca, ia) for ca, ia in items))
 
 def _should_use_demo_mode():
     return DEMO_MODE
 
+_LAYOUT_TOOLS = (suggest_layout_type, generate_layout_spec, generate_layout_specs)
+
 def get_layout_tools():
-    """Return list of layout tools for agent initialization."""
-    return [suggest_layout_type, generate_layout_spec]
\ No newline at end of file
+    """Return the layout tools for agent initialization (a shared tuple)."""
+    return _LAYOUT_TOOLS
\ No newline at end of file
@@ -0,0 +1,244 @@
+"""
+Result cache for agent processing calls.
+
+Developer loops (demo scripts, test runs) send the same content through the
+agents over and over. This module provides a small TTL + LRU cache keyed on a
+content hash, with optional on-disk persistence so repeated script runs can
+reuse earlier results instead of repeating the LLM round-trip.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import math
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from .constants import (
+    AGENT_CACHE_DIR,
+    AGENT_CACHE_ENABLED,
+    AGENT_CACHE_MAX_SIZE,
+    AGENT_CACHE_TTL,
+    DEMO_MODE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for an AgentCache."""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class AgentCache:
+    """Thread-safe TTL + LRU cache with optional pickle persistence."""
+
+    def __init__(self, ttl: float = 1800, max_size: int = 256, cache_dir: Optional[str] = None):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable sha256 key from arbitrary (JSON-ish) parts."""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return ``(hit, value)`` for ``key``."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._load(key)
+            if entry is not None and now - entry[0] <= self.ttl:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return True, entry[1]
+            self._entries.pop(key, None)
+            self.stats.misses += 1
+            return False, None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry."""
+        entry = (time.time(), value)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            self._store(key, entry)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+    def _load(self, key: str) -> Optional[Tuple[float, Any]]:
+        if self.cache_dir is None:
+            return None
+        path = self.cache_dir / f"{key}.pkl"
+        try:
+            with open(path, "rb") as fh:
+                return pickle.load(fh)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+    def _store(self, key: str, entry: Tuple[float, Any]) -> None:
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{key}.pkl.tmp"
+            with open(tmp_path, "wb") as fh:
+                pickle.dump(entry, fh)
+            os.replace(tmp_path, self.cache_dir / f"{key}.pkl")
+        except Exception as e:
+            # Agent responses may hold unpicklable SDK objects; keep them in memory only
+            logger.debug("Not persisting cache entry %s: %s", key, e)
+
+
+class SemanticCache:
+    """Thread-safe nearest-neighbour cache over embedding vectors.
+
+    ``get`` returns the value stored under the most similar vector in the
+    same namespace if its cosine distance is at most ``threshold``. Entries
+    are evicted least recently used first and, with ``cache_dir``, pickled
+    to a single file so later processes start warm.
+    """
+
+    def __init__(self, threshold: float = 0.15, max_size: int = 256, cache_dir: Optional[str] = None):
+        self.threshold = threshold
+        self.max_size = max_size
+        self.path = Path(cache_dir).expanduser() / "semantic_cache.pkl" if cache_dir else None
+        self.stats = CacheStats()
+        # (namespace, unit vector, value), most recently used last
+        self._entries: List[Tuple[str, Tuple[float, ...], Any]] = self._load()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _unit(vector: Sequence[float]) -> Tuple[float, ...]:
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return tuple(x / norm for x in vector)
+
+    def get(self, namespace: str, vector: Sequence[float]) -> Tuple[bool, Any]:
+        """Return ``(hit, value)`` for the nearest entry within ``threshold``."""
+        query = self._unit(vector)
+        with self._lock:
+            best_index, best_similarity = None, -1.0
+            for index, (entry_namespace, entry_vector, _) in enumerate(self._entries):
+                if entry_namespace != namespace or len(entry_vector) != len(query):
+                    continue
+                similarity = sum(a * b for a, b in zip(query, entry_vector))
+                if similarity > best_similarity:
+                    best_index, best_similarity = index, similarity
+            if best_index is not None and 1.0 - best_similarity <= self.threshold:
+                entry = self._entries.pop(best_index)
+                self._entries.append(entry)
+                self.stats.hits += 1
+                return True, entry[2]
+            self.stats.misses += 1
+            return False, None
+
+    def set(self, namespace: str, vector: Sequence[float], value: Any) -> None:
+        """Store ``value`` under ``vector``, evicting the least recently used entry."""
+        with self._lock:
+            self._entries.append((namespace, self._unit(vector), value))
+            del self._entries[:-self.max_size]
+            self._store()
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+    def _load(self) -> List[Tuple[str, Tuple[float, ...], Any]]:
+        if self.path is None:
+            return []
+        try:
+            with open(self.path, "rb") as fh:
+                return list(pickle.load(fh))[-self.max_size:]
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.debug("Ignoring unreadable semantic cache %s: %s", self.path, e)
+            return []
+
+    def _store(self) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".pkl.tmp")
+            with open(tmp_path, "wb") as fh:
+                pickle.dump(self._entries, fh)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.debug("Not persisting semantic cache %s: %s", self.path, e)
+
+
+_AGENT_CACHE: Optional[AgentCache] = None
+
+
+def get_agent_cache() -> AgentCache:
+    """Return the process-wide AgentCache."""
+    global _AGENT_CACHE
+    if _AGENT_CACHE is None:
+        _AGENT_CACHE = AgentCache(
+            ttl=AGENT_CACHE_TTL,
+            max_size=AGENT_CACHE_MAX_SIZE,
+            cache_dir=AGENT_CACHE_DIR,
+        )
+    return _AGENT_CACHE
+
+
+def apply_result_cache(agent_wrapper: Any, agent_name: str) -> Any:
+    """Memoize successful ``agent_wrapper.process`` results by input hash.
+
+    Enabled by ``AGENT_CACHE_ENABLED`` and always on in demo mode. Failed
+    results are never cached so transient errors are retried next time.
+    """
+    if not (AGENT_CACHE_ENABLED or DEMO_MODE):
+        return agent_wrapper
+
+    process: Callable[..., Any] = agent_wrapper.process
+    cache = get_agent_cache()
+
+    @functools.wraps(process)
+    async def cached_process(*args: Any, **kwargs: Any) -> Any:
+        key = AgentCache.make_key(agent_name, args, kwargs)
+        hit, value = cache.get(key)
+        if hit:
+            logger.debug("%s cache hit (%d hits / %d misses)", agent_name, cache.stats.hits, cache.stats.misses)
+            return value
+
+        result = await process(*args, **kwargs)
+        if isinstance(result, dict) and result.get("success"):
+            cache.set(key, result)
+        return result
+
+    agent_wrapper.process = cached_process
+    return agent_wrapper
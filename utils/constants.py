@@ -35,6 +35,45 @@ REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
 # judges who won't have access to Bedrock credentials.
 DEMO_MODE = os.getenv("DEMO_MODE", os.getenv("AWSINFOGRAPHIC_DEMO_MODE", "0")).lower() in ("1", "true", "yes")
 
+# Agent result cache: memoize successful agent.process() results by content
+# hash. Always on in demo mode. The cache lives in memory only unless
+# AGENT_CACHE_DIR names a directory to persist it in across runs.
+AGENT_CACHE_ENABLED = os.getenv("AGENT_CACHE_ENABLED", "0").lower() in ("1", "true", "yes")
+AGENT_CACHE_TTL = float(os.getenv("AGENT_CACHE_TTL", "1800"))
+AGENT_CACHE_MAX_SIZE = int(os.getenv("AGENT_CACHE_MAX_SIZE", "256"))
+AGENT_CACHE_DIR = os.getenv("AGENT_CACHE_DIR") or None
+
+# Layout tool memoization: Bedrock-backed layout results are reused for
+# identical (content_analysis, image_assets) inputs for these many seconds
+LAYOUT_CACHE_TTLS = {
+    "suggest_layout_type": float(os.getenv("LAYOUT_TYPE_CACHE_TTL", "3600")),
+    "generate_layout_spec": float(os.getenv("LAYOUT_SPEC_CACHE_TTL", "1800")),
+}
+LAYOUT_CACHE_MAX_SIZE = int(os.getenv("LAYOUT_CACHE_MAX_SIZE", "128"))
+
+# Bedrock response cache: low-temperature invocations are near-deterministic,
+# so identical requests at or below this temperature reuse earlier responses
+BEDROCK_CACHE_MAX_TEMPERATURE = float(os.getenv("BEDROCK_CACHE_MAX_TEMPERATURE", "0.3"))
+BEDROCK_CACHE_TTL = float(os.getenv("BEDROCK_CACHE_TTL", "3600"))
+BEDROCK_CACHE_MAX_SIZE = int(os.getenv("BEDROCK_CACHE_MAX_SIZE", "1024"))
+# Persist cached responses across processes under this directory (off when unset)
+BEDROCK_CACHE_DIR = os.getenv("BEDROCK_CACHE_DIR") or None
+
+# Semantic cache for infographic text: a topic whose embedding is within this
+# cosine distance of a cached one reuses that content, re-templated (opt-in)
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "0").lower() in ("1", "true", "yes")
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.15"))
+SEMANTIC_CACHE_MAX_SIZE = int(os.getenv("SEMANTIC_CACHE_MAX_SIZE", "256"))
+BEDROCK_EMBEDDING_MODEL_ID = os.getenv("BEDROCK_EMBEDDING_MODEL_ID", "amazon.titan-embed-text-v2:0")
+
+# Bedrock batch inference: bulk text analysis switches from per-text
+# synchronous requests to a batch job at this many texts
+BEDROCK_BATCH_MIN_TEXTS = int(os.getenv("BEDROCK_BATCH_MIN_TEXTS", "50"))
+BEDROCK_BATCH_ROLE_ARN = os.getenv("BEDROCK_BATCH_ROLE_ARN")
+BEDROCK_BATCH_POLL_INTERVAL = float(os.getenv("BEDROCK_BATCH_POLL_INTERVAL", "60"))
+# Stop a batch job and fall back to per-text requests after this many seconds
+BEDROCK_BATCH_TIMEOUT = float(os.getenv("BEDROCK_BATCH_TIMEOUT", "3600"))
+
 # Image Generation Settings
 DEFAULT_IMAGE_FORMAT = os.getenv("DEFAULT_IMAGE_FORMAT", "PNG")
 DEFAULT_IMAGE_QUALITY = int(os.getenv("DEFAULT_IMAGE_QUALITY", "95"))
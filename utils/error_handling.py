@@ -211,6 +211,32 @@ class CircuitBreaker:
     
     def _call_with_circuit_breaker(self, func: Callable, *args, **kwargs):
         """Execute function with circuit breaker logic."""
+        self._before_call()
+        
+        try:
+            result = func(*args, **kwargs)
+            self._on_success()
+            return result
+            
+        except self.expected_exception as e:
+            self._on_failure()
+            raise
+    
+    async def call_async(self, func: Callable, *args, **kwargs):
+        """Await coroutine function ``func`` with circuit breaker logic."""
+        self._before_call()
+        
+        try:
+            result = await func(*args, **kwargs)
+            self._on_success()
+            return result
+            
+        except self.expected_exception as e:
+            self._on_failure()
+            raise
+    
+    def _before_call(self):
+        """Reject the call while OPEN; move to HALF_OPEN once the timeout has passed."""
         with self._lock:
             if self.state == CircuitBreakerState.OPEN:
                 if self._should_attempt_reset():
@@ -222,15 +248,6 @@ class CircuitBreaker:
                         category=ErrorCategory.RESOURCE,
                         severity=ErrorSeverity.HIGH
                     )
-        
-        try:
-            result = func(*args, **kwargs)
-            self._on_success()
-            return result
-            
-        except self.expected_exception as e:
-            self._on_failure()
-            raise
     
     def _should_attempt_reset(self) -> bool:
         """Check if circuit breaker should attempt to reset."""
@@ -548,15 +565,9 @@ class ErrorHandler:
             func = self.retry_handler(func)
             
             # Apply circuit breaker if specified
-            if circuit_breaker_name and self.config.circuit_breaker_enabled:
-                if circuit_breaker_name not in self.circuit_breakers:
-                    self.circuit_breakers[circuit_breaker_name] = CircuitBreaker(
-                        name=circuit_breaker_name,
-                        failure_threshold=self.config.circuit_breaker_threshold,
-                        recovery_timeout=self.config.circuit_breaker_timeout
-                    )
-                
-                func = self.circuit_breakers[circuit_breaker_name](func)
+            breaker = self.get_circuit_breaker(circuit_breaker_name) if circuit_breaker_name else None
+            if breaker is not None:
+                func = breaker(func)
             
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
@@ -594,6 +605,18 @@ class ErrorHandler:
         
         return decorator
     
+    def get_circuit_breaker(self, name: str) -> Optional[CircuitBreaker]:
+        """Return the named circuit breaker, creating it on first use; None if disabled."""
+        if not self.config.circuit_breaker_enabled:
+            return None
+        if name not in self.circuit_breakers:
+            self.circuit_breakers[name] = CircuitBreaker(
+                name=name,
+                failure_threshold=self.config.circuit_breaker_threshold,
+                recovery_timeout=self.config.circuit_breaker_timeout
+            )
+        return self.circuit_breakers[name]
+    
     def get_circuit_breaker_status(self) -> Dict[str, Any]:
         """Get status of all circuit breakers."""
         return {
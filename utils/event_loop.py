@@ -0,0 +1,25 @@
+"""
+Event loop setup for command-line entry points.
+"""
+
+import asyncio
+import sys
+
+
+def install_uvloop() -> bool:
+    """Switch asyncio to uvloop's event loop when it is available.
+
+    uvloop does not support Windows, and it is an optional dependency, so
+    this silently keeps the default loop in either case.
+
+    Returns:
+        True if the uvloop policy was installed
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -0,0 +1,53 @@
+"""
+JSON helpers for scripts that print large agent payloads.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Objects that are not JSON-native (SDK result objects, datetimes)
+are rendered with ``str`` in both cases.
+"""
+
+import json
+import sys
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def dumps_bytes(obj: Any, indent: bool = True) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if indent else orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(obj, default=str, option=option)
+    return dumps(obj, indent=indent).encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = True) -> str:
+    """Serialize ``obj`` to a JSON string, pretty-printed or compact."""
+    if orjson is not None:
+        return dumps_bytes(obj, indent=indent).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2, default=str, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), default=str, ensure_ascii=False)
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from ``bytes`` or ``str``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def print_json(obj: Any) -> None:
+    """Write ``obj`` as indented JSON to stdout without a str round-trip."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(dumps(obj))
+        return
+    # Flush pending text output first so lines stay in order
+    sys.stdout.flush()
+    buffer.write(dumps_bytes(obj))
+    buffer.write(b"\n")
+    buffer.flush()
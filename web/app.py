@@ -1,11 +1,4 @@
-import sys
 import os
-from pathlib import Path
-
-# Ensure the project root is on sys.path so imports work when running
-# this file from the `web/` directory (e.g., `py app.py`).
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT))
 
 from flask import Flask, render_template, request, jsonify
 import asyncio